@@ -10,6 +10,7 @@ from dishka import AsyncContainer, Provider, make_async_container
 
 from app.di_container.providers import (
     AuthProvider,
+    CacheProvider,
     DomainProvider,
     InfrastructureProvider,
     UseCaseProvider,
@@ -20,12 +21,13 @@ def get_providers() -> Iterable[Provider]:
     """Get all DI providers organized by layer.
 
     Returns:
-        Collection of providers (Auth, Domain, Infrastructure, UseCase)
+        Collection of providers (Auth, Domain, Infrastructure, Cache, UseCase)
     """
     return (
         AuthProvider(),
         DomainProvider(),
         InfrastructureProvider(),
+        CacheProvider(),
         UseCaseProvider(),
     )
 
@@ -1,12 +1,14 @@
 """DI Container providers."""
 
 from app.di_container.providers.auth_provider import AuthProvider
+from app.di_container.providers.cache_provider import CacheProvider
 from app.di_container.providers.domain_provider import DomainProvider
 from app.di_container.providers.infrastructure_provider import InfrastructureProvider
 from app.di_container.providers.use_case_provider import UseCaseProvider
 
 __all__ = [
     "AuthProvider",
+    "CacheProvider",
     "DomainProvider",
     "InfrastructureProvider",
     "UseCaseProvider",
@@ -1,5 +1,8 @@
 """Authentication provider for DI container."""
 
+from collections.abc import AsyncIterator
+
+import httpx
 from dishka import Provider, Scope, provide
 
 from app.di_container.settings import settings
@@ -10,13 +13,18 @@ class AuthProvider(Provider):
     """Provider for authentication services."""
 
     @provide(scope=Scope.APP)
-    def provide_jwt_validator(self) -> JWTValidator:
+    async def provide_jwt_validator(self) -> AsyncIterator[JWTValidator]:
         """Provide JWT validator singleton.
 
         Returns:
             JWTValidator: Configured JWT validator instance
         """
-        return JWTValidator(
+        validator = JWTValidator(
             audience=settings.auth0.audience,
             issuer_base_url=settings.auth0.issuer_base_url,
+            http_client=httpx.AsyncClient(timeout=settings.auth0.jwks_http_timeout),
+            claims_cache_size=settings.auth0.claims_cache_size,
+            claims_cache_max_ttl=settings.auth0.claims_cache_max_ttl,
         )
+        yield validator
+        await validator.aclose()
@@ -0,0 +1,101 @@
+"""Cache and coalescing provider for DI container."""
+
+from collections.abc import AsyncIterator
+
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.di_container.settings import settings
+from app.domain.model.user.user_identity import UserIdentity
+from app.domain.support.meeting_cache.meeting_cache import MeetingCache
+from app.domain.support.meeting_cache.meeting_view_loader import MeetingViewLoader
+from app.domain.support.meeting_status.meeting_event_listener import (
+    MeetingEventListener,
+)
+from app.domain.support.meeting_status.meeting_status_cache import MeetingStatusCache
+from app.infrastructure.cache.meeting_cache_impl import MeetingCacheImpl
+from app.infrastructure.cache.meeting_event_listener_impl import (
+    MeetingEventListenerImpl,
+)
+from app.infrastructure.cache.meeting_status_cache_impl import MeetingStatusCacheImpl
+from app.infrastructure.cache.meeting_view_loader_impl import MeetingViewLoaderImpl
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from app.infrastructure.cache.user_identity_cache import UserIdentityCache
+from app.infrastructure.cache.user_identity_cache_impl import UserIdentityCacheImpl
+from app.infrastructure.semantic_index.semantic_index_impl import CentroidIndexCache
+from app.util.single_flight import SingleFlight
+
+
+class CacheProvider(Provider):
+    """Provider for Redis, process-local caches and request coalescing."""
+
+    @provide(scope=Scope.APP)
+    async def provide_redis(self) -> AsyncIterator[Redis]:
+        """Provide Redis client singleton."""
+        client = Redis.from_url(
+            settings.redis.url, decode_responses=settings.redis.decode_responses
+        )
+        yield client
+        await client.aclose()
+
+    @provide(scope=Scope.APP)
+    def provide_user_identity_cache(self, redis: Redis) -> UserIdentityCache:
+        """Provide process-wide user identity cache."""
+        local_cache: TTLLRUCache[str, UserIdentity] = TTLLRUCache(
+            max_size=settings.user_cache.local_max_size,
+            ttl_seconds=settings.user_cache.local_ttl_seconds,
+        )
+        return UserIdentityCacheImpl(
+            redis=redis,
+            local_cache=local_cache,
+            redis_ttl_seconds=settings.user_cache.redis_ttl_seconds,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_meeting_status_cache(self, redis: Redis) -> MeetingStatusCache:
+        """Provide meeting status snapshot cache."""
+        return MeetingStatusCacheImpl(redis=redis)
+
+    @provide(scope=Scope.APP)
+    def provide_meeting_cache(self, redis: Redis) -> MeetingCache:
+        """Provide finished meeting cache."""
+        return MeetingCacheImpl(
+            redis=redis, ttl_seconds=settings.meeting_cache.ttl_seconds
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_single_flight(self) -> SingleFlight:
+        """Provide process-wide request coalescing."""
+        return SingleFlight()
+
+    @provide(scope=Scope.APP)
+    def provide_meeting_view_loader(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        meeting_cache: MeetingCache,
+        single_flight: SingleFlight,
+    ) -> MeetingViewLoader:
+        """Provide coalescing loader of meetings for display."""
+        return MeetingViewLoaderImpl(
+            session_factory=session_factory,
+            meeting_cache=meeting_cache,
+            single_flight=single_flight,
+        )
+
+    @provide(scope=Scope.APP)
+    async def provide_meeting_event_listener(
+        self, redis: Redis
+    ) -> AsyncIterator[MeetingEventListener]:
+        """Provide process-wide meeting event listener."""
+        listener = MeetingEventListenerImpl(redis=redis)
+        yield listener
+        await listener.close()
+
+    @provide(scope=Scope.APP)
+    def provide_centroid_index_cache(self) -> CentroidIndexCache:
+        """Provide process-wide cache of per-user meeting centroids."""
+        return CentroidIndexCache(
+            max_size=settings.semantic_search.centroid_cache_size,
+            ttl_seconds=settings.semantic_search.centroid_cache_ttl_seconds,
+        )
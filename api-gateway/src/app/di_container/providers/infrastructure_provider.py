@@ -4,7 +4,6 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 import aioboto3
-from celery import Celery
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -14,27 +13,48 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.di_container.settings import settings
+from app.domain.model.meeting.meeting_counter_repository import (
+    MeetingCounterRepository,
+)
 from app.domain.model.meeting.meeting_repository import MeetingRepository
+from app.domain.model.outbox.outbox_repository import OutboxRepository
 from app.domain.model.task.task_repository import TaskRepository
 from app.domain.model.user.user_repository import UserRepository
 from app.domain.support.file_storage.file_storage import FileStorage
 from app.domain.support.logger.logger import Logger
+from app.domain.support.semantic_index.semantic_index import SemanticIndex
+from app.domain.support.task_queue.task_publisher import TaskPublisher
 from app.domain.support.task_queue.task_queue import TaskQueue
+from app.infrastructure.cache.user_identity_cache import UserIdentityCache
 from app.infrastructure.db_client.flusher import Flusher
 from app.infrastructure.db_client.flusher_impl import FlusherImpl
 from app.infrastructure.db_client.transaction_manager import TransactionManager
 from app.infrastructure.db_client.transaction_manager_impl import TransactionManagerImpl
 from app.infrastructure.file_storage.s3_storage_impl import S3StorageImpl
+from app.infrastructure.persistence.repository.cached_user_repository_impl import (
+    CachedUserRepositoryImpl,
+)
+from app.infrastructure.persistence.repository.meeting_counter_repository_impl import (
+    MeetingCounterRepositoryImpl,
+)
 from app.infrastructure.persistence.repository.meeting_repository_impl import (
     MeetingRepositoryImpl,
 )
+from app.infrastructure.persistence.repository.outbox_repository_impl import (
+    OutboxRepositoryImpl,
+)
 from app.infrastructure.persistence.repository.task_repository_impl import (
     TaskRepositoryImpl,
 )
 from app.infrastructure.persistence.repository.user_repository_impl import (
     UserRepositoryImpl,
 )
-from app.infrastructure.task_queue.celery_queue_impl import CeleryQueueImpl
+from app.infrastructure.semantic_index.semantic_index_impl import (
+    CentroidIndexCache,
+    SemanticIndexImpl,
+)
+from app.infrastructure.task_queue.amqp_queue_impl import AmqpQueueImpl
+from app.infrastructure.task_queue.outbox_queue_impl import OutboxQueueImpl
 
 
 class InfrastructureProvider(Provider):
@@ -77,15 +97,51 @@ class InfrastructureProvider(Provider):
         """Provide meeting repository."""
         return MeetingRepositoryImpl(session)
 
+    @provide(scope=Scope.REQUEST)
+    def provide_meeting_counter_repository(
+        self, session: AsyncSession
+    ) -> MeetingCounterRepository:
+        """Provide meeting counter repository."""
+        return MeetingCounterRepositoryImpl(session)
+
     @provide(scope=Scope.REQUEST)
     def provide_task_repository(self, session: AsyncSession) -> TaskRepository:
         """Provide task repository."""
         return TaskRepositoryImpl(session)
 
     @provide(scope=Scope.REQUEST)
-    def provide_user_repository(self, session: AsyncSession) -> UserRepository:
+    def provide_semantic_index(
+        self, session: AsyncSession, centroid_cache: CentroidIndexCache
+    ) -> SemanticIndex:
+        """Provide semantic index over stored transcript embeddings."""
+        return SemanticIndexImpl(
+            session=session,
+            centroid_cache=centroid_cache,
+            n_probe=settings.semantic_search.n_probe,
+            min_score=settings.semantic_search.min_score,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def provide_user_repository(
+        self,
+        session: AsyncSession,
+        user_identity_cache: UserIdentityCache,
+        transaction_manager: TransactionManager,
+    ) -> UserRepository:
         """Provide user repository."""
-        return UserRepositoryImpl(session)
+        repository = UserRepositoryImpl(session)
+        if not settings.user_cache.enabled:
+            return repository
+        return CachedUserRepositoryImpl(
+            repository=repository,
+            cache=user_identity_cache,
+            transaction_manager=transaction_manager,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def provide_outbox_repository(self, session: AsyncSession) -> OutboxRepository:
+        """Provide outbox repository."""
+        return OutboxRepositoryImpl(session)
 
     @provide(scope=Scope.REQUEST)
     def provide_flusher(self, session: AsyncSession) -> Flusher:
@@ -130,18 +186,25 @@ class InfrastructureProvider(Provider):
         )
 
     @provide(scope=Scope.APP)
-    def provide_celery_app(self) -> Celery:
-        """Provide Celery app singleton."""
-        return Celery(
-            "audio_transcription",
-            broker=settings.rabbitmq.broker_url,
-            backend=settings.redis.url,
-        )
-
-    @provide(scope=Scope.APP)
-    def provide_task_queue(self, celery_app: Celery, logger: Logger) -> TaskQueue:
-        """Provide task queue service."""
-        return CeleryQueueImpl(
-            celery_app=celery_app,
+    async def provide_task_publisher(
+        self, logger: Logger
+    ) -> AsyncIterator[TaskPublisher]:
+        """Provide async broker publisher with pooled connections."""
+        publisher = AmqpQueueImpl(
+            broker_url=settings.rabbitmq.broker_url,
             logger=logger,
+            connection_pool_size=settings.rabbitmq.connection_pool_size,
+            channel_pool_size=settings.rabbitmq.channel_pool_size,
+            batch_size=settings.rabbitmq.publish_batch_size,
+            batch_linger_ms=settings.rabbitmq.publish_batch_linger_ms,
+            publish_timeout=settings.rabbitmq.publish_timeout,
         )
+        yield publisher
+        await publisher.close()
+
+    @provide(scope=Scope.REQUEST)
+    def provide_task_queue(
+        self, outbox_repository: OutboxRepository, logger: Logger
+    ) -> TaskQueue:
+        """Provide task queue writing to the transactional outbox."""
+        return OutboxQueueImpl(outbox_repository=outbox_repository, logger=logger)
@@ -2,23 +2,47 @@
 
 from dishka import Provider, Scope, provide
 
+from app.di_container.settings import settings
+from app.domain.model.meeting.meeting_counter_repository import (
+    MeetingCounterRepository,
+)
 from app.domain.model.meeting.meeting_repository import MeetingRepository
+from app.domain.model.outbox.outbox_repository import OutboxRepository
 from app.domain.model.task.task_repository import TaskRepository
 from app.domain.model.user.user_repository import UserRepository
 from app.domain.support.audio_analyzer.audio_analyzer import AudioAnalyzer
 from app.domain.support.file_storage.file_storage import FileStorage
 from app.domain.support.logger.logger import Logger
+from app.domain.support.meeting_cache.meeting_cache import MeetingCache
+from app.domain.support.meeting_cache.meeting_view_loader import MeetingViewLoader
+from app.domain.support.meeting_status.meeting_event_listener import (
+    MeetingEventListener,
+)
+from app.domain.support.meeting_status.meeting_status_cache import MeetingStatusCache
+from app.domain.support.semantic_index.semantic_index import SemanticIndex
+from app.domain.support.task_queue.task_publisher import TaskPublisher
 from app.domain.support.task_queue.task_queue import TaskQueue
 from app.infrastructure.db_client.transaction_manager import TransactionManager
 from app.use_case.create_meeting_use_case import CreateMeetingUseCase
 from app.use_case.create_user_use_case import CreateUserUseCase
 from app.use_case.delete_meeting_use_case import DeleteMeetingUseCase
+from app.use_case.export_transcript_use_case import ExportTranscriptUseCase
 from app.use_case.find_many_task_use_case import FindManyTaskUseCase
 from app.use_case.find_meeting_list_use_case import FindMeetingListUseCase
+from app.use_case.find_meeting_segments_use_case import FindMeetingSegmentsUseCase
 from app.use_case.find_meeting_status_use_case import FindMeetingStatusUseCase
 from app.use_case.find_meeting_use_case import FindMeetingUseCase
+from app.use_case.reconcile_meeting_counters_use_case import (
+    ReconcileMeetingCountersUseCase,
+)
+from app.use_case.relay_outbox_use_case import RelayOutboxUseCase
+from app.use_case.search_meetings_use_case import SearchMeetingsUseCase
+from app.use_case.semantic_search_meetings_use_case import (
+    SemanticSearchMeetingsUseCase,
+)
 from app.use_case.update_meeting_use_case import UpdateMeetingUseCase
 from app.use_case.upload_audio_use_case import UploadAudioUseCase
+from app.use_case.watch_meeting_status_use_case import WatchMeetingStatusUseCase
 
 
 class UseCaseProvider(Provider):
@@ -45,12 +69,72 @@ class UseCaseProvider(Provider):
         self,
         meeting_repository: MeetingRepository,
         user_repository: UserRepository,
+        meeting_cache: MeetingCache,
+        meeting_view_loader: MeetingViewLoader,
         logger: Logger,
     ) -> FindMeetingUseCase:
         """Provide find meeting use case."""
         return FindMeetingUseCase(
             meeting_repository=meeting_repository,
             user_repository=user_repository,
+            meeting_cache=meeting_cache,
+            meeting_view_loader=meeting_view_loader,
+            logger=logger,
+        )
+
+    @provide
+    def provide_export_transcript_use_case(
+        self,
+        meeting_repository: MeetingRepository,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> ExportTranscriptUseCase:
+        """Provide export transcript use case."""
+        return ExportTranscriptUseCase(
+            meeting_repository=meeting_repository,
+            user_repository=user_repository,
+            logger=logger,
+        )
+
+    @provide
+    def provide_find_meeting_segments_use_case(
+        self,
+        meeting_repository: MeetingRepository,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> FindMeetingSegmentsUseCase:
+        """Provide find meeting segments use case."""
+        return FindMeetingSegmentsUseCase(
+            meeting_repository=meeting_repository,
+            user_repository=user_repository,
+            logger=logger,
+        )
+
+    @provide
+    def provide_search_meetings_use_case(
+        self,
+        meeting_repository: MeetingRepository,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> SearchMeetingsUseCase:
+        """Provide search meetings use case."""
+        return SearchMeetingsUseCase(
+            meeting_repository=meeting_repository,
+            user_repository=user_repository,
+            logger=logger,
+        )
+
+    @provide
+    def provide_semantic_search_meetings_use_case(
+        self,
+        semantic_index: SemanticIndex,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> SemanticSearchMeetingsUseCase:
+        """Provide semantic search meetings use case."""
+        return SemanticSearchMeetingsUseCase(
+            semantic_index=semantic_index,
+            user_repository=user_repository,
             logger=logger,
         )
 
@@ -76,12 +160,14 @@ class UseCaseProvider(Provider):
     def provide_update_meeting_use_case(
         self,
         meeting_repository: MeetingRepository,
+        meeting_cache: MeetingCache,
         transaction_manager: TransactionManager,
         logger: Logger,
     ) -> UpdateMeetingUseCase:
         """Provide update meeting use case."""
         return UpdateMeetingUseCase(
             meeting_repository=meeting_repository,
+            meeting_cache=meeting_cache,
             transaction_manager=transaction_manager,
             logger=logger,
         )
@@ -90,12 +176,16 @@ class UseCaseProvider(Provider):
     def provide_delete_meeting_use_case(
         self,
         meeting_repository: MeetingRepository,
+        meeting_cache: MeetingCache,
+        meeting_status_cache: MeetingStatusCache,
         transaction_manager: TransactionManager,
         logger: Logger,
     ) -> DeleteMeetingUseCase:
         """Provide delete meeting use case."""
         return DeleteMeetingUseCase(
             meeting_repository=meeting_repository,
+            meeting_cache=meeting_cache,
+            meeting_status_cache=meeting_status_cache,
             transaction_manager=transaction_manager,
             logger=logger,
         )
@@ -104,11 +194,31 @@ class UseCaseProvider(Provider):
     def provide_find_meeting_status_use_case(
         self,
         meeting_repository: MeetingRepository,
+        meeting_status_cache: MeetingStatusCache,
         logger: Logger,
     ) -> FindMeetingStatusUseCase:
         """Provide find meeting status use case."""
         return FindMeetingStatusUseCase(
             meeting_repository=meeting_repository,
+            meeting_status_cache=meeting_status_cache,
+            logger=logger,
+        )
+
+    @provide
+    def provide_watch_meeting_status_use_case(
+        self,
+        meeting_repository: MeetingRepository,
+        meeting_status_cache: MeetingStatusCache,
+        meeting_event_listener: MeetingEventListener,
+        transaction_manager: TransactionManager,
+        logger: Logger,
+    ) -> WatchMeetingStatusUseCase:
+        """Provide watch meeting status use case."""
+        return WatchMeetingStatusUseCase(
+            meeting_repository=meeting_repository,
+            meeting_status_cache=meeting_status_cache,
+            meeting_event_listener=meeting_event_listener,
+            transaction_manager=transaction_manager,
             logger=logger,
         )
 
@@ -159,3 +269,38 @@ class UseCaseProvider(Provider):
             transaction_manager=transaction_manager,
             logger=logger,
         )
+
+    @provide
+    def provide_relay_outbox_use_case(
+        self,
+        outbox_repository: OutboxRepository,
+        meeting_repository: MeetingRepository,
+        task_publisher: TaskPublisher,
+        transaction_manager: TransactionManager,
+        logger: Logger,
+    ) -> RelayOutboxUseCase:
+        """Provide relay outbox use case."""
+        return RelayOutboxUseCase(
+            outbox_repository=outbox_repository,
+            meeting_repository=meeting_repository,
+            task_publisher=task_publisher,
+            transaction_manager=transaction_manager,
+            logger=logger,
+            max_attempts=settings.outbox.max_attempts,
+            retry_base_seconds=settings.outbox.retry_base_seconds,
+            retry_max_seconds=settings.outbox.retry_max_seconds,
+        )
+
+    @provide
+    def provide_reconcile_meeting_counters_use_case(
+        self,
+        meeting_counter_repository: MeetingCounterRepository,
+        transaction_manager: TransactionManager,
+        logger: Logger,
+    ) -> ReconcileMeetingCountersUseCase:
+        """Provide reconcile meeting counters use case."""
+        return ReconcileMeetingCountersUseCase(
+            meeting_counter_repository=meeting_counter_repository,
+            transaction_manager=transaction_manager,
+            logger=logger,
+        )
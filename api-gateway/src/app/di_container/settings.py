@@ -58,6 +58,36 @@ class RedisSettings(BaseSettings):
         return f"redis://{self.host}:{self.port}/{self.db}"
 
 
+class UserCacheSettings(BaseSettings):
+    """User identity cache settings (USER_CACHE_*)."""
+
+    model_config = SettingsConfigDict(**_base_config("USER_CACHE_"))
+
+    enabled: bool = True
+    local_ttl_seconds: float = Field(default=30.0, ge=0)  # Cross-worker staleness
+    local_max_size: int = Field(default=10_000, ge=1)
+    redis_ttl_seconds: int = Field(default=3600, ge=1)
+
+
+class MeetingCacheSettings(BaseSettings):
+    """Finished meeting cache settings (MEETING_CACHE_*)."""
+
+    model_config = SettingsConfigDict(**_base_config("MEETING_CACHE_"))
+
+    ttl_seconds: int = Field(default=3600, ge=1)
+
+
+class SemanticSearchSettings(BaseSettings):
+    """Semantic search settings (SEMANTIC_SEARCH_*)."""
+
+    model_config = SettingsConfigDict(**_base_config("SEMANTIC_SEARCH_"))
+
+    n_probe: int = Field(default=16, ge=1)  # Meetings whose windows are scored
+    min_score: float = Field(default=0.05, ge=-1, le=1)
+    centroid_cache_size: int = Field(default=128, ge=1)  # Users kept in memory
+    centroid_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+
+
 class RabbitMQSettings(BaseSettings):
     """RabbitMQ message broker settings (RABBITMQ_*)."""
 
@@ -70,6 +100,12 @@ class RabbitMQSettings(BaseSettings):
     user: str = "admin"
     password: str = Field(default="admin123", validation_alias="RABBITMQ_PASS")
 
+    connection_pool_size: int = Field(default=2, ge=1, le=32)
+    channel_pool_size: int = Field(default=10, ge=1, le=256)
+    publish_batch_size: int = Field(default=1, ge=1, le=1000)  # 1 disables batching
+    publish_batch_linger_ms: int = Field(default=5, ge=0, le=1000)
+    publish_timeout: float = Field(default=10.0, gt=0)
+
     @computed_field
     @property
     def broker_url(self) -> str:
@@ -78,6 +114,19 @@ class RabbitMQSettings(BaseSettings):
         return f"amqp://{self.user}:{self.password}@{self.host}:{self.port}//"
 
 
+class OutboxSettings(BaseSettings):
+    """Transactional outbox relay settings (OUTBOX_*)."""
+
+    model_config = SettingsConfigDict(**_base_config("OUTBOX_"))
+
+    relay_enabled: bool = True  # Run the relay inside the API process
+    batch_size: int = Field(default=100, ge=1, le=1000)
+    poll_interval_seconds: float = Field(default=1.0, gt=0)
+    max_attempts: int = Field(default=10, ge=1)
+    retry_base_seconds: float = Field(default=2.0, gt=0)
+    retry_max_seconds: float = Field(default=300.0, gt=0)
+
+
 class S3Settings(BaseSettings):
     """S3-compatible storage settings (S3_*)."""
 
@@ -98,6 +147,10 @@ class Auth0Settings(BaseSettings):
     audience: str = "https://default.auth0.com/api/v2/"
     issuer_base_url: str = "https://default.auth0.com/"
     jwks_cache_ttl: int = Field(default=3600)
+    jwks_min_refresh_interval: float = Field(default=30.0, ge=0)
+    jwks_http_timeout: float = Field(default=5.0, gt=0)
+    claims_cache_size: int = Field(default=10_000, ge=0)  # 0 disables
+    claims_cache_max_ttl: float = Field(default=300.0, gt=0)
 
 
 class ServerSettings(BaseSettings):
@@ -148,7 +201,13 @@ class Settings(BaseSettings):
 
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
+    user_cache: UserCacheSettings = Field(default_factory=UserCacheSettings)
+    meeting_cache: MeetingCacheSettings = Field(default_factory=MeetingCacheSettings)
+    semantic_search: SemanticSearchSettings = Field(
+        default_factory=SemanticSearchSettings
+    )
     rabbitmq: RabbitMQSettings = Field(default_factory=RabbitMQSettings)
+    outbox: OutboxSettings = Field(default_factory=OutboxSettings)
     s3: S3Settings = Field(default_factory=S3Settings)
     auth0: Auth0Settings = Field(default_factory=Auth0Settings)
     server: ServerSettings = Field(default_factory=ServerSettings)
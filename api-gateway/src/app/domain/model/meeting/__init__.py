@@ -1,9 +1,17 @@
 """Meeting domain exports."""
 
 from app.domain.model.meeting.meeting import Meeting
+from app.domain.model.meeting.meeting_counter_repository import (
+    MeetingCounterRepository,
+)
 from app.domain.model.meeting.meeting_repository import MeetingRepository
+from app.domain.model.meeting.meeting_search_hit import MeetingSearchHit
+from app.domain.model.meeting.transcript_segment import TranscriptSegment
 
 __all__ = [
     "Meeting",
+    "MeetingCounterRepository",
     "MeetingRepository",
+    "MeetingSearchHit",
+    "TranscriptSegment",
 ]
@@ -1,7 +1,6 @@
 """Meeting aggregate root."""
 
 from datetime import UTC, datetime
-from typing import Any
 from uuid import UUID, uuid4
 
 from app.domain.model.base import Entity
@@ -23,7 +22,6 @@ class Meeting(Entity):
         status: Status = Status.PROCESSING,
         transcribe_text: str | None = None,
         summarize: str | None = None,
-        transcribe_segments: list[dict[str, Any]] | None = None,
         key_notes: list[str] | None = None,
         transcribe_total: int = 0,
         transcribe_done: int = 0,
@@ -41,7 +39,6 @@ class Meeting(Entity):
         self.status = status
         self.transcribe_text = transcribe_text
         self.summarize = summarize
-        self.transcribe_segments = transcribe_segments
         self.key_notes = key_notes
         self.transcribe_total = transcribe_total
         self.transcribe_done = transcribe_done
@@ -79,7 +76,6 @@ class Meeting(Entity):
             status=status,
             transcribe_text=None,
             summarize=None,
-            transcribe_segments=None,
             key_notes=None,
             created_at=now,
             updated_at=now,
@@ -107,15 +103,8 @@ class Meeting(Entity):
             self.duration = duration
         self.updated_at = datetime.now(UTC)
 
-    def set_transcribe_result(
-        self,
-        transcribe_text: str,
-        transcribe_segments: list[dict[str, Any]] | None = None,
-    ) -> None:
+    def set_transcribe_result(self, transcribe_text: str) -> None:
         self.transcribe_text = transcribe_text
-        self.transcribe_segments = (
-            transcribe_segments if transcribe_segments is not None else []
-        )
         self.status = Status.TRANSCRIBED
         self.updated_at = datetime.now(UTC)
 
@@ -130,5 +119,5 @@ class Meeting(Entity):
         self.updated_at = datetime.now(UTC)
 
     def mark_as_failed(self) -> None:
-        self.status = Status.FAILED
+        self.status = self.status.failure
         self.updated_at = datetime.now(UTC)
@@ -0,0 +1,21 @@
+"""Meeting counter repository interface."""
+
+from typing import Protocol
+from uuid import UUID
+
+from app.util.result import Result
+
+
+class MeetingCounterRepository(Protocol):
+    """Per-user meeting counts by status, maintained alongside meetings."""
+
+    async def reconcile(
+        self, *, after_user_id: UUID | None = None, limit: int = 500
+    ) -> Result[tuple[int, UUID | None], Exception]:
+        """
+        Recompute the meeting counters of the next batch of users.
+
+        Returns the number of corrected counters and the last user ID of the
+        batch, or None once every user has been processed.
+        """
+        ...
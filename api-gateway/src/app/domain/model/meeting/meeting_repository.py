@@ -1,10 +1,14 @@
 """Meeting repository interface."""
 
+from collections.abc import AsyncIterator, Collection
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
 from app.domain.model.meeting.meeting import Meeting
+from app.domain.model.meeting.meeting_search_hit import MeetingSearchHit
+from app.domain.model.meeting.transcript_segment import TranscriptSegment
 from app.util.enums.status import Status
 from app.util.result import Result
 
@@ -25,7 +29,7 @@ class MeetingRepository(Protocol):
     """Repository interface for Meeting aggregate."""
 
     async def find_by_id(self, id: UUID, user_id: UUID) -> Result[Meeting | None, Exception]:
-        """Find meeting by ID."""
+        """Find meeting by ID, including transcript and summary columns."""
         ...
 
     async def find_many(
@@ -35,8 +39,62 @@ class MeetingRepository(Protocol):
         limit: int = 10,
         offset: int = 0,
         status: Status | None = None,
+        include_fields: Collection[str] = (),
+        after: tuple[datetime, UUID] | None = None,
     ) -> Result[list[Meeting], Exception]:
-        """Find multiple meetings with pagination."""
+        """
+        Find multiple meetings, newest first.
+
+        Heavy columns (transcript, summary, segments, key notes) are not loaded
+        unless named in include_fields. When after is given, returns meetings
+        strictly after that (created_at, id) position and ignores offset.
+        """
+        ...
+
+    async def find_updated_at(
+        self, id: UUID, user_id: UUID
+    ) -> Result[datetime | None, Exception]:
+        """Find only updated_at of a meeting, for cheap revalidation."""
+        ...
+
+    def stream_segments(self, id: UUID) -> AsyncIterator[TranscriptSegment]:
+        """
+        Stream transcript segments of a meeting in time order.
+
+        Rows are fetched in batches as the caller iterates, so memory does not
+        grow with the transcript. Database errors are raised while iterating.
+        """
+        ...
+
+    async def find_segments(
+        self,
+        id: UUID,
+        *,
+        start_at: float = 0.0,
+        end_at: float | None = None,
+        limit: int = 500,
+    ) -> Result[list[TranscriptSegment], Exception]:
+        """
+        Find transcript segments overlapping the [start_at, end_at) window.
+
+        Segments are returned in time order; end_at of None means the end of
+        the meeting.
+        """
+        ...
+
+    async def search(
+        self,
+        *,
+        user_id: UUID,
+        query: str,
+        limit: int = 20,
+        segments_per_meeting: int = 3,
+    ) -> Result[list[MeetingSearchHit], Exception]:
+        """
+        Full-text search over a user's titles, summaries and transcripts.
+
+        query uses web search syntax ("quoted phrases", or, -excluded).
+        """
         ...
 
     async def find_status_in_progress_by_id(
@@ -48,7 +106,16 @@ class MeetingRepository(Protocol):
     async def count(
         self, *, user_id: UUID | None = None, status: Status | None = None
     ) -> Result[int, Exception]:
-        """Count meetings."""
+        """Count meetings; per-user counts come from maintained counters."""
+        ...
+
+    async def mark_failed(self, id: UUID) -> Result[Status | None, Exception]:
+        """
+        Fail a meeting that is still in progress at the stage it reached.
+
+        Returns the failure status, or None if the meeting no longer exists or
+        has already finished.
+        """
         ...
 
     async def save(self, meeting: Meeting) -> Result[None, Exception]:
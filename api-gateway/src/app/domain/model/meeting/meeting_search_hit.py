@@ -0,0 +1,24 @@
+"""Meeting search hit value object."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.model.meeting.transcript_segment import TranscriptSegment
+from app.util.enums.status import Status
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MeetingSearchHit:
+    """A meeting matching a full-text query, best matches first."""
+
+    meeting_id: UUID
+    title: str
+    status: Status
+    created_at: datetime
+    rank: float
+    # HTML-escaped summary fragments with matches in <mark>, None when only
+    # the transcript matched
+    snippet: str | None = None
+    # Matching transcript segments; text holds the escaped, highlighted fragment
+    segments: list[TranscriptSegment] = field(default_factory=list)
@@ -0,0 +1,12 @@
+"""Transcript segment value object."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TranscriptSegment:
+    """A timed piece of a meeting transcript."""
+
+    start: float  # Start time in seconds
+    end: float  # End time in seconds
+    text: str
@@ -0,0 +1,6 @@
+"""Outbox domain exports."""
+
+from app.domain.model.outbox.outbox_message import OutboxMessage
+from app.domain.model.outbox.outbox_repository import OutboxRepository
+
+__all__ = ["OutboxMessage", "OutboxRepository"]
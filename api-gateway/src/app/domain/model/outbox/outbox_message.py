@@ -0,0 +1,89 @@
+"""Outbox message entity."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from app.domain.model.base import Entity
+from app.util.enums.outbox_status import OutboxStatus
+
+
+class OutboxMessage(Entity):
+    """
+    Task dispatch recorded in the same transaction as the state it belongs to.
+
+    The relay publishes pending messages to the broker and deletes them once
+    the broker confirms; failed attempts are rescheduled with backoff. A
+    message that starts work on a meeting names it, so the meeting can be
+    failed if the message never gets through.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: UUID,
+        task_name: str,
+        queue: str | None = None,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        meeting_id: UUID | None = None,
+        status: OutboxStatus = OutboxStatus.PENDING,
+        attempts: int = 0,
+        last_error: str | None = None,
+        available_at: datetime | None = None,
+        created_at: datetime | None = None,
+    ) -> None:
+        super().__init__(id=id)
+        self.task_name = task_name
+        self.queue = queue
+        self.args = args or []
+        self.kwargs = kwargs or {}
+        self.meeting_id = meeting_id
+        self.status = status
+        self.attempts = attempts
+        self.last_error = last_error
+        self.created_at = created_at or datetime.now(UTC)
+        self.available_at = available_at or self.created_at
+
+    @staticmethod
+    def create(
+        *,
+        task_name: str,
+        queue: str | None = None,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        meeting_id: UUID | None = None,
+    ) -> "OutboxMessage":
+        """Factory method with validation"""
+        if not task_name:
+            raise ValueError("Outbox task name cannot be empty")
+
+        now = datetime.now(UTC)
+        return OutboxMessage(
+            id=uuid4(),
+            task_name=task_name,
+            queue=queue,
+            args=args,
+            kwargs=kwargs,
+            meeting_id=meeting_id,
+            created_at=now,
+            available_at=now,
+        )
+
+    def schedule_retry(self, *, error: str, delay: timedelta) -> None:
+        """Record a failed publish and make the message available again later."""
+        self.attempts += 1
+        self.last_error = error
+        self.available_at = datetime.now(UTC) + delay
+
+    def mark_dead(self, *, error: str) -> None:
+        """Stop retrying; the message is kept for inspection."""
+        self.attempts += 1
+        self.last_error = error
+        self.status = OutboxStatus.DEAD
+
+    def __repr__(self) -> str:
+        return (
+            f"OutboxMessage(id={self.id}, task_name={self.task_name!r}, "
+            f"status={self.status}, attempts={self.attempts})"
+        )
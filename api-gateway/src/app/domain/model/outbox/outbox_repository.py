@@ -0,0 +1,31 @@
+"""Outbox repository interface."""
+
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.model.outbox.outbox_message import OutboxMessage
+from app.util.result import Result
+
+
+class OutboxRepository(Protocol):
+    """Repository interface for outbox messages."""
+
+    async def claim_pending(
+        self, *, limit: int
+    ) -> Result[list[OutboxMessage], Exception]:
+        """
+        Lock and return due pending messages.
+
+        Rows locked by another relay are skipped, so several relays can drain
+        the outbox concurrently.
+        """
+        ...
+
+    async def save(self, message: OutboxMessage) -> Result[None, Exception]:
+        """Save outbox message (insert or update)."""
+        ...
+
+    async def delete_many(self, ids: Sequence[UUID]) -> Result[None, Exception]:
+        """Delete published outbox messages."""
+        ...
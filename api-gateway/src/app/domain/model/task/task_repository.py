@@ -1,5 +1,6 @@
 """Task repository interface."""
 
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -18,8 +19,14 @@ class TaskRepository(Protocol):
         limit: int = 10,
         offset: int = 0,
         status: TaskStatus | None = None,
+        after: tuple[datetime, UUID] | None = None,
     ) -> Result[list[Task], Exception]:
-        """Find tasks by meeting ID."""
+        """
+        Find tasks by meeting ID, newest first.
+
+        When after is given, returns tasks strictly after that (created_at, id)
+        position and ignores offset.
+        """
         ...
 
     async def count_by_meeting_id(
@@ -1,6 +1,7 @@
 """User domain model."""
 
 from app.domain.model.user.user import User
+from app.domain.model.user.user_identity import UserIdentity
 from app.domain.model.user.user_repository import UserRepository
 
-__all__ = ["User", "UserRepository"]
+__all__ = ["User", "UserIdentity", "UserRepository"]
@@ -0,0 +1,30 @@
+"""User identity value object."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.model.user.user import User
+from app.util.enums.user_type import UserType
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserIdentity:
+    """Identity fields of a user that are safe to cache.
+
+    Quota usage is deliberately left out; read the full User when it matters.
+    """
+
+    id: UUID
+    auth0_user_id: str
+    email: str | None
+    user_type: UserType
+
+    @staticmethod
+    def from_user(user: User) -> "UserIdentity":
+        """Build identity from a user entity."""
+        return UserIdentity(
+            id=user.id,
+            auth0_user_id=user.auth0_user_id,
+            email=user.email,
+            user_type=user.user_type,
+        )
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 
 from app.domain.model.user.user import User
+from app.domain.model.user.user_identity import UserIdentity
 from app.util.result import Result
 
 
@@ -16,6 +17,13 @@ class UserRepository(ABC):
         """Find user by Auth0 user ID."""
         pass
 
+    @abstractmethod
+    async def find_identity_by_auth0_id(
+        self, auth0_user_id: str
+    ) -> Result[UserIdentity | None, Exception]:
+        """Find user identity by Auth0 user ID (may be served from cache)."""
+        pass
+
     @abstractmethod
     async def save(self, user: User) -> Result[User, Exception]:
         """Save or update user."""
@@ -0,0 +1,6 @@
+"""Meeting cache exports."""
+
+from app.domain.support.meeting_cache.meeting_cache import MeetingCache
+from app.domain.support.meeting_cache.meeting_view_loader import MeetingViewLoader
+
+__all__ = ["MeetingCache", "MeetingViewLoader"]
@@ -0,0 +1,22 @@
+"""Meeting cache interface."""
+
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.model.meeting.meeting import Meeting
+
+
+class MeetingCache(Protocol):
+    """Cache of fully loaded meetings that are no longer changing."""
+
+    async def get(self, meeting_id: UUID, user_id: UUID) -> Meeting | None:
+        """Return the cached meeting if it exists and belongs to user_id."""
+        ...
+
+    async def set(self, meeting: Meeting) -> None:
+        """Cache a fully loaded meeting, unless it was recently invalidated."""
+        ...
+
+    async def invalidate(self, meeting_id: UUID) -> None:
+        """Drop a cached meeting; loads that read it before are not cached."""
+        ...
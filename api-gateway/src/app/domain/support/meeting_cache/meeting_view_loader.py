@@ -0,0 +1,22 @@
+"""Meeting view loader interface."""
+
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.model.meeting.meeting import Meeting
+from app.util.result import Result
+
+
+class MeetingViewLoader(Protocol):
+    """Loads fully populated meetings for display."""
+
+    async def load(
+        self, meeting_id: UUID, user_id: UUID
+    ) -> Result[Meeting | None, Exception]:
+        """
+        Load a meeting owned by user_id.
+
+        Concurrent loads of the same meeting share one database read, and
+        meetings that are no longer changing are written to the meeting cache.
+        """
+        ...
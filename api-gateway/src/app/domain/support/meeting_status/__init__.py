@@ -0,0 +1,9 @@
+"""Meeting status exports."""
+
+from app.domain.support.meeting_status.meeting_event_listener import (
+    MeetingEventListener,
+    MeetingEventSubscription,
+)
+from app.domain.support.meeting_status.meeting_status_cache import MeetingStatusCache
+
+__all__ = ["MeetingEventListener", "MeetingEventSubscription", "MeetingStatusCache"]
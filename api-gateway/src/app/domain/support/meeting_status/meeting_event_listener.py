@@ -0,0 +1,26 @@
+"""Meeting event listener interface."""
+
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.model.meeting.meeting_repository import MeetingStatusInProgress
+
+
+class MeetingEventSubscription(Protocol):
+    """Live status events for one meeting."""
+
+    async def next(self) -> MeetingStatusInProgress:
+        """Wait for the next event (bound the wait with asyncio.timeout)."""
+        ...
+
+    async def close(self) -> None:
+        """Stop receiving events."""
+        ...
+
+
+class MeetingEventListener(Protocol):
+    """Source of status events published by the pipeline workers."""
+
+    async def subscribe(self, meeting_id: UUID) -> MeetingEventSubscription:
+        """Start receiving events for a meeting."""
+        ...
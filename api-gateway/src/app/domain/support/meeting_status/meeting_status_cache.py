@@ -0,0 +1,18 @@
+"""Meeting status cache interface."""
+
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.model.meeting.meeting_repository import MeetingStatusInProgress
+
+
+class MeetingStatusCache(Protocol):
+    """Status snapshots written by the pipeline workers."""
+
+    async def get(self, meeting_id: UUID) -> MeetingStatusInProgress | None:
+        """Return the latest snapshot, or None if there is none."""
+        ...
+
+    async def invalidate(self, meeting_id: UUID) -> None:
+        """Drop the snapshot."""
+        ...
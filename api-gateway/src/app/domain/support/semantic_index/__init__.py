@@ -0,0 +1,5 @@
+"""Semantic index exports."""
+
+from app.domain.support.semantic_index.semantic_index import SemanticHit, SemanticIndex
+
+__all__ = ["SemanticHit", "SemanticIndex"]
@@ -0,0 +1,28 @@
+"""Semantic index interface."""
+
+from dataclasses import dataclass
+from typing import Protocol
+from uuid import UUID
+
+from app.util.result import Result
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SemanticHit:
+    """A transcript window similar to a query."""
+
+    meeting_id: UUID
+    start: float
+    end: float
+    text: str
+    score: float  # Cosine similarity in [-1, 1]
+
+
+class SemanticIndex(Protocol):
+    """Nearest-neighbour search over the transcript windows of a user."""
+
+    async def search(
+        self, *, user_id: UUID, query: str, limit: int = 10
+    ) -> Result[list[SemanticHit], Exception]:
+        """Return the windows most similar to query, best first."""
+        ...
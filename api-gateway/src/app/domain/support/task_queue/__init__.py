@@ -1,5 +1,6 @@
 """Task queue exports."""
 
+from app.domain.support.task_queue.task_publisher import TaskPublisher
 from app.domain.support.task_queue.task_queue import TaskQueue
 
-__all__ = ["TaskQueue"]
+__all__ = ["TaskPublisher", "TaskQueue"]
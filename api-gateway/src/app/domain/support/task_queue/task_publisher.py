@@ -0,0 +1,22 @@
+"""Task publisher interface."""
+
+from typing import Any, Protocol
+
+from app.util.result import Result
+
+
+class TaskPublisher(Protocol):
+    async def publish(
+        self,
+        *,
+        task_id: str,
+        task_name: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        queue: str | None = None,
+    ) -> Result[str, Exception]:
+        """
+        Publish task to the broker under a caller-chosen task ID.
+
+        """
+        ...
@@ -7,7 +7,7 @@ from app.util.result import Result
 
 
 class TaskQueue(Protocol):
-    def send_transcribe_task(
+    async def send_transcribe_task(
         self, meeting_id: UUID, audio_url: str
     ) -> Result[str, Exception]:
         """
@@ -16,7 +16,7 @@ class TaskQueue(Protocol):
         """
         ...
 
-    def send_task(
+    async def send_task(
         self,
         *,
         task_name: str,
@@ -1,5 +1,6 @@
 """FastAPI application."""
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -8,7 +9,9 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 
+from app.di_container.settings import settings
 from app.handler.api.routes import create_root_router
+from app.handler.relay import run_outbox_relay
 from app.infrastructure.persistence.sqlalchemy.mappings import map_all
 from app.util.auth_exceptions import (
     InvalidTokenError,
@@ -100,6 +103,18 @@ def create_web_app() -> FastAPI:
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan."""
     map_all()
+
+    relay_stop = asyncio.Event()
+    relay_task: asyncio.Task[None] | None = None
+    if settings.outbox.relay_enabled and hasattr(app.state, "dishka_container"):
+        relay_task = asyncio.create_task(
+            run_outbox_relay(app.state.dishka_container, relay_stop)
+        )
+
     yield
+
+    if relay_task is not None:
+        relay_stop.set()
+        await relay_task
     if hasattr(app.state, "dishka_container"):
         await app.state.dishka_container.close()
@@ -5,16 +5,31 @@ from fastapi import APIRouter, Depends
 from app.handler.api.middleware.auth_middleware import verify_jwt_token
 from app.handler.api.routes.meeting.create_meeting_route import create_meeting_route
 from app.handler.api.routes.meeting.delete_meeting_route import delete_meeting_route
+from app.handler.api.routes.meeting.export_transcript_route import (
+    export_transcript_route,
+)
 from app.handler.api.routes.meeting.find_many_task_route import find_many_task_route
 from app.handler.api.routes.meeting.find_meeting_list_route import (
     find_meeting_list_route,
 )
 from app.handler.api.routes.meeting.find_meeting_route import find_meeting_route
+from app.handler.api.routes.meeting.find_meeting_segments_route import (
+    find_meeting_segments_route,
+)
 from app.handler.api.routes.meeting.find_meeting_status_route import (
     find_meeting_status_route,
 )
+from app.handler.api.routes.meeting.search_meetings_route import (
+    search_meetings_route,
+)
+from app.handler.api.routes.meeting.semantic_search_meetings_route import (
+    semantic_search_meetings_route,
+)
 from app.handler.api.routes.meeting.update_meeting_route import update_meeting_route
 from app.handler.api.routes.meeting.upload_audio_route import upload_audio_route
+from app.handler.api.routes.meeting.watch_meeting_status_route import (
+    watch_meeting_status_route,
+)
 
 
 def create_meeting_router() -> APIRouter:
@@ -29,11 +44,17 @@ def create_meeting_router() -> APIRouter:
 
     # Include all meeting routes
     router.include_router(create_meeting_route())
+    # Static paths must be registered before /{meeting_id}
+    router.include_router(search_meetings_route())
+    router.include_router(semantic_search_meetings_route())
     router.include_router(find_meeting_route())
     router.include_router(find_meeting_list_route())
     router.include_router(update_meeting_route())
     router.include_router(delete_meeting_route())
     router.include_router(find_meeting_status_route())
+    router.include_router(watch_meeting_status_route())
+    router.include_router(export_transcript_route())
+    router.include_router(find_meeting_segments_route())
     router.include_router(find_many_task_route())
     router.include_router(upload_audio_route())
 
@@ -0,0 +1,125 @@
+"""Export meeting transcript endpoint."""
+
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.domain.support.logger.logger import Logger
+from app.handler.api.middleware.auth_middleware import get_jwt_payload
+from app.use_case.export_transcript_use_case import (
+    ExportTranscriptUseCase,
+    ExportTranscriptUseCaseInput,
+)
+from app.util.content_encoding import accepts_gzip, gzip_stream
+from app.util.enums.transcript_format import TranscriptFormat
+from app.util.exceptions import (
+    UNEXPECTED_ERROR_MESSAGE,
+    DatabaseError,
+    ExhaustiveError,
+    MeetingNotFoundException,
+    UnexpectedError,
+)
+from app.util.response_models import ErrorResponse
+
+
+def export_transcript_route() -> APIRouter:
+    """Export transcript route"""
+    router = APIRouter()
+
+    @router.get(
+        "/{meeting_id}/transcript",
+        status_code=status.HTTP_200_OK,
+        response_model=None,
+        responses={
+            200: {
+                "description": "Transcript file, streamed as it is rendered",
+                "content": {
+                    transcript_format.media_type: {}
+                    for transcript_format in TranscriptFormat
+                },
+            },
+            404: {
+                "description": "Meeting not found",
+                "model": ErrorResponse,
+            },
+            500: {
+                "description": "Internal server error",
+                "model": ErrorResponse,
+            },
+        },
+    )
+    @inject
+    async def export_transcript(
+        meeting_id: UUID,
+        response: Response,
+        use_case: FromDishka[ExportTranscriptUseCase],
+        logger: FromDishka[Logger],
+        format: TranscriptFormat = Query(default=TranscriptFormat.TXT),
+        accept_encoding: Annotated[str | None, Header()] = None,
+        jwt_payload: dict = Depends(get_jwt_payload),
+    ) -> StreamingResponse | ErrorResponse:
+        """Export meeting transcript as SRT, WebVTT, plain text or JSON."""
+        try:
+            auth0_user_id = jwt_payload.get("sub")
+            if not auth0_user_id:
+                response.status_code = status.HTTP_401_UNAUTHORIZED
+                return ErrorResponse(
+                    name="UnauthorizedError", message="Invalid token: missing user ID"
+                )
+            input_data = ExportTranscriptUseCaseInput(
+                meeting_id=meeting_id,
+                auth0_user_id=auth0_user_id,
+                format=format,
+            )
+            use_case_result = await use_case.execute(input_data)
+
+            if not use_case_result.success:
+                error = use_case_result.error
+
+                if isinstance(error, MeetingNotFoundException):
+                    logger.error(error.message)
+                    response.status_code = status.HTTP_404_NOT_FOUND
+                    return ErrorResponse(
+                        name=error.name,
+                        message=error.message,
+                    )
+
+                if isinstance(error, (UnexpectedError, DatabaseError)):
+                    logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
+                    response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                    return ErrorResponse(
+                        name=error.name,
+                        message=UNEXPECTED_ERROR_MESSAGE,
+                    )
+
+                raise ExhaustiveError(error)
+
+            output = use_case_result.data
+            content = output.content
+            headers = {
+                "Content-Disposition": f'attachment; filename="{output.filename}"',
+                "Vary": "Accept-Encoding",
+            }
+            if accepts_gzip(accept_encoding):
+                content = gzip_stream(content)
+                headers["Content-Encoding"] = "gzip"
+
+            return StreamingResponse(
+                content,
+                media_type=f"{output.media_type}; charset=utf-8",
+                headers=headers,
+            )
+
+        except Exception as error:
+            logger.error(f"Unexpected error: {error}")
+            response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            return ErrorResponse(
+                name=UnexpectedError().name,
+                message=UNEXPECTED_ERROR_MESSAGE,
+            )
+
+    return router
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Header, Response, status
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.support.logger.logger import Logger
@@ -16,14 +16,19 @@ from app.use_case.find_many_task_use_case import (
     TaskItem,
 )
 from app.util.enums.task_status import TaskStatus
+from app.util.etag import etag_matches
 from app.util.exceptions import (
     UNEXPECTED_ERROR_MESSAGE,
+    BadRequestError,
     DatabaseError,
     ExhaustiveError,
     UnexpectedError,
 )
 from app.util.response_models import ErrorResponse, PaginatedResponse, PaginationMeta
 
+# Let clients keep a copy but revalidate it with If-None-Match every time
+CACHE_CONTROL = "private, no-cache"
+
 
 class FindManyTaskRequest(BaseModel):
     """Query parameters for listing tasks"""
@@ -33,6 +38,13 @@ class FindManyTaskRequest(BaseModel):
     page: Annotated[int, Field(ge=1)] = 1
     page_size: Annotated[int, Field(ge=1, le=100)] = 10
     status: TaskStatus | None = None
+    cursor: Annotated[
+        str | None,
+        Field(description="next_cursor from the previous page; overrides page"),
+    ] = None
+    include_total: Annotated[
+        bool, Field(description="Compute total_items and total_pages")
+    ] = True
 
 
 def find_many_task_route() -> APIRouter:
@@ -42,11 +54,19 @@ def find_many_task_route() -> APIRouter:
     @router.get(
         "/{meeting_id}/tasks",
         status_code=status.HTTP_200_OK,
+        response_model=None,
         responses={
             200: {
                 "description": "Task list retrieved successfully",
                 "model": PaginatedResponse[TaskItem],
             },
+            304: {
+                "description": "Page unchanged since the If-None-Match ETag",
+            },
+            400: {
+                "description": "Invalid query parameters",
+                "model": ErrorResponse,
+            },
             500: {
                 "description": "Internal server error",
                 "model": ErrorResponse,
@@ -60,7 +80,8 @@ def find_many_task_route() -> APIRouter:
         response: Response,
         use_case: FromDishka[FindManyTaskUseCase],
         logger: FromDishka[Logger],
-    ) -> PaginatedResponse[TaskItem] | ErrorResponse:
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> PaginatedResponse[TaskItem] | ErrorResponse | Response:
         """Get paginated list of tasks for a meeting."""
         try:
             offset = (request.page - 1) * request.page_size
@@ -71,6 +92,8 @@ def find_many_task_route() -> APIRouter:
                 limit=limit,
                 offset=offset,
                 status=request.status,
+                cursor=request.cursor,
+                include_total=request.include_total,
             )
 
             use_case_result = await use_case.execute(input_data)
@@ -78,6 +101,10 @@ def find_many_task_route() -> APIRouter:
             if not use_case_result.success:
                 error = use_case_result.error
 
+                if isinstance(error, BadRequestError):
+                    response.status_code = status.HTTP_400_BAD_REQUEST
+                    return ErrorResponse(name=error.name, message=error.message)
+
                 if isinstance(error, (UnexpectedError, DatabaseError)):
                     logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
                     response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -89,7 +116,18 @@ def find_many_task_route() -> APIRouter:
                 raise ExhaustiveError(error)
 
             data = use_case_result.data
-            total_pages = math.ceil(data.total / request.page_size)
+            headers = {"ETag": data.etag, "Cache-Control": CACHE_CONTROL}
+            if etag_matches(if_none_match, data.etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+            response.headers.update(headers)
+
+            total_pages = (
+                math.ceil(data.total / request.page_size)
+                if data.total is not None
+                else None
+            )
 
             return PaginatedResponse(
                 data=data.items,
@@ -98,6 +136,7 @@ def find_many_task_route() -> APIRouter:
                     page_size=request.page_size,
                     total_items=data.total,
                     total_pages=total_pages,
+                    next_cursor=data.next_cursor,
                 ),
             )
 
@@ -5,25 +5,33 @@ from typing import Annotated
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Header, Response, status
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.handler.api.middleware.auth_middleware import get_jwt_payload
 from app.domain.support.logger.logger import Logger
+from app.handler.api.middleware.auth_middleware import get_jwt_payload
 from app.use_case.find_meeting_list_use_case import (
+    MEETING_LIST_OPTIONAL_FIELDS,
     FindMeetingListUseCase,
+    FindMeetingListUseCaseException,
     FindMeetingListUseCaseInput,
+    FindMeetingListUseCaseOutput,
     MeetingListItem,
 )
 from app.util.enums.status import Status
+from app.util.etag import etag_matches
 from app.util.exceptions import (
     UNEXPECTED_ERROR_MESSAGE,
+    BadRequestError,
     DatabaseError,
     ExhaustiveError,
     UnexpectedError,
 )
 from app.util.response_models import ErrorResponse, PaginatedResponse, PaginationMeta
 
+# Let clients keep a copy but revalidate it with If-None-Match every time
+CACHE_CONTROL = "private, no-cache"
+
 
 class FindMeetingListRequest(BaseModel):
     """Query parameters for listing meetings"""
@@ -33,6 +41,83 @@ class FindMeetingListRequest(BaseModel):
     page: Annotated[int, Field(ge=1)] = 1
     page_size: Annotated[int, Field(ge=1, le=100)] = 10
     status: Status | None = None
+    fields: Annotated[
+        str | None,
+        Field(
+            description=(
+                "Comma-separated heavy columns to include: "
+                "transcribe_text, summarize, key_notes"
+            )
+        ),
+    ] = None
+    cursor: Annotated[
+        str | None,
+        Field(description="next_cursor from the previous page; overrides page"),
+    ] = None
+    include_total: Annotated[
+        bool, Field(description="Compute total_items and total_pages")
+    ] = True
+
+
+def _parse_fields(fields: str | None) -> frozenset[str]:
+    """Parse the comma-separated fields parameter."""
+    if not fields:
+        return frozenset()
+
+    requested = frozenset(f.strip() for f in fields.split(",") if f.strip())
+    unknown = requested - MEETING_LIST_OPTIONAL_FIELDS
+    if unknown:
+        raise BadRequestError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
+
+
+def _failure_response(
+    error: FindMeetingListUseCaseException, response: Response, logger: Logger
+) -> ErrorResponse:
+    """Map a use case failure to an error response."""
+    if isinstance(error, BadRequestError):
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return ErrorResponse(name=error.name, message=error.message)
+
+    if isinstance(error, (UnexpectedError, DatabaseError)):
+        logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
+        response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        return ErrorResponse(
+            name=error.name,
+            message=UNEXPECTED_ERROR_MESSAGE,
+        )
+
+    raise ExhaustiveError(error)
+
+
+def _page_response(
+    request: FindMeetingListRequest,
+    data: FindMeetingListUseCaseOutput,
+    response: Response,
+    if_none_match: str | None,
+) -> PaginatedResponse[MeetingListItem] | Response:
+    """Build the page, or a 304 when the client's copy is still current."""
+    headers = {"ETag": data["etag"], "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, data["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+    total_pages = (
+        math.ceil(data["total"] / request.page_size)
+        if data["total"] is not None
+        else None
+    )
+
+    return PaginatedResponse(
+        data=data["items"],
+        meta=PaginationMeta(
+            page=request.page,
+            page_size=request.page_size,
+            total_items=data["total"],
+            total_pages=total_pages,
+            next_cursor=data["next_cursor"],
+        ),
+    )
 
 
 def find_meeting_list_route() -> APIRouter:
@@ -42,11 +127,19 @@ def find_meeting_list_route() -> APIRouter:
     @router.get(
         "/",
         status_code=status.HTTP_200_OK,
+        response_model=None,
         responses={
             200: {
                 "description": "Meeting list retrieved successfully",
                 "model": PaginatedResponse[MeetingListItem],
             },
+            304: {
+                "description": "Page unchanged since the If-None-Match ETag",
+            },
+            400: {
+                "description": "Invalid query parameters",
+                "model": ErrorResponse,
+            },
             500: {
                 "description": "Internal server error",
                 "model": ErrorResponse,
@@ -59,8 +152,9 @@ def find_meeting_list_route() -> APIRouter:
         response: Response,
         use_case: FromDishka[FindMeetingListUseCase],
         logger: FromDishka[Logger],
+        if_none_match: Annotated[str | None, Header()] = None,
         jwt_payload: dict = Depends(get_jwt_payload),
-    ) -> PaginatedResponse[MeetingListItem] | ErrorResponse:
+    ) -> PaginatedResponse[MeetingListItem] | ErrorResponse | Response:
         """Get paginated list of meetings."""
         try:
             auth0_user_id = jwt_payload.get("sub")
@@ -70,6 +164,12 @@ def find_meeting_list_route() -> APIRouter:
                     name="UnauthorizedError", message="Invalid token: missing user ID"
                 )
 
+            try:
+                fields = _parse_fields(request.fields)
+            except BadRequestError as error:
+                response.status_code = status.HTTP_400_BAD_REQUEST
+                return ErrorResponse(name=error.name, message=error.message)
+
             offset = (request.page - 1) * request.page_size
             limit = request.page_size
 
@@ -78,34 +178,18 @@ def find_meeting_list_route() -> APIRouter:
                 limit=limit,
                 offset=offset,
                 status=request.status,
+                fields=fields,
+                cursor=request.cursor,
+                include_total=request.include_total,
             )
 
             use_case_result = await use_case.execute(input_data)
 
             if not use_case_result.success:
-                error = use_case_result.error
-
-                if isinstance(error, (UnexpectedError, DatabaseError)):
-                    logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
-                    response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-                    return ErrorResponse(
-                        name=error.name,
-                        message=UNEXPECTED_ERROR_MESSAGE,
-                    )
-
-                raise ExhaustiveError(error)
-
-            data = use_case_result.data
-            total_pages = math.ceil(data["total"] / request.page_size)
-
-            return PaginatedResponse(
-                data=data["items"],
-                meta=PaginationMeta(
-                    page=request.page,
-                    page_size=request.page_size,
-                    total_items=data["total"],
-                    total_pages=total_pages,
-                ),
+                return _failure_response(use_case_result.error, response, logger)
+
+            return _page_response(
+                request, use_case_result.data, response, if_none_match
             )
 
         except Exception as error:
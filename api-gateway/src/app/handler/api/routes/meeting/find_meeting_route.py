@@ -1,15 +1,16 @@
 """Find meeting endpoint."""
 
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Header, Response, status
 from pydantic import BaseModel
 
-from app.handler.api.middleware.auth_middleware import get_jwt_payload
 from app.domain.support.logger.logger import Logger
+from app.handler.api.middleware.auth_middleware import get_jwt_payload
 from app.use_case.find_meeting_use_case import (
     FindMeetingUseCase,
     FindMeetingUseCaseInput,
@@ -24,6 +25,9 @@ from app.util.exceptions import (
 )
 from app.util.response_models import DataResponse, ErrorResponse
 
+# Let clients keep a copy but revalidate it with If-None-Match every time
+CACHE_CONTROL = "private, no-cache"
+
 
 class FindMeetingResponse(BaseModel):
     """Response for find meeting"""
@@ -37,7 +41,6 @@ class FindMeetingResponse(BaseModel):
     status: Status
     transcribe_text: str | None
     summarize: str | None
-    transcribe_segments: list | None
     key_notes: list | None
     transcribe_total: int
     transcribe_done: int
@@ -54,11 +57,15 @@ def find_meeting_route() -> APIRouter:
     @router.get(
         "/{meeting_id}",
         status_code=status.HTTP_200_OK,
+        response_model=None,
         responses={
             200: {
                 "description": "Meeting retrieved successfully",
                 "model": DataResponse[FindMeetingResponse],
             },
+            304: {
+                "description": "Meeting unchanged since the If-None-Match ETag",
+            },
             404: {
                 "description": "Meeting not found",
                 "model": ErrorResponse,
@@ -75,11 +82,11 @@ def find_meeting_route() -> APIRouter:
         response: Response,
         use_case: FromDishka[FindMeetingUseCase],
         logger: FromDishka[Logger],
+        if_none_match: Annotated[str | None, Header()] = None,
         jwt_payload: dict = Depends(get_jwt_payload),
-    ) -> DataResponse[FindMeetingResponse] | ErrorResponse:
+    ) -> DataResponse[FindMeetingResponse] | ErrorResponse | Response:
         """Find meeting by ID."""
         try:
-            
             auth0_user_id = jwt_payload.get("sub")
             if not auth0_user_id:
                 response.status_code = status.HTTP_401_UNAUTHORIZED
@@ -88,7 +95,8 @@ def find_meeting_route() -> APIRouter:
                 )
             input_data = FindMeetingUseCaseInput(
                 meeting_id=meeting_id,
-                auth0_user_id=auth0_user_id
+                auth0_user_id=auth0_user_id,
+                if_none_match=if_none_match,
             )
             use_case_result = await use_case.execute(input_data)
 
@@ -113,7 +121,15 @@ def find_meeting_route() -> APIRouter:
 
                 raise ExhaustiveError(error)
 
-            meeting = use_case_result.data
+            output = use_case_result.data
+            headers = {"ETag": output.etag, "Cache-Control": CACHE_CONTROL}
+            if output.meeting is None:
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+
+            meeting = output.meeting
+            response.headers.update(headers)
 
             return DataResponse(
                 data=FindMeetingResponse(
@@ -126,7 +142,6 @@ def find_meeting_route() -> APIRouter:
                     status=meeting.status,
                     transcribe_text=meeting.transcribe_text,
                     summarize=meeting.summarize,
-                    transcribe_segments=meeting.transcribe_segments,
                     key_notes=meeting.key_notes,
                     transcribe_total=meeting.transcribe_total,
                     transcribe_done=meeting.transcribe_done,
@@ -0,0 +1,145 @@
+"""Find meeting segments endpoint."""
+
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Query, Response, status
+from pydantic import BaseModel
+
+from app.domain.support.logger.logger import Logger
+from app.handler.api.middleware.auth_middleware import get_jwt_payload
+from app.use_case.find_meeting_segments_use_case import (
+    FindMeetingSegmentsUseCase,
+    FindMeetingSegmentsUseCaseInput,
+)
+from app.util.exceptions import (
+    UNEXPECTED_ERROR_MESSAGE,
+    BadRequestError,
+    DatabaseError,
+    ExhaustiveError,
+    MeetingNotFoundException,
+    UnexpectedError,
+)
+from app.util.response_models import DataResponse, ErrorResponse
+
+
+class SegmentResponse(BaseModel):
+    """Timed transcript segment"""
+
+    start: float
+    end: float
+    text: str
+
+
+class FindMeetingSegmentsResponse(BaseModel):
+    """Response for find meeting segments"""
+
+    segments: list[SegmentResponse]
+
+
+def find_meeting_segments_route() -> APIRouter:
+    """Find meeting segments route"""
+    router = APIRouter()
+
+    @router.get(
+        "/{meeting_id}/segments",
+        status_code=status.HTTP_200_OK,
+        responses={
+            200: {
+                "description": "Segments overlapping the requested range",
+                "model": DataResponse[FindMeetingSegmentsResponse],
+            },
+            400: {
+                "description": "Invalid time range",
+                "model": ErrorResponse,
+            },
+            404: {
+                "description": "Meeting not found",
+                "model": ErrorResponse,
+            },
+            500: {
+                "description": "Internal server error",
+                "model": ErrorResponse,
+            },
+        },
+    )
+    @inject
+    async def find_meeting_segments(
+        meeting_id: UUID,
+        response: Response,
+        use_case: FromDishka[FindMeetingSegmentsUseCase],
+        logger: FromDishka[Logger],
+        start_at: Annotated[
+            float, Query(alias="from", ge=0, description="Range start in seconds")
+        ] = 0.0,
+        end_at: Annotated[
+            float | None,
+            Query(alias="to", gt=0, description="Range end in seconds"),
+        ] = None,
+        limit: Annotated[int, Query(ge=1, le=2000)] = 500,
+        jwt_payload: dict = Depends(get_jwt_payload),
+    ) -> DataResponse[FindMeetingSegmentsResponse] | ErrorResponse:
+        """Find transcript segments of a meeting within a time range."""
+        try:
+            auth0_user_id = jwt_payload.get("sub")
+            if not auth0_user_id:
+                response.status_code = status.HTTP_401_UNAUTHORIZED
+                return ErrorResponse(
+                    name="UnauthorizedError", message="Invalid token: missing user ID"
+                )
+            input_data = FindMeetingSegmentsUseCaseInput(
+                meeting_id=meeting_id,
+                auth0_user_id=auth0_user_id,
+                start_at=start_at,
+                end_at=end_at,
+                limit=limit,
+            )
+            use_case_result = await use_case.execute(input_data)
+
+            if not use_case_result.success:
+                error = use_case_result.error
+
+                if isinstance(error, BadRequestError):
+                    response.status_code = status.HTTP_400_BAD_REQUEST
+                    return ErrorResponse(name=error.name, message=error.message)
+
+                if isinstance(error, MeetingNotFoundException):
+                    logger.error(error.message)
+                    response.status_code = status.HTTP_404_NOT_FOUND
+                    return ErrorResponse(
+                        name=error.name,
+                        message=error.message,
+                    )
+
+                if isinstance(error, (UnexpectedError, DatabaseError)):
+                    logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
+                    response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                    return ErrorResponse(
+                        name=error.name,
+                        message=UNEXPECTED_ERROR_MESSAGE,
+                    )
+
+                raise ExhaustiveError(error)
+
+            return DataResponse(
+                data=FindMeetingSegmentsResponse(
+                    segments=[
+                        SegmentResponse(
+                            start=segment.start, end=segment.end, text=segment.text
+                        )
+                        for segment in use_case_result.data.segments
+                    ]
+                )
+            )
+
+        except Exception as error:
+            logger.error(f"Unexpected error: {error}")
+            response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            return ErrorResponse(
+                name=UnexpectedError().name,
+                message=UNEXPECTED_ERROR_MESSAGE,
+            )
+
+    return router
@@ -0,0 +1,146 @@
+"""Search meetings endpoint."""
+
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Query, Response, status
+from pydantic import BaseModel
+
+from app.domain.support.logger.logger import Logger
+from app.handler.api.middleware.auth_middleware import get_jwt_payload
+from app.use_case.search_meetings_use_case import (
+    SearchMeetingsUseCase,
+    SearchMeetingsUseCaseInput,
+)
+from app.util.enums.status import Status
+from app.util.exceptions import (
+    UNEXPECTED_ERROR_MESSAGE,
+    BadRequestError,
+    DatabaseError,
+    ExhaustiveError,
+    UnexpectedError,
+)
+from app.util.response_models import DataResponse, ErrorResponse
+
+
+class SearchSegmentResponse(BaseModel):
+    """Matching transcript segment with highlighted text"""
+
+    start: float
+    end: float
+    snippet: str
+
+
+class SearchMeetingResponse(BaseModel):
+    """Meeting matching a search query"""
+
+    id: UUID
+    title: str
+    status: Status
+    created_at: datetime
+    rank: float
+    snippet: str | None
+    segments: list[SearchSegmentResponse]
+
+
+def search_meetings_route() -> APIRouter:
+    """Search meetings route"""
+    router = APIRouter()
+
+    @router.get(
+        "/search",
+        status_code=status.HTTP_200_OK,
+        responses={
+            200: {
+                "description": "Matching meetings, best matches first",
+                "model": DataResponse[list[SearchMeetingResponse]],
+            },
+            400: {
+                "description": "Invalid search query",
+                "model": ErrorResponse,
+            },
+            500: {
+                "description": "Internal server error",
+                "model": ErrorResponse,
+            },
+        },
+    )
+    @inject
+    async def search_meetings(
+        response: Response,
+        use_case: FromDishka[SearchMeetingsUseCase],
+        logger: FromDishka[Logger],
+        q: Annotated[
+            str,
+            Query(
+                min_length=1,
+                description='Web search syntax: words, "phrases", or, -excluded',
+            ),
+        ],
+        limit: Annotated[int, Query(ge=1, le=50)] = 20,
+        jwt_payload: dict = Depends(get_jwt_payload),
+    ) -> DataResponse[list[SearchMeetingResponse]] | ErrorResponse:
+        """Search titles, summaries and transcripts of the user's meetings."""
+        try:
+            auth0_user_id = jwt_payload.get("sub")
+            if not auth0_user_id:
+                response.status_code = status.HTTP_401_UNAUTHORIZED
+                return ErrorResponse(
+                    name="UnauthorizedError", message="Invalid token: missing user ID"
+                )
+            input_data = SearchMeetingsUseCaseInput(
+                auth0_user_id=auth0_user_id, query=q, limit=limit
+            )
+            use_case_result = await use_case.execute(input_data)
+
+            if not use_case_result.success:
+                error = use_case_result.error
+
+                if isinstance(error, BadRequestError):
+                    response.status_code = status.HTTP_400_BAD_REQUEST
+                    return ErrorResponse(name=error.name, message=error.message)
+
+                if isinstance(error, (UnexpectedError, DatabaseError)):
+                    logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
+                    response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                    return ErrorResponse(
+                        name=error.name,
+                        message=UNEXPECTED_ERROR_MESSAGE,
+                    )
+
+                raise ExhaustiveError(error)
+
+            return DataResponse(
+                data=[
+                    SearchMeetingResponse(
+                        id=hit.meeting_id,
+                        title=hit.title,
+                        status=hit.status,
+                        created_at=hit.created_at,
+                        rank=hit.rank,
+                        snippet=hit.snippet,
+                        segments=[
+                            SearchSegmentResponse(
+                                start=segment.start,
+                                end=segment.end,
+                                snippet=segment.text,
+                            )
+                            for segment in hit.segments
+                        ],
+                    )
+                    for hit in use_case_result.data.hits
+                ]
+            )
+
+        except Exception as error:
+            logger.error(f"Unexpected error: {error}")
+            response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            return ErrorResponse(
+                name=UnexpectedError().name,
+                message=UNEXPECTED_ERROR_MESSAGE,
+            )
+
+    return router
@@ -0,0 +1,119 @@
+"""Semantic search meetings endpoint."""
+
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Query, Response, status
+from pydantic import BaseModel
+
+from app.domain.support.logger.logger import Logger
+from app.handler.api.middleware.auth_middleware import get_jwt_payload
+from app.use_case.semantic_search_meetings_use_case import (
+    SemanticSearchMeetingsUseCase,
+    SemanticSearchMeetingsUseCaseInput,
+)
+from app.util.exceptions import (
+    UNEXPECTED_ERROR_MESSAGE,
+    BadRequestError,
+    DatabaseError,
+    ExhaustiveError,
+    UnexpectedError,
+)
+from app.util.response_models import DataResponse, ErrorResponse
+
+
+class SemanticSearchHitResponse(BaseModel):
+    """Transcript passage similar to the query"""
+
+    meeting_id: UUID
+    start: float
+    end: float
+    text: str
+    score: float
+
+
+def semantic_search_meetings_route() -> APIRouter:
+    """Semantic search meetings route"""
+    router = APIRouter()
+
+    @router.get(
+        "/search/semantic",
+        status_code=status.HTTP_200_OK,
+        responses={
+            200: {
+                "description": "Most similar transcript passages, best first",
+                "model": DataResponse[list[SemanticSearchHitResponse]],
+            },
+            400: {
+                "description": "Invalid search query",
+                "model": ErrorResponse,
+            },
+            500: {
+                "description": "Internal server error",
+                "model": ErrorResponse,
+            },
+        },
+    )
+    @inject
+    async def semantic_search_meetings(
+        response: Response,
+        use_case: FromDishka[SemanticSearchMeetingsUseCase],
+        logger: FromDishka[Logger],
+        q: Annotated[str, Query(min_length=1)],
+        limit: Annotated[int, Query(ge=1, le=50)] = 10,
+        jwt_payload: dict = Depends(get_jwt_payload),
+    ) -> DataResponse[list[SemanticSearchHitResponse]] | ErrorResponse:
+        """Find transcript passages of the user's meetings similar to q."""
+        try:
+            auth0_user_id = jwt_payload.get("sub")
+            if not auth0_user_id:
+                response.status_code = status.HTTP_401_UNAUTHORIZED
+                return ErrorResponse(
+                    name="UnauthorizedError", message="Invalid token: missing user ID"
+                )
+            input_data = SemanticSearchMeetingsUseCaseInput(
+                auth0_user_id=auth0_user_id, query=q, limit=limit
+            )
+            use_case_result = await use_case.execute(input_data)
+
+            if not use_case_result.success:
+                error = use_case_result.error
+
+                if isinstance(error, BadRequestError):
+                    response.status_code = status.HTTP_400_BAD_REQUEST
+                    return ErrorResponse(name=error.name, message=error.message)
+
+                if isinstance(error, (UnexpectedError, DatabaseError)):
+                    logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
+                    response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                    return ErrorResponse(
+                        name=error.name,
+                        message=UNEXPECTED_ERROR_MESSAGE,
+                    )
+
+                raise ExhaustiveError(error)
+
+            return DataResponse(
+                data=[
+                    SemanticSearchHitResponse(
+                        meeting_id=hit.meeting_id,
+                        start=hit.start,
+                        end=hit.end,
+                        text=hit.text,
+                        score=hit.score,
+                    )
+                    for hit in use_case_result.data.hits
+                ]
+            )
+
+        except Exception as error:
+            logger.error(f"Unexpected error: {error}")
+            response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            return ErrorResponse(
+                name=UnexpectedError().name,
+                message=UNEXPECTED_ERROR_MESSAGE,
+            )
+
+    return router
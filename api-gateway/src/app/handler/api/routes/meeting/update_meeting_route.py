@@ -37,7 +37,6 @@ class UpdateMeetingRequest(BaseModel):
     status: Status | None = None
     transcribe_text: str | None = None
     summarize: str | None = None
-    transcribe_segments: list | None = None
     key_notes: list | None = None
 
 
@@ -86,7 +85,6 @@ def update_meeting_route() -> APIRouter:
                 status=request.status,
                 transcribe_text=request.transcribe_text,
                 summarize=request.summarize,
-                transcribe_segments=request.transcribe_segments,
                 key_notes=request.key_notes,
             )
 
@@ -0,0 +1,109 @@
+"""Watch meeting status endpoint (Server-Sent Events)."""
+
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from app.domain.support.logger.logger import Logger
+from app.use_case.find_meeting_status_use_case import FindMeetingStatusUseCaseOutput
+from app.use_case.watch_meeting_status_use_case import (
+    WatchMeetingStatusUseCase,
+    WatchMeetingStatusUseCaseInput,
+    WatchMeetingStatusUseCaseOutput,
+)
+from app.util.exceptions import (
+    UNEXPECTED_ERROR_MESSAGE,
+    MeetingNotFoundException,
+    UnexpectedError,
+)
+from app.util.response_models import ErrorResponse
+
+HEARTBEAT_SECONDS = 15.0
+
+_status_adapter = TypeAdapter(FindMeetingStatusUseCaseOutput)
+
+
+async def _to_sse(events: WatchMeetingStatusUseCaseOutput) -> AsyncIterator[bytes]:
+    """Encode status updates as SSE frames, idle ticks as comments."""
+    async for event in events:
+        if event is None:
+            yield b": keep-alive\n\n"
+            continue
+        yield b"event: status\ndata: " + _status_adapter.dump_json(event) + b"\n\n"
+
+
+def watch_meeting_status_route() -> APIRouter:
+    """Watch meeting status route"""
+    router = APIRouter()
+
+    @router.get(
+        "/{meeting_id}/events",
+        status_code=status.HTTP_200_OK,
+        response_model=None,
+        responses={
+            200: {
+                "description": "Stream of status events until the pipeline ends",
+                "content": {"text/event-stream": {}},
+            },
+            404: {
+                "description": "Meeting not found",
+                "model": ErrorResponse,
+            },
+            500: {
+                "description": "Internal server error",
+                "model": ErrorResponse,
+            },
+        },
+    )
+    @inject
+    async def watch_meeting_status(
+        meeting_id: UUID,
+        response: Response,
+        use_case: FromDishka[WatchMeetingStatusUseCase],
+        logger: FromDishka[Logger],
+    ) -> StreamingResponse | ErrorResponse:
+        """Stream meeting status changes as Server-Sent Events."""
+        try:
+            input_data = WatchMeetingStatusUseCaseInput(
+                meeting_id=meeting_id, heartbeat_seconds=HEARTBEAT_SECONDS
+            )
+            use_case_result = await use_case.execute(input_data)
+
+            if not use_case_result.success:
+                error = use_case_result.error
+
+                if isinstance(error, MeetingNotFoundException):
+                    logger.error(error.message)
+                    response.status_code = status.HTTP_404_NOT_FOUND
+                    return ErrorResponse(
+                        name=error.name,
+                        message=error.message,
+                    )
+
+                logger.error(f"{UNEXPECTED_ERROR_MESSAGE}: {error}")
+                response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                return ErrorResponse(
+                    name=UnexpectedError().name,
+                    message=UNEXPECTED_ERROR_MESSAGE,
+                )
+
+            return StreamingResponse(
+                _to_sse(use_case_result.data),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
+        except Exception as error:
+            logger.error(f"Unexpected error: {error}")
+            response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+            return ErrorResponse(
+                name=UnexpectedError().name,
+                message=UNEXPECTED_ERROR_MESSAGE,
+            )
+
+    return router
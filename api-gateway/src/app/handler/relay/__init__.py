@@ -0,0 +1,5 @@
+"""Outbox relay handler."""
+
+from app.handler.relay.outbox_relay import run_outbox_relay
+
+__all__ = ["run_outbox_relay"]
@@ -0,0 +1,47 @@
+"""Outbox relay loop."""
+
+import asyncio
+import logging
+from contextlib import suppress
+
+from dishka import AsyncContainer
+
+from app.di_container.settings import settings
+from app.use_case.relay_outbox_use_case import (
+    RelayOutboxUseCase,
+    RelayOutboxUseCaseInput,
+)
+
+log = logging.getLogger(__name__)
+
+
+async def run_outbox_relay(container: AsyncContainer, stop: asyncio.Event) -> None:
+    """
+    Drain the outbox until stop is set.
+
+    Full batches are followed immediately by the next one so spikes drain at
+    broker speed; otherwise the relay sleeps for the poll interval.
+    """
+    batch_size = settings.outbox.batch_size
+    log.info("Outbox relay started (batch size %d).", batch_size)
+
+    while not stop.is_set():
+        claimed = 0
+        try:
+            async with container() as request_container:
+                use_case = await request_container.get(RelayOutboxUseCase)
+                result = await use_case.execute(
+                    RelayOutboxUseCaseInput(batch_size=batch_size)
+                )
+            if result.success:
+                claimed = result.data["claimed"]
+        except Exception:
+            log.exception("Outbox relay iteration failed.")
+
+        if claimed >= batch_size:
+            continue
+
+        with suppress(TimeoutError):
+            await asyncio.wait_for(stop.wait(), settings.outbox.poll_interval_seconds)
+
+    log.info("Outbox relay stopped.")
@@ -10,43 +10,62 @@ from app.infrastructure.auth.type import JwksCache
 log = logging.getLogger(__name__)
 
 JWKS_TTL_SECONDS = settings.auth0.jwks_cache_ttl
+JWKS_MIN_REFRESH_SECONDS = settings.auth0.jwks_min_refresh_interval
 
 
-async def fetch_jwks(*, jwks_url: str) -> dict[str, Any]:
+async def fetch_jwks(*, jwks_url: str, client: httpx.AsyncClient) -> dict[str, Any]:
     """
     Fetch JWKS from Auth0.
 
     Args:
         jwks_url: Auth0 JWKS endpoint.
+        client: Shared HTTP client.
 
     Returns:
         JWKS payload.
     """
-    async with httpx.AsyncClient(timeout=5) as client:
-        response = await client.get(jwks_url)
-        response.raise_for_status()
-        return response.json()
+    response = await client.get(jwks_url)
+    response.raise_for_status()
+    return response.json()
 
 
 async def load_jwks(
     *,
     jwks_url: str,
     jwks_cache: JwksCache,
+    client: httpx.AsyncClient,
     force_refresh: bool = False,
 ) -> dict[str, Any]:
     """
     Load JWKS from cache or fetch from Auth0.
 
-    Uses in-memory cache with TTL.
+    Uses in-memory cache with TTL. Refreshes are single-flight: callers that
+    miss together wait for one fetch, and forced refreshes (unknown kid) are
+    rate-limited to one per JWKS_MIN_REFRESH_SECONDS.
     """
-    now = time.time()
+    jwks = jwks_cache["jwks"]
+    if not force_refresh and jwks and time.time() < jwks_cache["expires_at"]:
+        return jwks
 
-    if not force_refresh and jwks_cache["jwks"] and now < jwks_cache["expires_at"]:
-        return jwks_cache["jwks"]
+    async with jwks_cache["lock"]:
+        now = time.time()
+        jwks = jwks_cache["jwks"]
 
-    jwks = await fetch_jwks(jwks_url=jwks_url)
-    jwks_cache["jwks"] = jwks
-    jwks_cache["expires_at"] = now + JWKS_TTL_SECONDS
+        # Another caller may have refreshed while we waited for the lock
+        if jwks and not force_refresh and now < jwks_cache["expires_at"]:
+            return jwks
+        if (
+            jwks
+            and force_refresh
+            and now - jwks_cache["fetched_at"] < (JWKS_MIN_REFRESH_SECONDS)
+        ):
+            return jwks
+
+        jwks = await fetch_jwks(jwks_url=jwks_url, client=client)
+        jwks_cache["jwks"] = jwks
+        jwks_cache["expires_at"] = now + JWKS_TTL_SECONDS
+        jwks_cache["fetched_at"] = now
+        jwks_cache["keys"] = {}
 
     log.info("JWKS cache refreshed")
     return jwks
@@ -1,12 +1,17 @@
+import asyncio
+import hashlib
 import json
 import logging
+import time
 from typing import Any
 
+import httpx
 import jwt
 from jwt.algorithms import RSAAlgorithm
 
 from app.infrastructure.auth.jwks_cache import load_jwks
 from app.infrastructure.auth.type import JwksCache
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
 from app.util.auth_exceptions import (
     InvalidTokenError,
     TokenVerificationInternalError,
@@ -55,43 +60,54 @@ class JWTValidator:
         *,
         audience: str,
         issuer_base_url: str,
+        http_client: httpx.AsyncClient | None = None,
+        claims_cache_size: int = 0,
+        claims_cache_max_ttl: float = 300.0,
     ) -> None:
-        """Initialize JWT validator."""
+        """Initialize JWT validator.
+
+        A claims_cache_size of 0 disables the verified-claims cache.
+        """
         self.audience = audience
         self.issuer = issuer_base_url.rstrip("/") + "/"
         self.jwks_url = f"{self.issuer}.well-known/jwks.json"
 
+        self._http_client = http_client or httpx.AsyncClient(timeout=5)
+
         # In-memory JWKS cache
         self._jwks_cache: JwksCache = {
             "jwks": None,
             "expires_at": 0.0,
+            "fetched_at": 0.0,
+            "keys": {},
+            "lock": asyncio.Lock(),
         }
 
+        # Verified claims by token hash, each entry expiring no later than `exp`
+        self._claims_cache: TTLLRUCache[str, dict[str, Any]] | None = None
+        self._claims_cache_max_ttl = claims_cache_max_ttl
+        if claims_cache_size > 0:
+            self._claims_cache = TTLLRUCache(
+                max_size=claims_cache_size, ttl_seconds=claims_cache_max_ttl
+            )
+
     async def verify_token(self, token: str) -> dict[str, Any]:
         """Verify JWT access token."""
         if not token:
             raise UnauthorizedError("Missing token")
 
+        token_hash = None
+        if self._claims_cache is not None:
+            token_hash = hashlib.sha256(token.encode()).hexdigest()
+            cached = self._claims_cache.get(token_hash)
+            if cached is not None:
+                return dict(cached)
+
         try:
             kid = extract_kid(token=token)
+            signing_key = await self._get_signing_key(kid)
 
-            jwks = await load_jwks(
-                jwks_url=self.jwks_url,
-                jwks_cache=self._jwks_cache,
-            )
-
-            try:
-                signing_key = find_signing_key(kid=kid, jwks=jwks)
-            except KeyError:
-                log.info("Signing key not found, refreshing JWKS")
-                jwks = await load_jwks(
-                    jwks_url=self.jwks_url,
-                    jwks_cache=self._jwks_cache,
-                    force_refresh=True,
-                )
-                signing_key = find_signing_key(kid=kid, jwks=jwks)
-
-            return jwt.decode(
+            claims = jwt.decode(
                 token,
                 signing_key,
                 algorithms=["RS256"],
@@ -114,3 +130,51 @@ class JWTValidator:
         except Exception as exc:
             log.exception("JWT verification failed")
             raise TokenVerificationInternalError("Token verification failed") from exc
+
+        if token_hash is not None:
+            self._cache_claims(token_hash, claims)
+        return claims
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http_client.aclose()
+
+    async def _get_signing_key(self, kid: str) -> Any:
+        """Return the parsed public key for kid, refreshing JWKS on a miss."""
+        jwks = await load_jwks(
+            jwks_url=self.jwks_url,
+            jwks_cache=self._jwks_cache,
+            client=self._http_client,
+        )
+
+        signing_key = self._jwks_cache["keys"].get(kid)
+        if signing_key is not None:
+            return signing_key
+
+        try:
+            signing_key = find_signing_key(kid=kid, jwks=jwks)
+        except KeyError:
+            log.info("Signing key not found, refreshing JWKS")
+            jwks = await load_jwks(
+                jwks_url=self.jwks_url,
+                jwks_cache=self._jwks_cache,
+                client=self._http_client,
+                force_refresh=True,
+            )
+            signing_key = find_signing_key(kid=kid, jwks=jwks)
+
+        # A refresh replaces the key map, so always store into the current one
+        self._jwks_cache["keys"][kid] = signing_key
+        return signing_key
+
+    def _cache_claims(self, token_hash: str, claims: dict[str, Any]) -> None:
+        """Cache verified claims until the token expires."""
+        if self._claims_cache is None:
+            return
+
+        exp = claims.get("exp")
+        if not isinstance(exp, int | float):
+            return
+
+        ttl = min(exp - time.time(), self._claims_cache_max_ttl)
+        self._claims_cache.set(token_hash, dict(claims), ttl_seconds=ttl)
@@ -1,6 +1,12 @@
+import asyncio
 from typing import Any, TypedDict
 
 
 class JwksCache(TypedDict):
     jwks: dict[str, Any] | None
     expires_at: float
+    fetched_at: float
+    # Parsed public keys by kid, rebuilt lazily after each refresh
+    keys: dict[str, Any]
+    # Serializes refreshes so concurrent misses share one fetch
+    lock: asyncio.Lock
@@ -0,0 +1,19 @@
+"""Cache infrastructure."""
+
+from app.infrastructure.cache.meeting_cache_impl import MeetingCacheImpl
+from app.infrastructure.cache.meeting_event_listener_impl import (
+    MeetingEventListenerImpl,
+)
+from app.infrastructure.cache.meeting_status_cache_impl import MeetingStatusCacheImpl
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from app.infrastructure.cache.user_identity_cache import UserIdentityCache
+from app.infrastructure.cache.user_identity_cache_impl import UserIdentityCacheImpl
+
+__all__ = [
+    "MeetingCacheImpl",
+    "MeetingEventListenerImpl",
+    "MeetingStatusCacheImpl",
+    "TTLLRUCache",
+    "UserIdentityCache",
+    "UserIdentityCacheImpl",
+]
@@ -0,0 +1,128 @@
+"""Redis meeting cache implementation."""
+
+import logging
+from datetime import datetime
+from uuid import UUID
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.model.meeting.meeting import Meeting
+from app.util.enums.status import Status
+
+log = logging.getLogger(__name__)
+
+# Left by invalidate so a view that read the row before the change cannot
+# write it back; outlasts any load started before the invalidation
+INVALIDATION_TOMBSTONE_SECONDS = 60
+_TOMBSTONE = b""
+
+
+def _meeting_key(meeting_id: UUID) -> str:
+    return f"meeting:{meeting_id}:view"
+
+
+class MeetingCacheImpl:
+    """
+    Stores serialized meetings in Redis.
+
+    One key per meeting holds the owner's user_id alongside the payload, so
+    lookups by another user miss. Invalidation replaces the entry with a
+    short-lived tombstone and entries are only written to a free key, so a
+    load that raced an update or delete cannot cache the old row.
+    """
+
+    def __init__(self, *, redis: Redis, ttl_seconds: int) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+
+    async def get(self, meeting_id: UUID, user_id: UUID) -> Meeting | None:
+        """Return the cached meeting if it exists and belongs to user_id."""
+        try:
+            raw = await self._redis.get(_meeting_key(meeting_id))
+        except RedisError as e:
+            log.warning(f"Meeting cache read failed: {e}")
+            return None
+
+        if not raw:  # Missing or tombstone
+            return None
+
+        try:
+            meeting = decode_meeting(raw)
+        except (orjson.JSONDecodeError, KeyError, ValueError) as e:
+            log.warning(f"Discarding malformed meeting cache entry: {e}")
+            return None
+
+        return meeting if meeting.user_id == user_id else None
+
+    async def set(self, meeting: Meeting) -> None:
+        """Cache a fully loaded meeting, unless it was recently invalidated."""
+        if meeting.user_id is None:
+            return
+
+        try:
+            await self._redis.set(
+                _meeting_key(meeting.id),
+                encode_meeting(meeting),
+                ex=self._ttl_seconds,
+                nx=True,
+            )
+        except RedisError as e:
+            log.warning(f"Meeting cache write failed: {e}")
+
+    async def invalidate(self, meeting_id: UUID) -> None:
+        """Drop a cached meeting, blocking writes of it for a while."""
+        try:
+            await self._redis.set(
+                _meeting_key(meeting_id),
+                _TOMBSTONE,
+                ex=INVALIDATION_TOMBSTONE_SECONDS,
+            )
+        except RedisError as e:
+            log.warning(f"Meeting cache invalidation failed: {e}")
+
+
+def encode_meeting(meeting: Meeting) -> bytes:
+    """Serialize a fully loaded meeting."""
+    return orjson.dumps({
+        "id": str(meeting.id),
+        "user_id": str(meeting.user_id),
+        "title": meeting.title,
+        "description": meeting.description,
+        "audio_url": meeting.audio_url,
+        "duration": meeting.duration,
+        "status": meeting.status.value,
+        "transcribe_text": meeting.transcribe_text,
+        "summarize": meeting.summarize,
+        "key_notes": meeting.key_notes,
+        "transcribe_total": meeting.transcribe_total,
+        "transcribe_done": meeting.transcribe_done,
+        "summarize_total": meeting.summarize_total,
+        "summarize_done": meeting.summarize_done,
+        "created_at": meeting.created_at.isoformat(),
+        "updated_at": meeting.updated_at.isoformat(),
+    })
+
+
+def decode_meeting(raw: bytes | str) -> Meeting:
+    """Build a detached meeting from encode_meeting output."""
+    data = orjson.loads(raw)
+    return Meeting(
+        id=UUID(data["id"]),
+        user_id=UUID(data["user_id"]),
+        title=data["title"],
+        description=data["description"],
+        audio_url=data["audio_url"],
+        duration=data["duration"],
+        status=Status(data["status"]),
+        transcribe_text=data["transcribe_text"],
+        summarize=data["summarize"],
+        key_notes=data["key_notes"],
+        transcribe_total=data["transcribe_total"],
+        transcribe_done=data["transcribe_done"],
+        summarize_total=data["summarize_total"],
+        summarize_done=data["summarize_done"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+    )
@@ -0,0 +1,150 @@
+"""Redis pub/sub meeting event listener implementation."""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.model.meeting.meeting_repository import MeetingStatusInProgress
+from app.infrastructure.cache.meeting_status_cache_impl import (
+    events_channel,
+    parse_status_snapshot,
+)
+
+log = logging.getLogger(__name__)
+
+
+class _MeetingEventSubscription:
+    """Queue-backed subscription handed out by MeetingEventListenerImpl."""
+
+    def __init__(
+        self,
+        *,
+        queue: asyncio.Queue[MeetingStatusInProgress],
+        on_close: Callable[[], Awaitable[None]],
+    ) -> None:
+        self._queue = queue
+        self._on_close = on_close
+        self._closed = False
+
+    async def next(self) -> MeetingStatusInProgress:
+        """Wait for the next event (bound the wait with asyncio.timeout)."""
+        return await self._queue.get()
+
+    async def close(self) -> None:
+        """Stop receiving events."""
+        if self._closed:
+            return
+        self._closed = True
+        await self._on_close()
+
+
+class MeetingEventListenerImpl:
+    """
+    Fans Redis pub/sub meeting events out to in-process subscribers.
+
+    A single pub/sub connection is shared by every subscriber in the process;
+    channels are subscribed while at least one client watches the meeting.
+    Each subscriber has a small queue and only the newest snapshots are kept
+    when a slow client falls behind.
+    """
+
+    def __init__(self, *, redis: Redis, queue_size: int = 16) -> None:
+        self._pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        self._queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue[MeetingStatusInProgress]]] = {}
+        self._lock = asyncio.Lock()
+        self._reader: asyncio.Task[None] | None = None
+
+    async def subscribe(self, meeting_id: UUID) -> _MeetingEventSubscription:
+        """Start receiving events for a meeting."""
+        channel = events_channel(meeting_id)
+        queue: asyncio.Queue[MeetingStatusInProgress] = asyncio.Queue(
+            maxsize=self._queue_size
+        )
+
+        async with self._lock:
+            subscribers = self._subscribers.setdefault(channel, set())
+            if not subscribers:
+                try:
+                    await self._pubsub.subscribe(channel)
+                except RedisError:
+                    del self._subscribers[channel]
+                    raise
+            subscribers.add(queue)
+
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_loop())
+
+        return _MeetingEventSubscription(
+            queue=queue, on_close=partial(self._unsubscribe, channel, queue)
+        )
+
+    async def close(self) -> None:
+        """Stop the reader and release the pub/sub connection."""
+        if self._reader is not None:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+
+        self._subscribers.clear()
+        await self._pubsub.aclose()
+
+    async def _unsubscribe(
+        self, channel: str, queue: asyncio.Queue[MeetingStatusInProgress]
+    ) -> None:
+        async with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+
+            subscribers.discard(queue)
+            if subscribers:
+                return
+
+            del self._subscribers[channel]
+            try:
+                await self._pubsub.unsubscribe(channel)
+            except RedisError as e:
+                log.warning(f"Meeting events unsubscribe failed: {e}")
+
+    async def _read_loop(self) -> None:
+        """Dispatch pub/sub messages until nobody is listening."""
+        while self._subscribers:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except RedisError as e:
+                log.warning(f"Meeting events read failed: {e}")
+                await asyncio.sleep(1.0)
+                continue
+
+            if message is None:
+                continue
+
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+
+            subscribers = self._subscribers.get(channel)
+            if not subscribers:
+                continue
+
+            try:
+                snapshot = parse_status_snapshot(json.loads(message["data"]))
+            except (KeyError, ValueError, TypeError) as e:
+                log.warning(f"Discarding malformed meeting event: {e}")
+                continue
+
+            for queue in subscribers:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(snapshot)
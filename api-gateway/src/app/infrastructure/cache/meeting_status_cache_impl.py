@@ -0,0 +1,76 @@
+"""Redis meeting status cache implementation."""
+
+import logging
+from collections.abc import Mapping
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.model.meeting.meeting_repository import MeetingStatusInProgress
+from app.util.enums.status import Status
+
+log = logging.getLogger(__name__)
+
+
+def status_key(meeting_id: UUID) -> str:
+    """Redis key of the status snapshot hash (shared with the workers)."""
+    return f"meeting:{meeting_id}:status"
+
+
+def events_channel(meeting_id: UUID) -> str:
+    """Redis pub/sub channel of status events (shared with the workers)."""
+    return f"meeting:{meeting_id}:events"
+
+
+def parse_status_snapshot(data: Mapping[str, str]) -> MeetingStatusInProgress:
+    """Build a status DTO from a worker snapshot; missing counters read as 0."""
+    return MeetingStatusInProgress(
+        id=UUID(data["meeting_id"]),
+        status=Status(data["status"]),
+        transcribe_total=int(data.get("transcribe_total", 0)),
+        transcribe_done=int(data.get("transcribe_done", 0)),
+        summarize_total=int(data.get("summarize_total", 0)),
+        summarize_done=int(data.get("summarize_done", 0)),
+    )
+
+
+class MeetingStatusCacheImpl:
+    """Reads status snapshot hashes written by transcribe/summarize workers."""
+
+    def __init__(self, *, redis: Redis) -> None:
+        self._redis = redis
+
+    async def get(self, meeting_id: UUID) -> MeetingStatusInProgress | None:
+        """Return the latest snapshot; Redis errors count as a miss."""
+        try:
+            data = await self._redis.hgetall(status_key(meeting_id))
+        except RedisError as e:
+            log.warning(f"Meeting status cache read failed: {e}")
+            return None
+
+        if not data:
+            return None
+
+        try:
+            return parse_status_snapshot(_decode(data))
+        except (KeyError, ValueError) as e:
+            log.warning(f"Discarding malformed status snapshot: {e}")
+            return None
+
+    async def invalidate(self, meeting_id: UUID) -> None:
+        """Drop the snapshot."""
+        try:
+            await self._redis.delete(status_key(meeting_id))
+        except RedisError as e:
+            log.warning(f"Meeting status cache invalidation failed: {e}")
+
+
+def _decode(data: Mapping[str | bytes, str | bytes]) -> dict[str, str]:
+    """Normalise a hash reply regardless of the client's decode_responses."""
+    return {
+        (k.decode() if isinstance(k, bytes) else k): (
+            v.decode() if isinstance(v, bytes) else v
+        )
+        for k, v in data.items()
+    }
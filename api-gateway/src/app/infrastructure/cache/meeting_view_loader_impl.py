@@ -0,0 +1,71 @@
+"""Coalescing meeting view loader implementation."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.model.meeting.meeting import Meeting
+from app.domain.support.meeting_cache.meeting_cache import MeetingCache
+from app.infrastructure.cache.meeting_cache_impl import decode_meeting, encode_meeting
+from app.infrastructure.persistence.repository.meeting_repository_impl import (
+    MeetingRepositoryImpl,
+)
+from app.util.enums.status import Status
+from app.util.result import Result, failure, success
+from app.util.single_flight import SingleFlight
+
+# Statuses after which the pipeline no longer writes to the meeting
+CACHEABLE_STATUSES = frozenset({Status.COMPLETED})
+
+
+class MeetingViewLoaderImpl:
+    """
+    Loads meetings through a single-flight call with its own session.
+
+    The shared call outlives any one request, so it must not borrow a
+    request-scoped session, and it hands back the serialized meeting so every
+    caller decodes a private instance instead of sharing one ORM object.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        meeting_cache: MeetingCache,
+        single_flight: SingleFlight,
+    ) -> None:
+        self._session_factory = session_factory
+        self._meeting_cache = meeting_cache
+        self._single_flight = single_flight
+
+    async def load(
+        self, meeting_id: UUID, user_id: UUID
+    ) -> Result[Meeting | None, Exception]:
+        """Load a meeting owned by user_id, joining a load already in flight."""
+        result = await self._single_flight.do(
+            ("meeting_view", meeting_id, user_id),
+            lambda: self._load_encoded(meeting_id, user_id),
+        )
+        if result.success is False:
+            return failure(result.error)
+        if result.data is None:
+            return success(None)
+        return success(decode_meeting(result.data))
+
+    async def _load_encoded(
+        self, meeting_id: UUID, user_id: UUID
+    ) -> Result[bytes | None, Exception]:
+        async with self._session_factory() as session:
+            find_result = await MeetingRepositoryImpl(session).find_by_id(
+                meeting_id, user_id
+            )
+            if find_result.success is False:
+                return failure(find_result.error)
+
+            meeting = find_result.data
+            if meeting is None:
+                return success(None)
+
+            if meeting.status in CACHEABLE_STATUSES:
+                await self._meeting_cache.set(meeting)
+            return success(encode_meeting(meeting))
@@ -0,0 +1,21 @@
+"""User identity cache interface."""
+
+from typing import Protocol
+
+from app.domain.model.user.user_identity import UserIdentity
+
+
+class UserIdentityCache(Protocol):
+    """Cache of user identities keyed by Auth0 user ID."""
+
+    async def get(self, auth0_user_id: str) -> UserIdentity | None:
+        """Return cached identity, or None on miss."""
+        ...
+
+    async def set(self, identity: UserIdentity) -> None:
+        """Cache an identity."""
+        ...
+
+    async def invalidate(self, auth0_user_id: str) -> None:
+        """Drop a cached identity."""
+        ...
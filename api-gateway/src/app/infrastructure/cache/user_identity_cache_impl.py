@@ -0,0 +1,103 @@
+"""Two-level user identity cache implementation."""
+
+import json
+import logging
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.model.user.user_identity import UserIdentity
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from app.util.enums.user_type import UserType
+
+log = logging.getLogger(__name__)
+
+KEY_PREFIX = "user:identity:"
+
+
+class UserIdentityCacheImpl:
+    """
+    User identity cache backed by an in-process TTL LRU and Redis.
+
+    The local level absorbs repeated lookups within one worker; Redis shares
+    entries across workers. Redis errors are logged and treated as misses so a
+    cache outage only costs a database round trip.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis: Redis,
+        local_cache: TTLLRUCache[str, UserIdentity],
+        redis_ttl_seconds: int,
+    ) -> None:
+        self._redis = redis
+        self._local = local_cache
+        self._redis_ttl_seconds = redis_ttl_seconds
+
+    async def get(self, auth0_user_id: str) -> UserIdentity | None:
+        """Return cached identity, filling the local level on a Redis hit."""
+        identity = self._local.get(auth0_user_id)
+        if identity is not None:
+            return identity
+
+        try:
+            raw = await self._redis.get(KEY_PREFIX + auth0_user_id)
+        except RedisError as e:
+            log.warning(f"User identity cache read failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        try:
+            identity = self._decode(raw)
+        except (ValueError, KeyError) as e:
+            log.warning(f"Discarding malformed user identity cache entry: {e}")
+            return None
+
+        self._local.set(auth0_user_id, identity)
+        return identity
+
+    async def set(self, identity: UserIdentity) -> None:
+        """Write identity to both levels."""
+        self._local.set(identity.auth0_user_id, identity)
+        try:
+            await self._redis.set(
+                KEY_PREFIX + identity.auth0_user_id,
+                self._encode(identity),
+                ex=self._redis_ttl_seconds,
+            )
+        except RedisError as e:
+            log.warning(f"User identity cache write failed: {e}")
+
+    async def invalidate(self, auth0_user_id: str) -> None:
+        """Drop identity from both levels.
+
+        Other workers keep their local copy until its (short) TTL runs out.
+        """
+        self._local.pop(auth0_user_id)
+        try:
+            await self._redis.delete(KEY_PREFIX + auth0_user_id)
+        except RedisError as e:
+            log.warning(f"User identity cache invalidation failed: {e}")
+
+    @staticmethod
+    def _encode(identity: UserIdentity) -> str:
+        return json.dumps({
+            "id": str(identity.id),
+            "auth0_user_id": identity.auth0_user_id,
+            "email": identity.email,
+            "user_type": identity.user_type.value,
+        })
+
+    @staticmethod
+    def _decode(raw: str | bytes) -> UserIdentity:
+        data = json.loads(raw)
+        return UserIdentity(
+            id=UUID(data["id"]),
+            auth0_user_id=data["auth0_user_id"],
+            email=data["email"],
+            user_type=UserType(data["user_type"]),
+        )
@@ -1,5 +1,6 @@
 """Transaction manager interface."""
 
+from collections.abc import Awaitable, Callable
 from typing import Protocol
 
 
@@ -17,3 +18,7 @@ class TransactionManager(Protocol):
     async def rollback(self) -> None:
         """Rollback current transaction"""
         ...
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run callback once the current transaction has committed"""
+        ...
@@ -1,6 +1,7 @@
 """Transaction manager implementation."""
 
 import logging
+from collections.abc import Awaitable, Callable
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,9 +18,10 @@ class TransactionManagerImpl:
 
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._on_commit: list[Callable[[], Awaitable[None]]] = []
 
     async def commit(self) -> None:
-        """Commit current transaction"""
+        """Commit current transaction, then run its after-commit callbacks"""
         try:
             await self._session.commit()
             log.debug("Transaction committed successfully")
@@ -27,11 +29,24 @@ class TransactionManagerImpl:
             log.error(f"Failed to commit transaction: {e}")
             raise
 
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                # The data is committed; a failed side effect must not undo that
+                log.error(f"After-commit callback failed: {e}")
+
     async def rollback(self) -> None:
-        """Rollback current transaction"""
+        """Rollback current transaction, discarding its after-commit callbacks"""
+        self._on_commit = []
         try:
             await self._session.rollback()
             log.debug("Transaction rolled back successfully")
         except SQLAlchemyError as e:
             log.error(f"Failed to rollback transaction: {e}")
             raise
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run callback once the current transaction has committed"""
+        self._on_commit.append(callback)
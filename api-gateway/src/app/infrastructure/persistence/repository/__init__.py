@@ -1,10 +1,21 @@
 """Repository Implementations"""
 
+from app.infrastructure.persistence.repository.meeting_counter_repository_impl import (
+    MeetingCounterRepositoryImpl,
+)
 from app.infrastructure.persistence.repository.meeting_repository_impl import (
     MeetingRepositoryImpl,
 )
+from app.infrastructure.persistence.repository.outbox_repository_impl import (
+    OutboxRepositoryImpl,
+)
 from app.infrastructure.persistence.repository.user_repository_impl import (
     UserRepositoryImpl,
 )
 
-__all__ = ["MeetingRepositoryImpl", "UserRepositoryImpl"]
+__all__ = [
+    "MeetingCounterRepositoryImpl",
+    "MeetingRepositoryImpl",
+    "OutboxRepositoryImpl",
+    "UserRepositoryImpl",
+]
@@ -0,0 +1,77 @@
+"""Caching decorator for UserRepository."""
+
+from functools import partial
+
+from app.domain.model.user.user import User
+from app.domain.model.user.user_identity import UserIdentity
+from app.domain.model.user.user_repository import UserRepository
+from app.infrastructure.cache.user_identity_cache import UserIdentityCache
+from app.infrastructure.db_client.transaction_manager import TransactionManager
+from app.util.result import Result, failure, success
+
+
+class CachedUserRepositoryImpl(UserRepository):
+    """
+    UserRepository that serves identity lookups from a cache.
+
+    Full User reads (which carry mutable quota usage) always go to the wrapped
+    repository. Saves invalidate the cached identity when an identity field,
+    such as the user type, changes, and again after the transaction commits.
+    """
+
+    def __init__(
+        self,
+        *,
+        repository: UserRepository,
+        cache: UserIdentityCache,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._transaction_manager = transaction_manager
+
+    async def find_by_auth0_id(
+        self, auth0_user_id: str
+    ) -> Result[User | None, Exception]:
+        """Find user by Auth0 user ID (always authoritative)."""
+        return await self._repository.find_by_auth0_id(auth0_user_id)
+
+    async def find_identity_by_auth0_id(
+        self, auth0_user_id: str
+    ) -> Result[UserIdentity | None, Exception]:
+        """Find user identity, reading through the cache."""
+        cached = await self._cache.get(auth0_user_id)
+        if cached is not None:
+            return success(cached)
+
+        result = await self._repository.find_identity_by_auth0_id(auth0_user_id)
+        if not result.success:
+            return failure(result.error)
+
+        if result.data is not None:
+            await self._cache.set(result.data)
+        return result
+
+    async def save(self, user: User) -> Result[User, Exception]:
+        """Save user and drop its cached identity before and after commit."""
+        result = await self._repository.save(user)
+        if not result.success:
+            return result
+
+        # A concurrent lookup can re-cache the old row until this transaction
+        # commits, so the identity is dropped again once it has
+        cached = await self._cache.get(user.auth0_user_id)
+        if cached is not None and cached != UserIdentity.from_user(user):
+            await self._cache.invalidate(user.auth0_user_id)
+        self._transaction_manager.on_commit(
+            partial(self._cache.invalidate, user.auth0_user_id)
+        )
+        return result
+
+    async def get_or_create(
+        self,
+        auth0_user_id: str,
+        email: str | None = None,
+    ) -> Result[User, Exception]:
+        """Get existing user or create new one with default FREE type."""
+        return await self._repository.get_or_create(auth0_user_id, email)
@@ -0,0 +1,83 @@
+"""Meeting counter repository implementation."""
+
+import logging
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.model.meeting.meeting import Meeting
+from app.domain.model.user.user import User
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_counter_mapping import (
+    meeting_counters_table,
+)
+from app.util.result import Result, failure, success
+
+log = logging.getLogger(__name__)
+
+
+class MeetingCounterRepositoryImpl:
+    """SQLAlchemy implementation of MeetingCounterRepository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def reconcile(
+        self, *, after_user_id: UUID | None = None, limit: int = 500
+    ) -> Result[tuple[int, UUID | None], Exception]:
+        """Recompute meeting counters for one batch of users ordered by ID."""
+        try:
+            users_query = select(User.id).order_by(User.id).limit(limit)
+            if after_user_id is not None:
+                users_query = users_query.where(User.id > after_user_id)
+            user_ids = list((await self._session.execute(users_query)).scalars())
+
+            if not user_ids:
+                return success((0, None))
+
+            counters = meeting_counters_table.c
+
+            # Lock existing counters so trigger updates wait for this batch
+            current_rows = await self._session.execute(
+                select(counters.user_id, counters.status, counters.count)
+                .where(counters.user_id.in_(user_ids))
+                .with_for_update()
+            )
+            current = {(r.user_id, r.status): r.count for r in current_rows}
+
+            actual_rows = await self._session.execute(
+                select(Meeting.user_id, Meeting.status, func.count())
+                .where(Meeting.user_id.in_(user_ids))
+                .group_by(Meeting.user_id, Meeting.status)
+            )
+            actual = {(user_id, status): n for user_id, status, n in actual_rows}
+
+            corrected = 0
+            for key, expected in actual.items():
+                if current.get(key) != expected:
+                    corrected += 1
+                    stmt = insert(meeting_counters_table).values(
+                        user_id=key[0], status=key[1], count=expected
+                    )
+                    await self._session.execute(
+                        stmt.on_conflict_do_update(
+                            index_elements=[counters.user_id, counters.status],
+                            set_={"count": stmt.excluded.count},
+                        )
+                    )
+
+            for (user_id, status), count in current.items():
+                if count != 0 and (user_id, status) not in actual:
+                    corrected += 1
+                    await self._session.execute(
+                        update(meeting_counters_table)
+                        .where(counters.user_id == user_id, counters.status == status)
+                        .values(count=0)
+                    )
+
+            return success((corrected, user_ids[-1]))
+        except SQLAlchemyError as e:
+            log.error(f"Failed to reconcile meeting counters: {e}")
+            return failure(e)
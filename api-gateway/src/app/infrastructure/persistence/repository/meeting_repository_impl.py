@@ -1,19 +1,65 @@
 """Meeting repository implementation."""
 
 import logging
+from collections.abc import AsyncIterator, Collection
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    case,
+    cast,
+    func,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer, undefer_group
 
 from app.domain.model.meeting.meeting import Meeting
 from app.domain.model.meeting.meeting_repository import MeetingStatusInProgress
+from app.domain.model.meeting.meeting_search_hit import MeetingSearchHit
+from app.domain.model.meeting.transcript_segment import TranscriptSegment
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_counter_mapping import (
+    meeting_counters_table,
+)
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_mapping import (
+    MEETING_HEAVY_COLUMNS,
+    MEETING_HEAVY_GROUP,
+    SEARCH_CONFIG,
+    meetings_table,
+)
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_segment_mapping import (
+    meeting_segments_table,
+)
 from app.util.enums.status import Status
 from app.util.result import Result, failure, success
+from app.util.snippet import (
+    HIGHLIGHT_MARKERS,
+    HIGHLIGHT_START,
+    HIGHLIGHT_STOP,
+    render_snippet,
+)
 
 log = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming transcript segments
+SEGMENT_STREAM_BATCH_SIZE = 500
+
+# ts_headline options for highlighted search snippets. ts_headline copies
+# markup in the text through verbatim, so it highlights with placeholder
+# markers and render_snippet escapes the fragment before adding <mark>.
+SEARCH_HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP},"
+    " MaxFragments=2, MaxWords=20, MinWords=5"
+)
+
 
 class MeetingRepositoryImpl:
     """SQLAlchemy implementation of MeetingRepository."""
@@ -25,7 +71,9 @@ class MeetingRepositoryImpl:
         """Find meeting by ID."""
         try:
             result = await self._session.execute(
-                select(Meeting).where(Meeting.id == id, Meeting.user_id == user_id)
+                select(Meeting)
+                .where(Meeting.id == id, Meeting.user_id == user_id)
+                .options(undefer_group(MEETING_HEAVY_GROUP))
             )
             meeting = result.scalar_one_or_none()
             return success(meeting)
@@ -33,6 +81,82 @@ class MeetingRepositoryImpl:
             log.error(f"Failed to find meeting by ID: {e}")
             return failure(e)
 
+    async def find_updated_at(
+        self, id: UUID, user_id: UUID
+    ) -> Result[datetime | None, Exception]:
+        """Find only updated_at of a meeting, for cheap revalidation."""
+        try:
+            result = await self._session.execute(
+                select(Meeting.updated_at).where(
+                    Meeting.id == id, Meeting.user_id == user_id
+                )
+            )
+            return success(result.scalar_one_or_none())
+        except SQLAlchemyError as e:
+            log.error(f"Failed to find meeting updated_at: {e}")
+            return failure(e)
+
+    async def stream_segments(self, id: UUID) -> AsyncIterator[TranscriptSegment]:
+        """Stream transcript segments through a server-side cursor."""
+        stmt = (
+            select(
+                meeting_segments_table.c.start,
+                meeting_segments_table.c.end,
+                meeting_segments_table.c.text,
+            )
+            .where(meeting_segments_table.c.meeting_id == id)
+            .order_by(meeting_segments_table.c.seq)
+            .execution_options(yield_per=SEGMENT_STREAM_BATCH_SIZE)
+        )
+
+        try:
+            result = await self._session.stream(stmt)
+            async for start, end, text in result:
+                yield TranscriptSegment(start=start, end=end, text=text)
+        except SQLAlchemyError as e:
+            log.error(f"Failed to stream meeting segments: {e}")
+            raise
+
+    async def find_segments(
+        self,
+        id: UUID,
+        *,
+        start_at: float = 0.0,
+        end_at: float | None = None,
+        limit: int = 500,
+    ) -> Result[list[TranscriptSegment], Exception]:
+        """Find segments overlapping [start_at, end_at) with two index probes."""
+        segments = meeting_segments_table
+        try:
+            # Segments do not overlap, so the last one starting at or before
+            # start_at is the earliest that can still reach into the range
+            lower_bound = (
+                select(func.max(segments.c.start))
+                .where(segments.c.meeting_id == id, segments.c.start <= start_at)
+                .scalar_subquery()
+            )
+            stmt = (
+                select(segments.c.start, segments.c.end, segments.c.text)
+                .where(
+                    segments.c.meeting_id == id,
+                    segments.c.start >= func.coalesce(lower_bound, start_at),
+                    segments.c.end > start_at,
+                )
+                .order_by(segments.c.start)
+                .limit(limit)
+            )
+            if end_at is not None:
+                stmt = stmt.where(segments.c.start < end_at)
+
+            result = await self._session.execute(stmt)
+            return success([
+                TranscriptSegment(start=start, end=end, text=text)
+                for start, end, text in result.all()
+            ])
+        except SQLAlchemyError as e:
+            log.error(f"Failed to find meeting segments: {e}")
+            return failure(e)
+
     async def find_many(
         self,
         *,
@@ -40,10 +164,18 @@ class MeetingRepositoryImpl:
         limit: int = 10,
         offset: int = 0,
         status: Status | None = None,
+        include_fields: Collection[str] = (),
+        after: tuple[datetime, UUID] | None = None,
     ) -> Result[list[Meeting], Exception]:
-        """Find multiple meetings with pagination."""
+        """Find multiple meetings with offset or keyset pagination."""
         try:
-            query = select(Meeting)
+            query = select(Meeting).options(
+                *(
+                    undefer(getattr(Meeting, name))
+                    for name in MEETING_HEAVY_COLUMNS
+                    if name in include_fields
+                )
+            )
 
             if user_id is not None:
                 query = query.where(Meeting.user_id == user_id)
@@ -51,8 +183,14 @@ class MeetingRepositoryImpl:
             if status is not None:
                 query = query.where(Meeting.status == status)
 
+            if after is not None:
+                query = query.where(tuple_(Meeting.created_at, Meeting.id) < after)
+                offset = 0
+
             query = (
-                query.order_by(Meeting.created_at.desc()).limit(limit).offset(offset)
+                query.order_by(Meeting.created_at.desc(), Meeting.id.desc())
+                .limit(limit)
+                .offset(offset)
             )
 
             result = await self._session.execute(query)
@@ -62,6 +200,152 @@ class MeetingRepositoryImpl:
             log.error(f"Failed to find meetings: {e}")
             return failure(e)
 
+    async def search(
+        self,
+        *,
+        user_id: UUID,
+        query: str,
+        limit: int = 20,
+        segments_per_meeting: int = 3,
+    ) -> Result[list[MeetingSearchHit], Exception]:
+        """Rank meetings by title/summary and transcript segment matches."""
+        meetings = meetings_table
+        segments = meeting_segments_table
+        config = cast(literal(SEARCH_CONFIG), REGCONFIG)
+        ts_query = func.websearch_to_tsquery(config, query)
+
+        try:
+            # Both vectors are served by GIN indexes; a meeting's score adds
+            # its title/summary rank to its best transcript segment rank
+            hits = union_all(
+                select(
+                    meetings.c.id.label("meeting_id"),
+                    func.ts_rank_cd(meetings.c.search_vector, ts_query).label("rank"),
+                ).where(
+                    meetings.c.user_id == user_id,
+                    meetings.c.search_vector.bool_op("@@")(ts_query),
+                ),
+                select(
+                    segments.c.meeting_id,
+                    func.max(func.ts_rank_cd(segments.c.search_vector, ts_query)),
+                )
+                .join(meetings, meetings.c.id == segments.c.meeting_id)
+                .where(
+                    meetings.c.user_id == user_id,
+                    segments.c.search_vector.bool_op("@@")(ts_query),
+                )
+                .group_by(segments.c.meeting_id),
+            ).subquery("hits")
+            ranked = (
+                select(hits.c.meeting_id, func.sum(hits.c.rank).label("rank"))
+                .group_by(hits.c.meeting_id)
+                .order_by(func.sum(hits.c.rank).desc(), hits.c.meeting_id)
+                .limit(limit)
+                .subquery("ranked")
+            )
+
+            summary_matches = meetings.c.search_vector.bool_op("@@")(ts_query)
+            meeting_rows = (
+                await self._session.execute(
+                    select(
+                        meetings.c.id,
+                        meetings.c.title,
+                        meetings.c.status,
+                        meetings.c.created_at,
+                        ranked.c.rank,
+                        func.ts_headline(
+                            config,
+                            _without_markers(func.coalesce(meetings.c.summarize, "")),
+                            ts_query,
+                            SEARCH_HEADLINE_OPTIONS,
+                        ).label("snippet"),
+                        summary_matches.label("summary_matches"),
+                    )
+                    .join(ranked, ranked.c.meeting_id == meetings.c.id)
+                    .order_by(ranked.c.rank.desc(), meetings.c.id)
+                )
+            ).all()
+            if not meeting_rows:
+                return success([])
+
+            segment_hits = await self._find_segment_hits(
+                [row.id for row in meeting_rows],
+                ts_query=ts_query,
+                config=config,
+                per_meeting=segments_per_meeting,
+            )
+
+            return success([
+                MeetingSearchHit(
+                    meeting_id=row.id,
+                    title=row.title,
+                    status=row.status,
+                    created_at=row.created_at,
+                    rank=float(row.rank),
+                    snippet=(
+                        render_snippet(row.snippet) if row.summary_matches else None
+                    ),
+                    segments=segment_hits.get(row.id, []),
+                )
+                for row in meeting_rows
+            ])
+        except SQLAlchemyError as e:
+            log.error(f"Failed to search meetings: {e}")
+            return failure(e)
+
+    async def _find_segment_hits(
+        self,
+        meeting_ids: list[UUID],
+        *,
+        ts_query: ColumnElement[Any],
+        config: ColumnElement[Any],
+        per_meeting: int,
+    ) -> dict[UUID, list[TranscriptSegment]]:
+        """First matching segments of each meeting, highlighted."""
+        if per_meeting <= 0:
+            return {}
+
+        segments = meeting_segments_table
+        matches = (
+            select(
+                segments.c.meeting_id,
+                segments.c.start,
+                segments.c.end,
+                segments.c.text,
+                func.row_number()
+                .over(partition_by=segments.c.meeting_id, order_by=segments.c.start)
+                .label("position"),
+            )
+            .where(
+                segments.c.meeting_id.in_(meeting_ids),
+                segments.c.search_vector.bool_op("@@")(ts_query),
+            )
+            .subquery("matches")
+        )
+        # Highlight only the rows that are returned
+        result = await self._session.execute(
+            select(
+                matches.c.meeting_id,
+                matches.c.start,
+                matches.c.end,
+                func.ts_headline(
+                    config,
+                    _without_markers(matches.c.text),
+                    ts_query,
+                    SEARCH_HEADLINE_OPTIONS,
+                ),
+            )
+            .where(matches.c.position <= per_meeting)
+            .order_by(matches.c.meeting_id, matches.c.start)
+        )
+
+        hits: dict[UUID, list[TranscriptSegment]] = {}
+        for meeting_id, start, end, snippet in result.all():
+            hits.setdefault(meeting_id, []).append(
+                TranscriptSegment(start=start, end=end, text=render_snippet(snippet))
+            )
+        return hits
+
     async def find_status_in_progress_by_id(
         self, id: UUID
     ) -> Result[MeetingStatusInProgress | None, Exception]:
@@ -91,12 +375,12 @@ class MeetingRepositoryImpl:
         self, *, user_id: UUID | None = None, status: Status | None = None
     ) -> Result[int, Exception]:
         """Count meetings."""
+        if user_id is not None:
+            return await self._count_from_counters(user_id=user_id, status=status)
+
         try:
             query = select(func.count()).select_from(Meeting)
 
-            if user_id is not None:
-                query = query.where(Meeting.user_id == user_id)
-
             if status is not None:
                 query = query.where(Meeting.status == status)
 
@@ -107,6 +391,51 @@ class MeetingRepositoryImpl:
             log.error(f"Failed to count meetings: {e}")
             return failure(e)
 
+    async def _count_from_counters(
+        self, *, user_id: UUID, status: Status | None
+    ) -> Result[int, Exception]:
+        """Read per-user totals maintained by the meeting_counters trigger."""
+        try:
+            counters = meeting_counters_table.c
+            query = select(func.coalesce(func.sum(counters.count), 0)).where(
+                counters.user_id == user_id
+            )
+
+            if status is not None:
+                query = query.where(counters.status == status)
+
+            result = await self._session.execute(query)
+            return success(int(result.scalar_one()))
+        except SQLAlchemyError as e:
+            log.error(f"Failed to read meeting counters: {e}")
+            return failure(e)
+
+    async def mark_failed(self, id: UUID) -> Result[Status | None, Exception]:
+        """Fail a meeting in progress in one statement, racing no worker."""
+        try:
+            column = meetings_table.c.status
+            in_progress = [status for status in Status if not status.is_terminal]
+            stmt = (
+                update(meetings_table)
+                .where(meetings_table.c.id == id, column.in_(in_progress))
+                .values(
+                    status=case(
+                        *(
+                            (column == status, literal(status.failure, column.type))
+                            for status in in_progress
+                        )
+                    ),
+                    updated_at=func.now(),
+                )
+                .returning(meetings_table.c.status)
+            )
+
+            result = await self._session.execute(stmt)
+            return success(result.scalar_one_or_none())
+        except SQLAlchemyError as e:
+            log.error(f"Failed to mark meeting as failed: {e}")
+            return failure(e)
+
     async def save(self, meeting: Meeting) -> Result[None, Exception]:
         """Save meeting to database."""
         try:
@@ -126,3 +455,8 @@ class MeetingRepositoryImpl:
         except SQLAlchemyError as e:
             log.error(f"Failed to delete meeting: {e}")
             return failure(e)
+
+
+def _without_markers(text: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Drop stray highlight markers so only ts_headline's own become <mark>."""
+    return func.translate(text, HIGHLIGHT_MARKERS, "")
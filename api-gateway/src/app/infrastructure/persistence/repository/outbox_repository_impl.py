@@ -0,0 +1,67 @@
+"""Outbox repository implementation."""
+
+import logging
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.model.outbox.outbox_message import OutboxMessage
+from app.util.enums.outbox_status import OutboxStatus
+from app.util.result import Result, failure, success
+
+log = logging.getLogger(__name__)
+
+
+class OutboxRepositoryImpl:
+    """SQLAlchemy implementation of OutboxRepository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def claim_pending(
+        self, *, limit: int
+    ) -> Result[list[OutboxMessage], Exception]:
+        """Lock due pending messages, skipping rows held by other relays."""
+        try:
+            query = (
+                select(OutboxMessage)
+                .where(
+                    OutboxMessage.status == OutboxStatus.PENDING,
+                    OutboxMessage.available_at <= datetime.now(UTC),
+                )
+                .order_by(OutboxMessage.available_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+
+            result = await self._session.execute(query)
+            messages = list(result.scalars().all())
+            return success(messages)
+        except SQLAlchemyError as e:
+            log.error(f"Failed to claim outbox messages: {e}")
+            return failure(e)
+
+    async def save(self, message: OutboxMessage) -> Result[None, Exception]:
+        """Save outbox message to database."""
+        try:
+            self._session.add(message)
+            await self._session.flush()
+            return success(None)
+        except SQLAlchemyError as e:
+            log.error(f"Failed to save outbox message: {e}")
+            return failure(e)
+
+    async def delete_many(self, ids: Sequence[UUID]) -> Result[None, Exception]:
+        """Delete outbox messages in a single statement."""
+        try:
+            await self._session.execute(
+                delete(OutboxMessage).where(OutboxMessage.id.in_(ids))
+            )
+            return success(None)
+        except SQLAlchemyError as e:
+            log.error(f"Failed to delete outbox messages: {e}")
+            return failure(e)
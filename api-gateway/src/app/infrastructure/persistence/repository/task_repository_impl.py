@@ -1,9 +1,10 @@
 """Task repository implementation."""
 
 import logging
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -37,15 +38,24 @@ class TaskRepositoryImpl:
         limit: int = 10,
         offset: int = 0,
         status: TaskStatus | None = None,
+        after: tuple[datetime, UUID] | None = None,
     ) -> Result[list[Task], Exception]:
-        """Find tasks by meeting ID with pagination."""
+        """Find tasks by meeting ID with offset or keyset pagination."""
         try:
             query = select(Task).where(Task.meeting_id == meeting_id)
 
             if status is not None:
                 query = query.where(Task.status == status)
 
-            query = query.order_by(Task.created_at.desc()).limit(limit).offset(offset)
+            if after is not None:
+                query = query.where(tuple_(Task.created_at, Task.id) < after)
+                offset = 0
+
+            query = (
+                query.order_by(Task.created_at.desc(), Task.id.desc())
+                .limit(limit)
+                .offset(offset)
+            )
 
             result = await self._session.execute(query)
             tasks = list(result.scalars().all())
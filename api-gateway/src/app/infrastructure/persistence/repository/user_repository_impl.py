@@ -8,6 +8,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.model.user.user import User
+from app.domain.model.user.user_identity import UserIdentity
 from app.domain.model.user.user_repository import UserRepository
 from app.util.result import Result, failure, success
 
@@ -34,6 +35,32 @@ class UserRepositoryImpl(UserRepository):
             log.error(f"Failed to find user by auth0_user_id: {e}")
             return failure(e)
 
+    async def find_identity_by_auth0_id(
+        self, auth0_user_id: str
+    ) -> Result[UserIdentity | None, Exception]:
+        """Find user identity by Auth0 user ID without loading the entity."""
+        try:
+            result = await self._session.execute(
+                select(User.id, User.auth0_user_id, User.email, User.user_type).where(
+                    User.auth0_user_id == auth0_user_id
+                )
+            )
+            row = result.one_or_none()
+            if row is None:
+                return success(None)
+
+            return success(
+                UserIdentity(
+                    id=row.id,
+                    auth0_user_id=row.auth0_user_id,
+                    email=row.email,
+                    user_type=row.user_type,
+                )
+            )
+        except SQLAlchemyError as e:
+            log.error(f"Failed to find user identity by auth0_user_id: {e}")
+            return failure(e)
+
     async def save(self, user: User) -> Result[User, Exception]:
         """Save or update user."""
         try:
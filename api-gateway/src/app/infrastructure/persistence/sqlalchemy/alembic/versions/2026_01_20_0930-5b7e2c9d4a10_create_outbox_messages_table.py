@@ -0,0 +1,71 @@
+"""create_outbox_messages_table
+
+Revision ID: 5b7e2c9d4a10
+Revises: 23a8faff22f0
+Create Date: 2026-01-20 09:30:12.481306
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+revision: str = "5b7e2c9d4a10"
+down_revision: str | None = "23a8faff22f0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Create outbox table written in the same transaction as the meeting
+    op.create_table(
+        "outbox_messages",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("task_name", sa.String(length=255), nullable=False),
+        sa.Column("queue", sa.String(length=255), nullable=True),
+        sa.Column(
+            "args", JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False
+        ),
+        sa.Column(
+            "kwargs", JSONB(), server_default=sa.text("'{}'::jsonb"), nullable=False
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("pending", "dead", name="outbox_status"),
+            nullable=False,
+            server_default="pending",
+        ),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "available_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_outbox_messages")),
+    )
+
+    # Partial index so the relay only scans messages that are still pending
+    op.create_index(
+        "ix_outbox_messages_pending_available_at",
+        "outbox_messages",
+        ["available_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_outbox_messages_pending_available_at", table_name="outbox_messages"
+    )
+    op.drop_table("outbox_messages")
+    op.execute("DROP TYPE IF EXISTS outbox_status")
@@ -0,0 +1,80 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 9c41f0e6b2d7
+Revises: 5b7e2c9d4a10
+Create Date: 2026-01-22 10:45:03.117842
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "9c41f0e6b2d7"
+down_revision: str | None = "5b7e2c9d4a10"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Build without locking writes; CONCURRENTLY cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_meetings_user_id_created_at_id",
+            "meetings",
+            ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_tasks_meeting_id_created_at_id",
+            "tasks",
+            ["meeting_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # Single-column indexes are covered by the composite indexes' prefix
+        op.drop_index(
+            "ix_meetings_user_id",
+            table_name="meetings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_meeting_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_meeting_id",
+            "tasks",
+            ["meeting_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_meetings_user_id",
+            "meetings",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_tasks_meeting_id_created_at_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_meetings_user_id_created_at_id",
+            table_name="meetings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,101 @@
+"""create_meeting_counters_table
+
+Revision ID: e3a8d51c7f02
+Revises: 9c41f0e6b2d7
+Create Date: 2026-01-23 14:10:47.902615
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+
+revision: str = "e3a8d51c7f02"
+down_revision: str | None = "9c41f0e6b2d7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Create per-user, per-status meeting counters
+    op.create_table(
+        "meeting_counters",
+        sa.Column("user_id", UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "status",
+            ENUM(name="meeting_status", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "status", name=op.f("pk_meeting_counters")),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_meeting_counters_user_id_users"),
+            ondelete="CASCADE",
+        ),
+    )
+
+    # Keep counters in step with every write to meetings, whichever service
+    # performs it, inside the writer's own transaction
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION meeting_counters_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.user_id IS NOT NULL THEN
+                UPDATE meeting_counters
+                SET count = count - 1
+                WHERE user_id = OLD.user_id AND status = OLD.status;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.user_id IS NOT NULL THEN
+                INSERT INTO meeting_counters (user_id, status, count)
+                VALUES (NEW.user_id, NEW.status, 1)
+                ON CONFLICT (user_id, status)
+                DO UPDATE SET count = meeting_counters.count + 1;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER meetings_counters_insert_delete
+        AFTER INSERT OR DELETE ON meetings
+        FOR EACH ROW EXECUTE FUNCTION meeting_counters_apply()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER meetings_counters_update
+        AFTER UPDATE OF status, user_id ON meetings
+        FOR EACH ROW
+        WHEN (
+            OLD.status IS DISTINCT FROM NEW.status
+            OR OLD.user_id IS DISTINCT FROM NEW.user_id
+        )
+        EXECUTE FUNCTION meeting_counters_apply()
+        """
+    )
+
+    # Backfill from existing meetings
+    op.execute(
+        """
+        INSERT INTO meeting_counters (user_id, status, count)
+        SELECT user_id, status, count(*)
+        FROM meetings
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id, status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS meetings_counters_update ON meetings")
+    op.execute("DROP TRIGGER IF EXISTS meetings_counters_insert_delete ON meetings")
+    op.execute("DROP FUNCTION IF EXISTS meeting_counters_apply()")
+    op.drop_table("meeting_counters")
@@ -0,0 +1,85 @@
+"""create_meeting_segments_table
+
+Revision ID: 7f3b9e21c4a8
+Revises: e3a8d51c7f02
+Create Date: 2026-01-26 10:20:31.540218
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "7f3b9e21c4a8"
+down_revision: str | None = "e3a8d51c7f02"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # One row per timed transcript segment, in transcript order
+    op.create_table(
+        "meeting_segments",
+        sa.Column("meeting_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("start", sa.Float(), nullable=False, comment="Start time in seconds"),
+        sa.Column("end", sa.Float(), nullable=False, comment="End time in seconds"),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("meeting_id", "seq", name=op.f("pk_meeting_segments")),
+        sa.ForeignKeyConstraint(
+            ["meeting_id"],
+            ["meetings.id"],
+            name=op.f("fk_meeting_segments_meeting_id_meetings"),
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "ix_meeting_segments_meeting_id_start",
+        "meeting_segments",
+        ["meeting_id", "start"],
+    )
+
+    # Move segments already stored inline on meetings into the new table
+    op.execute(
+        """
+        INSERT INTO meeting_segments (meeting_id, seq, start, "end", text)
+        SELECT
+            m.id,
+            s.ordinality - 1,
+            (s.value ->> 'start')::float,
+            (s.value ->> 'end')::float,
+            coalesce(s.value ->> 'text', '')
+        FROM meetings AS m
+        CROSS JOIN LATERAL json_array_elements(m.transcribe_segments)
+            WITH ORDINALITY AS s(value, ordinality)
+        WHERE json_typeof(m.transcribe_segments) = 'array'
+        """
+    )
+    op.execute(
+        "UPDATE meetings SET transcribe_segments = NULL "
+        "WHERE transcribe_segments IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE meetings AS m
+        SET transcribe_segments = s.segments
+        FROM (
+            SELECT
+                meeting_id,
+                json_agg(
+                    json_build_object('start', start, 'end', "end", 'text', text)
+                    ORDER BY seq
+                ) AS segments
+            FROM meeting_segments
+            GROUP BY meeting_id
+        ) AS s
+        WHERE m.id = s.meeting_id
+        """
+    )
+    op.drop_index("ix_meeting_segments_meeting_id_start", table_name="meeting_segments")
+    op.drop_table("meeting_segments")
@@ -0,0 +1,188 @@
+"""add_full_text_search_vectors
+
+Revision ID: b58d0a3e6f19
+Revises: 7f3b9e21c4a8
+Create Date: 2026-01-27 09:15:42.083517
+
+"""
+
+import uuid
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+
+revision: str = "b58d0a3e6f19"
+down_revision: str | None = "7f3b9e21c4a8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Rows rewritten per backfill statement, each in its own transaction
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # Nullable columns without a default only touch the catalog; a generated
+    # STORED column would rewrite both tables under an exclusive lock
+    op.add_column("meetings", sa.Column("search_vector", TSVECTOR(), nullable=True))
+    op.add_column(
+        "meeting_segments", sa.Column("search_vector", TSVECTOR(), nullable=True)
+    )
+
+    # Maintained by Postgres on every write, whichever service performs it.
+    # Installed before the backfill so rows written meanwhile are covered.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION meetings_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(NEW.summarize, '')), 'B');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER meetings_search_vector
+        BEFORE INSERT OR UPDATE OF title, summarize ON meetings
+        FOR EACH ROW EXECUTE FUNCTION meetings_search_vector_update()
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION meeting_segments_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('simple', NEW.text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER meeting_segments_search_vector
+        BEFORE INSERT OR UPDATE OF text ON meeting_segments
+        FOR EACH ROW EXECUTE FUNCTION meeting_segments_search_vector_update()
+        """
+    )
+
+    # Backfill in short transactions so row locks are held briefly, then
+    # build without locking writes; CONCURRENTLY cannot run in a transaction.
+    # The backfill writes each row's own value back, which fires the trigger.
+    with op.get_context().autocommit_block():
+        _backfill_meetings()
+        _backfill_meeting_segments()
+
+        op.create_index(
+            "ix_meetings_search_vector",
+            "meetings",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_meeting_segments_search_vector",
+            "meeting_segments",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_meeting_segments_search_vector",
+            table_name="meeting_segments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_meetings_search_vector",
+            table_name="meetings",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS meeting_segments_search_vector ON meeting_segments"
+    )
+    op.execute("DROP FUNCTION IF EXISTS meeting_segments_search_vector_update()")
+    op.execute("DROP TRIGGER IF EXISTS meetings_search_vector ON meetings")
+    op.execute("DROP FUNCTION IF EXISTS meetings_search_vector_update()")
+
+    op.drop_column("meeting_segments", "search_vector")
+    op.drop_column("meetings", "search_vector")
+
+
+def _backfill_meetings() -> None:
+    """Touch title in primary key order so the trigger fills each batch."""
+    bind = op.get_bind()
+    statement = sa.text(
+        """
+        WITH batch AS (
+            SELECT id FROM meetings
+            WHERE id > :after_id
+            ORDER BY id
+            LIMIT :limit
+        )
+        UPDATE meetings AS m
+        SET title = m.title
+        FROM batch
+        WHERE m.id = batch.id
+        RETURNING m.id
+        """
+    ).bindparams(sa.bindparam("after_id", type_=UUID(as_uuid=True)))
+    after_id = uuid.UUID(int=0)
+    while True:
+        ids = (
+            bind.execute(
+                statement, {"after_id": after_id, "limit": BACKFILL_BATCH_SIZE}
+            )
+            .scalars()
+            .all()
+        )
+        if not ids:
+            return
+        after_id = max(ids)
+
+
+def _backfill_meeting_segments() -> None:
+    """Touch text in (meeting_id, seq) order so the trigger fills each batch."""
+    bind = op.get_bind()
+    statement = sa.text(
+        """
+        WITH batch AS (
+            SELECT meeting_id, seq FROM meeting_segments
+            WHERE (meeting_id, seq) > (:after_meeting_id, :after_seq)
+            ORDER BY meeting_id, seq
+            LIMIT :limit
+        )
+        UPDATE meeting_segments AS s
+        SET text = s.text
+        FROM batch
+        WHERE s.meeting_id = batch.meeting_id AND s.seq = batch.seq
+        RETURNING s.meeting_id, s.seq
+        """
+    ).bindparams(sa.bindparam("after_meeting_id", type_=UUID(as_uuid=True)))
+    after = (uuid.UUID(int=0), -1)
+    while True:
+        keys = bind.execute(
+            statement,
+            {
+                "after_meeting_id": after[0],
+                "after_seq": after[1],
+                "limit": BACKFILL_BATCH_SIZE,
+            },
+        ).all()
+        if not keys:
+            return
+        after = max((row.meeting_id, row.seq) for row in keys)
@@ -0,0 +1,56 @@
+"""create_meeting_embeddings_table
+
+Revision ID: c91e4f7a2d63
+Revises: b58d0a3e6f19
+Create Date: 2026-01-28 11:30:18.226904
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+revision: str = "c91e4f7a2d63"
+down_revision: str | None = "b58d0a3e6f19"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Per-meeting semantic index, written when transcription is finalised
+    op.create_table(
+        "meeting_embeddings",
+        sa.Column("meeting_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("version", sa.SmallInteger(), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column(
+            "centroid", sa.LargeBinary(), nullable=False, comment="float32 vector"
+        ),
+        sa.Column(
+            "vectors",
+            sa.LargeBinary(),
+            nullable=False,
+            comment="float16 window matrix",
+        ),
+        sa.Column("starts", ARRAY(sa.Float()), nullable=False),
+        sa.Column("ends", ARRAY(sa.Float()), nullable=False),
+        sa.Column("seq_from", ARRAY(sa.Integer()), nullable=False),
+        sa.Column("seq_to", ARRAY(sa.Integer()), nullable=False),
+        sa.PrimaryKeyConstraint("meeting_id", name=op.f("pk_meeting_embeddings")),
+        sa.ForeignKeyConstraint(
+            ["meeting_id"],
+            ["meetings.id"],
+            name=op.f("fk_meeting_embeddings_meeting_id_meetings"),
+            ondelete="CASCADE",
+        ),
+    )
+    # Float vectors do not compress; skip the wasted pglz attempt on TOAST
+    op.execute(
+        "ALTER TABLE meeting_embeddings ALTER COLUMN vectors SET STORAGE EXTERNAL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("meeting_embeddings")
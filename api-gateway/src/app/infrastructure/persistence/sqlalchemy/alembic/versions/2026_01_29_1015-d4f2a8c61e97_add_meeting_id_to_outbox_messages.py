@@ -0,0 +1,44 @@
+"""add_meeting_id_to_outbox_messages
+
+Revision ID: d4f2a8c61e97
+Revises: c91e4f7a2d63
+Create Date: 2026-01-29 10:15:42.603518
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "d4f2a8c61e97"
+down_revision: str | None = "c91e4f7a2d63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Meeting a message starts, failed by the relay if it gives up; messages
+    # already queued have none. The outbox stays small, so no index.
+    op.add_column(
+        "outbox_messages",
+        sa.Column("meeting_id", UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        op.f("fk_outbox_messages_meeting_id_meetings"),
+        "outbox_messages",
+        "meetings",
+        ["meeting_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        op.f("fk_outbox_messages_meeting_id_meetings"),
+        "outbox_messages",
+        type_="foreignkey",
+    )
+    op.drop_column("outbox_messages", "meeting_id")
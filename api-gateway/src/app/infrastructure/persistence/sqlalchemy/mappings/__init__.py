@@ -1,8 +1,20 @@
 """SQLAlchemy mappings."""
 
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_counter_mapping import (
+    meeting_counters_table,
+)
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_embedding_mapping import (
+    meeting_embeddings_table,
+)
 from app.infrastructure.persistence.sqlalchemy.mappings.meeting_mapping import (
     map_meeting,
 )
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_segment_mapping import (
+    meeting_segments_table,
+)
+from app.infrastructure.persistence.sqlalchemy.mappings.outbox_mapping import (
+    map_outbox_message,
+)
 from app.infrastructure.persistence.sqlalchemy.mappings.task_mapping import map_task
 from app.infrastructure.persistence.sqlalchemy.mappings.user_mapping import map_user
 
@@ -12,6 +24,16 @@ def map_all() -> None:
     map_user()
     map_meeting()
     map_task()
+    map_outbox_message()
 
 
-__all__ = ["map_all", "map_meeting", "map_task", "map_user"]
+__all__ = [
+    "map_all",
+    "map_meeting",
+    "map_outbox_message",
+    "map_task",
+    "map_user",
+    "meeting_counters_table",
+    "meeting_embeddings_table",
+    "meeting_segments_table",
+]
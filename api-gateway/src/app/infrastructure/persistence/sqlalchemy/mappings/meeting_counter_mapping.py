@@ -0,0 +1,39 @@
+"""Meeting counter table.
+
+Per-user, per-status meeting totals. Rows are maintained by the
+meeting_counters_apply trigger on the meetings table, so this table is read
+through Core queries only and has no mapped entity.
+"""
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Enum as SQLEnum,
+    ForeignKey,
+    Table,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+from app.infrastructure.persistence.sqlalchemy.metadata import metadata
+from app.util.enums.status import Status
+
+meeting_counters_table = Table(
+    "meeting_counters",
+    metadata,
+    Column(
+        "user_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "status",
+        SQLEnum(
+            Status,
+            name="meeting_status",
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        primary_key=True,
+    ),
+    Column("count", BigInteger, nullable=False, server_default="0"),
+)
@@ -0,0 +1,42 @@
+"""Meeting embedding table.
+
+Semantic index of each meeting: hashed bag-of-words vectors of ~30 second
+transcript windows plus their normalised mean. Rows are written by the
+transcribe worker and read through Core queries only, so the table has no
+mapped entity.
+"""
+
+from sqlalchemy import (
+    Column,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    Table,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    UUID as PGUUID,
+)
+
+from app.infrastructure.persistence.sqlalchemy.metadata import metadata
+
+meeting_embeddings_table = Table(
+    "meeting_embeddings",
+    metadata,
+    Column(
+        "meeting_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("version", SmallInteger, nullable=False),
+    Column("dimensions", Integer, nullable=False),
+    Column("centroid", LargeBinary, nullable=False, comment="float32 vector"),
+    Column("vectors", LargeBinary, nullable=False, comment="float16 window matrix"),
+    Column("starts", ARRAY(Float), nullable=False),
+    Column("ends", ARRAY(Float), nullable=False),
+    Column("seq_from", ARRAY(Integer), nullable=False),
+    Column("seq_to", ARRAY(Integer), nullable=False),
+)
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Enum as SQLEnum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -13,19 +14,30 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import (
     JSON,
+    TSVECTOR,
     UUID as PGUUID,
 )
+from sqlalchemy.orm import deferred
 
 from app.domain.model.meeting.meeting import Meeting
 from app.infrastructure.persistence.sqlalchemy.metadata import mapper_registry, metadata
 from app.util.enums.status import Status
 
+# Language-agnostic parsing: transcripts are not all in one language. The
+# search_vector triggers use the same configuration.
+SEARCH_CONFIG = "simple"
+
 # Define meetings table
 meetings_table = Table(
     "meetings",
     metadata,
     Column("id", PGUUID(as_uuid=True), primary_key=True),
-    Column("user_id", PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True),
+    Column(
+        "user_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    ),
     Column("title", String(255), nullable=False),
     Column("description", Text, nullable=True),
     Column("audio_url", Text, nullable=True),
@@ -42,6 +54,8 @@ meetings_table = Table(
     ),
     Column("transcribe_text", Text, nullable=True),
     Column("summarize", Text, nullable=True),
+    # Superseded by meeting_segments and no longer mapped; the column stays
+    # until every deployed worker has stopped selecting it
     Column("transcribe_segments", JSON, nullable=True),
     Column("key_notes", JSON, nullable=True),
     Column("transcribe_total", Integer, nullable=False, server_default="0"),
@@ -50,6 +64,34 @@ meetings_table = Table(
     Column("summarize_done", Integer, nullable=False, server_default="0"),
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("updated_at", DateTime(timezone=True), nullable=False),
+    # Weighted title and summary terms, kept current by the
+    # meetings_search_vector trigger. Transcript text is searched through
+    # meeting_segments instead, which keeps this vector well under the
+    # tsvector size limit.
+    Column("search_vector", TSVECTOR, nullable=True),
+)
+
+# Serves per-user listing in (created_at DESC, id DESC) keyset order
+Index(
+    "ix_meetings_user_id_created_at_id",
+    meetings_table.c.user_id,
+    meetings_table.c.created_at.desc(),
+    meetings_table.c.id.desc(),
+)
+
+Index(
+    "ix_meetings_search_vector",
+    meetings_table.c.search_vector,
+    postgresql_using="gin",
+)
+
+
+# Large Text/JSON columns are only loaded when a query asks for them
+MEETING_HEAVY_GROUP = "heavy"
+MEETING_HEAVY_COLUMNS = (
+    "transcribe_text",
+    "summarize",
+    "key_notes",
 )
 
 
@@ -59,4 +101,12 @@ def map_meeting() -> None:
 
     This keeps domain entities clean from SQLAlchemy dependencies.
     """
-    mapper_registry.map_imperatively(Meeting, meetings_table)
+    mapper_registry.map_imperatively(
+        Meeting,
+        meetings_table,
+        properties={
+            name: deferred(meetings_table.c[name], group=MEETING_HEAVY_GROUP)
+            for name in MEETING_HEAVY_COLUMNS
+        },
+        exclude_properties=["search_vector", "transcribe_segments"],
+    )
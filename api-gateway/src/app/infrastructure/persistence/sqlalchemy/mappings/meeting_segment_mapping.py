@@ -0,0 +1,52 @@
+"""Meeting segment table.
+
+Timed transcript segments, one row per segment in transcript order. Rows are
+written by the transcribe worker and read through Core queries only, so the
+table has no mapped entity.
+"""
+
+from sqlalchemy import (
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Table,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import (
+    TSVECTOR,
+    UUID as PGUUID,
+)
+
+from app.infrastructure.persistence.sqlalchemy.metadata import metadata
+
+meeting_segments_table = Table(
+    "meeting_segments",
+    metadata,
+    Column(
+        "meeting_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("seq", Integer, primary_key=True),
+    Column("start", Float, nullable=False, comment="Start time in seconds"),
+    Column("end", Float, nullable=False, comment="End time in seconds"),
+    Column("text", Text, nullable=False),
+    # Kept current by the meeting_segments_search_vector trigger
+    Column("search_vector", TSVECTOR, nullable=True),
+)
+
+# Serves time-range lookups within one meeting
+Index(
+    "ix_meeting_segments_meeting_id_start",
+    meeting_segments_table.c.meeting_id,
+    meeting_segments_table.c.start,
+)
+
+Index(
+    "ix_meeting_segments_search_vector",
+    meeting_segments_table.c.search_vector,
+    postgresql_using="gin",
+)
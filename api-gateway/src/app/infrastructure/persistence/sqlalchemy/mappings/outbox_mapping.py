@@ -0,0 +1,62 @@
+"""Outbox table mapping."""
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum as SQLEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import (
+    JSONB,
+    UUID as PGUUID,
+)
+
+from app.domain.model.outbox.outbox_message import OutboxMessage
+from app.infrastructure.persistence.sqlalchemy.metadata import mapper_registry, metadata
+from app.util.enums.outbox_status import OutboxStatus
+
+outbox_messages_table = Table(
+    "outbox_messages",
+    metadata,
+    Column("id", PGUUID(as_uuid=True), primary_key=True),
+    Column("task_name", String(255), nullable=False),
+    Column("queue", String(255), nullable=True),
+    Column("args", JSONB, nullable=False),
+    Column("kwargs", JSONB, nullable=False),
+    Column(
+        "meeting_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        nullable=True,
+    ),
+    Column(
+        "status",
+        SQLEnum(
+            OutboxStatus,
+            name="outbox_status",
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+        default=OutboxStatus.PENDING,
+    ),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("last_error", Text, nullable=True),
+    Column("available_at", DateTime(timezone=True), nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index(
+        "ix_outbox_messages_pending_available_at",
+        "available_at",
+        postgresql_where=text("status = 'pending'"),
+    ),
+)
+
+
+def map_outbox_message() -> None:
+    """Map OutboxMessage entity to outbox_messages table"""
+    mapper_registry.map_imperatively(OutboxMessage, outbox_messages_table)
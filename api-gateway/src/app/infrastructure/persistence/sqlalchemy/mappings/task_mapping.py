@@ -5,6 +5,7 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     String,
     Table,
     Text,
@@ -43,6 +44,14 @@ tasks_table = Table(
     Column("updated_at", DateTime(timezone=True), nullable=False),
 )
 
+# Serves per-meeting listing in (created_at DESC, id DESC) keyset order
+Index(
+    "ix_tasks_meeting_id_created_at_id",
+    tasks_table.c.meeting_id,
+    tasks_table.c.created_at.desc(),
+    tasks_table.c.id.desc(),
+)
+
 
 def map_task() -> None:
     """Map Task entity to tasks table"""
@@ -0,0 +1,9 @@
+"""Semantic index infrastructure."""
+
+from app.infrastructure.semantic_index.semantic_index_impl import (
+    CentroidIndex,
+    CentroidIndexCache,
+    SemanticIndexImpl,
+)
+
+__all__ = ["CentroidIndex", "CentroidIndexCache", "SemanticIndexImpl"]
@@ -0,0 +1,214 @@
+"""Brute-force semantic index over stored window embeddings.
+
+Search is IVF-style with meetings as the cells: the query is scored
+against each meeting's centroid first, and only the window vectors of the
+n_probe closest meetings are loaded and scored.
+"""
+
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+from cmdn_common.embedding import DIMENSIONS, EMBEDDER_VERSION, embed_texts
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.support.semantic_index.semantic_index import SemanticHit
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_embedding_mapping import (
+    meeting_embeddings_table,
+)
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_mapping import (
+    meetings_table,
+)
+from app.infrastructure.persistence.sqlalchemy.mappings.meeting_segment_mapping import (
+    meeting_segments_table,
+)
+from app.util.result import Result, failure, success
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CentroidIndex:
+    """Centroids of a user's indexed meetings, one row per meeting."""
+
+    meeting_ids: list[UUID]
+    centroids: np.ndarray  # (meetings, DIMENSIONS) float32
+
+
+class CentroidIndexCache(TTLLRUCache[UUID, CentroidIndex]):
+    """Per-user centroid matrices shared by every request of the process."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Window:
+    meeting_id: UUID
+    start: float
+    end: float
+    seq_from: int
+    seq_to: int
+    score: float
+
+
+class SemanticIndexImpl:
+    """Semantic index reading embeddings written by the transcribe worker."""
+
+    def __init__(
+        self,
+        *,
+        session: AsyncSession,
+        centroid_cache: CentroidIndexCache,
+        n_probe: int = 16,
+        min_score: float = 0.05,
+    ) -> None:
+        self._session = session
+        self._centroid_cache = centroid_cache
+        self._n_probe = n_probe
+        self._min_score = min_score
+
+    async def search(
+        self, *, user_id: UUID, query: str, limit: int = 10
+    ) -> Result[list[SemanticHit], Exception]:
+        """Return the windows most similar to query, best first."""
+        query_vector = embed_texts([query])[0]
+        if not query_vector.any():
+            return success([])
+
+        try:
+            index = await self._centroid_index(user_id)
+            if not index.meeting_ids:
+                return success([])
+
+            probe = _top_k(index.centroids @ query_vector, self._n_probe)
+            windows = await self._score_windows(
+                [index.meeting_ids[i] for i in probe], query_vector, limit
+            )
+            texts = await self._window_texts(windows)
+
+            return success([
+                SemanticHit(
+                    meeting_id=window.meeting_id,
+                    start=window.start,
+                    end=window.end,
+                    text=texts.get(window, ""),
+                    score=window.score,
+                )
+                for window in windows
+            ])
+        except SQLAlchemyError as e:
+            log.error(f"Failed to search semantic index: {e}")
+            return failure(e)
+
+    async def _centroid_index(self, user_id: UUID) -> CentroidIndex:
+        """Load the user's centroid matrix, cached for a short TTL."""
+        cached = self._centroid_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        embeddings = meeting_embeddings_table
+        result = await self._session.execute(
+            select(embeddings.c.meeting_id, embeddings.c.centroid)
+            .join(meetings_table, meetings_table.c.id == embeddings.c.meeting_id)
+            .where(
+                meetings_table.c.user_id == user_id,
+                embeddings.c.version == EMBEDDER_VERSION,
+            )
+        )
+        rows = result.all()
+
+        centroids = np.empty((len(rows), DIMENSIONS), dtype=np.float32)
+        for i, row in enumerate(rows):
+            centroids[i] = np.frombuffer(row.centroid, dtype=np.float32)
+
+        index = CentroidIndex(
+            meeting_ids=[row.meeting_id for row in rows], centroids=centroids
+        )
+        self._centroid_cache.set(user_id, index)
+        return index
+
+    async def _score_windows(
+        self, meeting_ids: list[UUID], query_vector: np.ndarray, limit: int
+    ) -> list[_Window]:
+        """Score the windows of the probed meetings and keep the best."""
+        embeddings = meeting_embeddings_table
+        result = await self._session.execute(
+            select(
+                embeddings.c.meeting_id,
+                embeddings.c.vectors,
+                embeddings.c.starts,
+                embeddings.c.ends,
+                embeddings.c.seq_from,
+                embeddings.c.seq_to,
+            ).where(
+                embeddings.c.meeting_id.in_(meeting_ids),
+                embeddings.c.version == EMBEDDER_VERSION,
+            )
+        )
+
+        windows: list[_Window] = []
+        for row in result.all():
+            vectors = np.frombuffer(row.vectors, dtype=np.float16).reshape(
+                -1, DIMENSIONS
+            )
+            scores = vectors.astype(np.float32) @ query_vector
+            for i in _top_k(scores, limit):
+                if scores[i] < self._min_score:
+                    break
+                windows.append(
+                    _Window(
+                        meeting_id=row.meeting_id,
+                        start=row.starts[i],
+                        end=row.ends[i],
+                        seq_from=row.seq_from[i],
+                        seq_to=row.seq_to[i],
+                        score=float(scores[i]),
+                    )
+                )
+
+        windows.sort(key=lambda window: window.score, reverse=True)
+        return windows[:limit]
+
+    async def _window_texts(self, windows: list[_Window]) -> dict[_Window, str]:
+        """Rebuild window text from its segments in one query."""
+        if not windows:
+            return {}
+
+        segments = meeting_segments_table
+        result = await self._session.execute(
+            select(segments.c.meeting_id, segments.c.seq, segments.c.text)
+            .where(
+                or_(
+                    *(
+                        and_(
+                            segments.c.meeting_id == window.meeting_id,
+                            segments.c.seq.between(window.seq_from, window.seq_to),
+                        )
+                        for window in windows
+                    )
+                )
+            )
+            .order_by(segments.c.meeting_id, segments.c.seq)
+        )
+        rows = result.all()
+
+        texts: dict[_Window, str] = {}
+        for window in windows:
+            texts[window] = " ".join(
+                row.text.strip()
+                for row in rows
+                if row.meeting_id == window.meeting_id
+                and window.seq_from <= row.seq <= window.seq_to
+            )
+        return texts
+
+
+def _top_k(scores: np.ndarray, k: int) -> list[int]:
+    """Indices of the k highest scores, highest first."""
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates])].tolist()
@@ -1,5 +1,7 @@
 """Task Queue Implementations"""
 
+from app.infrastructure.task_queue.amqp_queue_impl import AmqpQueueImpl
 from app.infrastructure.task_queue.celery_queue_impl import CeleryQueueImpl
+from app.infrastructure.task_queue.outbox_queue_impl import OutboxQueueImpl
 
-__all__ = ["CeleryQueueImpl"]
+__all__ = ["AmqpQueueImpl", "CeleryQueueImpl", "OutboxQueueImpl"]
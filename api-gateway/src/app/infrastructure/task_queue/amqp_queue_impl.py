@@ -0,0 +1,269 @@
+"""Async AMQP task queue implementation.
+
+Publishes Celery-compatible (protocol v2) messages over a pooled, long-lived
+RabbitMQ connection without touching the event loop's blocking paths. Each
+channel runs in publisher-confirm mode, so a successful publish means the broker
+has taken ownership of the message.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+from typing import Any
+from uuid import UUID, uuid4
+
+from aio_pika import DeliveryMode, ExchangeType, Message, connect_robust
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
+
+from app.domain.support.logger.logger import Logger
+from app.util.result import Result, failure, success
+
+log = logging.getLogger(__name__)
+
+TRANSCRIBE_TASK_NAME = "audio.transcribe.start"
+TRANSCRIBE_QUEUE = "audio.transcribe"
+DEFAULT_QUEUE = "celery"
+
+_PendingPublish = tuple[Message, str, asyncio.Future[None]]
+
+
+class AmqpQueueImpl:
+    """Async task queue publishing to RabbitMQ with confirms and micro-batching."""
+
+    def __init__(
+        self,
+        *,
+        broker_url: str,
+        logger: Logger,
+        connection_pool_size: int = 2,
+        channel_pool_size: int = 10,
+        batch_size: int = 1,
+        batch_linger_ms: int = 5,
+        publish_timeout: float = 10.0,
+    ) -> None:
+        """Initialize publisher.
+
+        A batch_size of 1 publishes every message immediately; larger values
+        let bursts share a single channel and confirm round trip.
+        """
+        self._broker_url = broker_url
+        self._logger = logger
+        self._batch_size = batch_size
+        self._batch_linger = batch_linger_ms / 1000
+        self._publish_timeout = publish_timeout
+        self._origin = f"gen{os.getpid()}@{socket.gethostname()}"
+
+        self._connection_pool: Pool[AbstractRobustConnection] = Pool(
+            self._create_connection, max_size=connection_pool_size
+        )
+        self._channel_pool: Pool[AbstractChannel] = Pool(
+            self._create_channel, max_size=channel_pool_size
+        )
+        self._declared_queues: set[str] = set()
+        self._declare_lock = asyncio.Lock()
+
+        self._pending: asyncio.Queue[_PendingPublish] = asyncio.Queue()
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def send_transcribe_task(
+        self, meeting_id: UUID, audio_url: str
+    ) -> Result[str, Exception]:
+        """Send transcription task to queue."""
+        return await self.send_task(
+            task_name=TRANSCRIBE_TASK_NAME,
+            args=[str(meeting_id), audio_url],
+            queue=TRANSCRIBE_QUEUE,
+        )
+
+    async def send_task(
+        self,
+        *,
+        task_name: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        queue: str | None = None,
+    ) -> Result[str, Exception]:
+        """Generic task sender."""
+        return await self.publish(
+            task_id=str(uuid4()),
+            task_name=task_name,
+            args=args,
+            kwargs=kwargs,
+            queue=queue,
+        )
+
+    async def publish(
+        self,
+        *,
+        task_id: str,
+        task_name: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        queue: str | None = None,
+    ) -> Result[str, Exception]:
+        """Publish a task with a caller-chosen id and wait for the broker confirm."""
+        routing_key = queue or DEFAULT_QUEUE
+        message = self._build_message(
+            task_id=task_id,
+            task_name=task_name,
+            args=args or [],
+            kwargs=kwargs or {},
+        )
+
+        try:
+            await self._ensure_queue(routing_key)
+            if self._batch_size > 1:
+                await self._enqueue(message, routing_key)
+            else:
+                (error,) = await self._publish_batch([(message, routing_key)])
+                if error is not None:
+                    raise error
+        except Exception as e:
+            self._logger.error(f"Failed to send task {task_name}: {e}")
+            return failure(e)
+
+        self._logger.info(f"Task sent: {task_name} ({task_id})")
+        return success(task_id)
+
+    async def close(self) -> None:
+        """Flush pending messages and release broker connections."""
+        if self._flusher is not None:
+            await self._pending.join()
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+
+        await self._channel_pool.close()
+        await self._connection_pool.close()
+
+    def _build_message(
+        self,
+        *,
+        task_id: str,
+        task_name: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+    ) -> Message:
+        """Build a Celery protocol v2 message."""
+        body = json.dumps([
+            args,
+            kwargs,
+            {"callbacks": None, "errbacks": None, "chain": None, "chord": None},
+        ]).encode()
+        headers = {
+            "lang": "py",
+            "task": task_name,
+            "id": task_id,
+            "shadow": None,
+            "eta": None,
+            "expires": None,
+            "group": None,
+            "group_index": None,
+            "retries": 0,
+            "timelimit": [None, None],
+            "root_id": task_id,
+            "parent_id": None,
+            "argsrepr": repr(args),
+            "kwargsrepr": repr(kwargs),
+            "origin": self._origin,
+            "ignore_result": False,
+        }
+        return Message(
+            body,
+            headers=headers,
+            content_type="application/json",
+            content_encoding="utf-8",
+            correlation_id=task_id,
+            delivery_mode=DeliveryMode.PERSISTENT,
+        )
+
+    async def _create_connection(self) -> AbstractRobustConnection:
+        return await connect_robust(self._broker_url)
+
+    async def _create_channel(self) -> AbstractChannel:
+        async with self._connection_pool.acquire() as connection:
+            return await connection.channel(publisher_confirms=True)
+
+    async def _ensure_queue(self, queue: str) -> None:
+        """Declare the queue the same way Celery workers do, once per process."""
+        if queue in self._declared_queues:
+            return
+
+        async with self._declare_lock:
+            if queue in self._declared_queues:
+                return
+            async with self._channel_pool.acquire() as channel:
+                exchange = await channel.declare_exchange(
+                    queue, ExchangeType.DIRECT, durable=True
+                )
+                declared = await channel.declare_queue(queue, durable=True)
+                await declared.bind(exchange, routing_key=queue)
+            self._declared_queues.add(queue)
+
+    async def _enqueue(self, message: Message, routing_key: str) -> None:
+        """Hand a message to the batch flusher and wait for its confirm."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await self._pending.put((message, routing_key, future))
+
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+        await future
+
+    async def _flush_loop(self) -> None:
+        """Drain pending messages in batches of up to batch_size."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            deadline = loop.time() + self._batch_linger
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                except TimeoutError:
+                    break
+
+            try:
+                errors = await self._publish_batch([(m, k) for m, k, _ in batch])
+            except Exception as e:
+                errors = [e] * len(batch)
+
+            for (_, _, future), error in zip(batch, errors, strict=True):
+                if not future.done():
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+                self._pending.task_done()
+
+    async def _publish_batch(
+        self, batch: list[tuple[Message, str]]
+    ) -> list[BaseException | None]:
+        """Publish messages on one channel, awaiting all confirms together."""
+        async with self._channel_pool.acquire() as channel:
+            exchange = channel.default_exchange
+            results = await asyncio.gather(
+                *(
+                    exchange.publish(
+                        message,
+                        routing_key=routing_key,
+                        mandatory=True,
+                        timeout=self._publish_timeout,
+                    )
+                    for message, routing_key in batch
+                ),
+                return_exceptions=True,
+            )
+
+        errors = [r if isinstance(r, BaseException) else None for r in results]
+        failed = sum(error is not None for error in errors)
+        if failed:
+            log.error("AMQP publish: %d of %d failed.", failed, len(batch))
+        return errors
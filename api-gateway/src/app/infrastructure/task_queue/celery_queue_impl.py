@@ -1,5 +1,6 @@
 """Celery task queue implementation."""
 
+import asyncio
 import logging
 from typing import Any
 from uuid import UUID
@@ -13,14 +14,17 @@ log = logging.getLogger(__name__)
 
 
 class CeleryQueueImpl:
-    """Celery task queue implementation."""
+    """Celery task queue implementation.
+
+    Celery's producer is blocking, so publishing is moved off the event loop.
+    """
 
     def __init__(self, *, celery_app: Celery, logger: Logger) -> None:
         """Initialize with Celery app instance."""
         self._celery = celery_app
         self._logger = logger
 
-    def send_transcribe_task(
+    async def send_transcribe_task(
         self,
         meeting_id: UUID,
         audio_url: str,
@@ -29,7 +33,8 @@ class CeleryQueueImpl:
         try:
             self._logger.info(f"Sending transcribe task for meeting: {meeting_id}")
 
-            result = self._celery.send_task(
+            result = await asyncio.to_thread(
+                self._celery.send_task,
                 "audio.transcribe.start",  # Clean task name
                 args=[str(meeting_id), audio_url],
                 queue="audio.transcribe",  # Clean queue name
@@ -41,7 +46,7 @@ class CeleryQueueImpl:
             self._logger.error(f"Failed to send transcribe task: {e}")
             return failure(e)
 
-    def send_task(
+    async def send_task(
         self,
         *,
         task_name: str,
@@ -53,7 +58,8 @@ class CeleryQueueImpl:
         try:
             self._logger.info(f"Sending task: {task_name}")
 
-            result = self._celery.send_task(
+            result = await asyncio.to_thread(
+                self._celery.send_task,
                 task_name,
                 args=args or [],
                 kwargs=kwargs or {},
@@ -0,0 +1,65 @@
+"""Outbox-backed task queue implementation."""
+
+from typing import Any
+from uuid import UUID
+
+from app.domain.model.outbox.outbox_message import OutboxMessage
+from app.domain.model.outbox.outbox_repository import OutboxRepository
+from app.domain.support.logger.logger import Logger
+from app.infrastructure.task_queue.amqp_queue_impl import (
+    TRANSCRIBE_QUEUE,
+    TRANSCRIBE_TASK_NAME,
+)
+from app.util.result import Result, failure, success
+
+
+class OutboxQueueImpl:
+    """
+    Task queue that records tasks in the transactional outbox.
+
+    Nothing reaches the broker until the caller commits; the outbox relay then
+    publishes the message using its ID as the Celery task ID.
+    """
+
+    def __init__(self, *, outbox_repository: OutboxRepository, logger: Logger) -> None:
+        self._outbox_repository = outbox_repository
+        self._logger = logger
+
+    async def send_transcribe_task(
+        self, meeting_id: UUID, audio_url: str
+    ) -> Result[str, Exception]:
+        """Record transcription task in the outbox."""
+        return await self._record(
+            OutboxMessage.create(
+                task_name=TRANSCRIBE_TASK_NAME,
+                args=[str(meeting_id), audio_url],
+                queue=TRANSCRIBE_QUEUE,
+                meeting_id=meeting_id,
+            )
+        )
+
+    async def send_task(
+        self,
+        *,
+        task_name: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        queue: str | None = None,
+    ) -> Result[str, Exception]:
+        """Generic task sender"""
+        return await self._record(
+            OutboxMessage.create(
+                task_name=task_name, queue=queue, args=args, kwargs=kwargs
+            )
+        )
+
+    async def _record(self, message: OutboxMessage) -> Result[str, Exception]:
+        save_result = await self._outbox_repository.save(message)
+        if not save_result.success:
+            self._logger.error(f"Failed to record task {message.task_name} in outbox")
+            return failure(save_result.error)
+
+        self._logger.info(
+            f"Task recorded in outbox: {message.task_name} ({message.id})"
+        )
+        return success(str(message.id))
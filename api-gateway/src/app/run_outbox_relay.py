@@ -0,0 +1,33 @@
+"""Run standalone outbox relay."""
+
+import asyncio
+import logging
+import signal
+
+from app.di_container import create_container
+from app.di_container.settings import settings
+from app.handler.relay import run_outbox_relay
+from app.infrastructure.persistence.sqlalchemy.mappings import map_all
+
+
+async def main() -> None:
+    """Relay outbox messages until SIGINT/SIGTERM."""
+    map_all()
+    container = create_container()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await run_outbox_relay(container, stop)
+    finally:
+        await container.close()
+
+
+if __name__ == "__main__":
+    import uvloop
+
+    logging.basicConfig(level=settings.logging.level, format=settings.logging.format)
+    uvloop.run(main())
@@ -0,0 +1,34 @@
+"""Run meeting counter reconciliation once (schedule with cron)."""
+
+import logging
+import sys
+
+from app.di_container import create_container
+from app.di_container.settings import settings
+from app.infrastructure.persistence.sqlalchemy.mappings import map_all
+from app.use_case.reconcile_meeting_counters_use_case import (
+    ReconcileMeetingCountersUseCase,
+    ReconcileMeetingCountersUseCaseInput,
+)
+
+
+async def main() -> int:
+    """Reconcile all users' meeting counters, returning the exit code."""
+    map_all()
+    container = create_container()
+
+    try:
+        async with container() as request_container:
+            use_case = await request_container.get(ReconcileMeetingCountersUseCase)
+            result = await use_case.execute(ReconcileMeetingCountersUseCaseInput())
+    finally:
+        await container.close()
+
+    return 0 if result.success else 1
+
+
+if __name__ == "__main__":
+    import uvloop
+
+    logging.basicConfig(level=settings.logging.level, format=settings.logging.format)
+    sys.exit(uvloop.run(main()))
@@ -66,7 +66,7 @@ class CreateUserUseCase:
 
         try:
             # Check if user already exists
-            existing_result = await self._user_repo.find_by_auth0_id(
+            existing_result = await self._user_repo.find_identity_by_auth0_id(
                 input.auth0_user_id
             )
             if not existing_result.success:
@@ -83,7 +83,7 @@ class CreateUserUseCase:
                         auth0_user_id=user.auth0_user_id,
                         email=user.email,
                         user_type=user.user_type,
-                        daily_quota_seconds=user.get_daily_quota_seconds(),
+                        daily_quota_seconds=user.user_type.get_daily_quota_seconds(),
                     )
                 )
 
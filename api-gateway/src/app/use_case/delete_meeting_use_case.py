@@ -6,6 +6,8 @@ from uuid import UUID
 
 from app.domain.model.meeting.meeting_repository import MeetingRepository
 from app.domain.support.logger.logger import Logger
+from app.domain.support.meeting_cache.meeting_cache import MeetingCache
+from app.domain.support.meeting_status.meeting_status_cache import MeetingStatusCache
 from app.infrastructure.db_client.transaction_manager import TransactionManager
 from app.util.result import Result, failure, success
 
@@ -33,10 +35,14 @@ class DeleteMeetingUseCase:
         self,
         *,
         meeting_repository: MeetingRepository,
+        meeting_cache: MeetingCache,
+        meeting_status_cache: MeetingStatusCache,
         transaction_manager: TransactionManager,
         logger: Logger,
     ) -> None:
         self._meeting_repository = meeting_repository
+        self._meeting_cache = meeting_cache
+        self._meeting_status_cache = meeting_status_cache
         self._transaction_manager = transaction_manager
         self._logger = logger
 
@@ -63,6 +69,8 @@ class DeleteMeetingUseCase:
                 return failure(delete_result.error)
 
             await self._transaction_manager.commit()
+            await self._meeting_status_cache.invalidate(input.meeting_id)
+            await self._meeting_cache.invalidate(input.meeting_id)
 
             self._logger.info(f"Delete meeting: done. ID: '{input.meeting_id}'")
 
@@ -0,0 +1,96 @@
+"""Export meeting transcript use case."""
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.model.meeting.meeting_repository import MeetingRepository
+from app.domain.model.user.user_repository import UserRepository
+from app.domain.support.logger.logger import Logger
+from app.use_case.interfaces import UseCase
+from app.util.enums.transcript_format import TranscriptFormat
+from app.util.exceptions import DatabaseError, MeetingNotFoundException, UnexpectedError
+from app.util.result import Result, failure, success
+from app.util.transcript_writer import render_transcript
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportTranscriptUseCaseInput:
+    """Input for export transcript use case."""
+
+    meeting_id: UUID
+    auth0_user_id: str
+    format: TranscriptFormat
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportTranscriptUseCaseOutput:
+    """Output for export transcript use case."""
+
+    filename: str
+    media_type: str
+    # Rendered lazily from the database while the response is being sent
+    content: AsyncIterator[bytes]
+
+
+ExportTranscriptUseCaseException = (
+    MeetingNotFoundException | DatabaseError | UnexpectedError
+)
+
+
+class ExportTranscriptUseCase(
+    UseCase[
+        ExportTranscriptUseCaseInput,
+        ExportTranscriptUseCaseOutput,
+        ExportTranscriptUseCaseException,
+    ]
+):
+    """Export a meeting transcript as a subtitle, text or JSON file."""
+
+    def __init__(
+        self,
+        *,
+        meeting_repository: MeetingRepository,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> None:
+        self._meeting_repository = meeting_repository
+        self._user_repository = user_repository
+        self._logger = logger
+
+    async def execute(
+        self, input: ExportTranscriptUseCaseInput
+    ) -> Result[ExportTranscriptUseCaseOutput, ExportTranscriptUseCaseException]:
+        """Execute export transcript use case."""
+        self._logger.info(
+            f"Export transcript: started. ID: '{input.meeting_id}', "
+            f"Format: '{input.format}'"
+        )
+
+        user_result = await self._user_repository.find_identity_by_auth0_id(
+            input.auth0_user_id
+        )
+        if not user_result.success or user_result.data is None:
+            self._logger.error(f"User not found: {input.auth0_user_id}")
+            return failure(UnexpectedError(f"User not found: {input.auth0_user_id}"))
+
+        # Check ownership up front; the segments are only read while streaming
+        owned_result = await self._meeting_repository.find_updated_at(
+            input.meeting_id, user_result.data.id
+        )
+        if owned_result.success is False:
+            self._logger.error(f"Database error: {owned_result.error}")
+            return failure(DatabaseError(str(owned_result.error)))
+
+        if owned_result.data is None:
+            return failure(MeetingNotFoundException(input.meeting_id))
+
+        segments = self._meeting_repository.stream_segments(input.meeting_id)
+
+        return success(
+            ExportTranscriptUseCaseOutput(
+                filename=f"{input.meeting_id}.{input.format.value}",
+                media_type=input.format.media_type,
+                content=render_transcript(segments, input.format),
+            )
+        )
@@ -7,7 +7,10 @@ from uuid import UUID
 
 from app.domain.model.task.task_repository import TaskRepository
 from app.domain.support.logger.logger import Logger
+from app.util.cursor import decode_cursor, encode_cursor
 from app.util.enums.task_status import TaskStatus
+from app.util.etag import weak_etag
+from app.util.exceptions import BadRequestError
 from app.util.result import Result, failure, success
 
 log = logging.getLogger(__name__)
@@ -21,6 +24,8 @@ class FindManyTaskUseCaseInput:
     limit: int = 10
     offset: int = 0
     status: TaskStatus | None = None
+    cursor: str | None = None
+    include_total: bool = True
 
 
 @dataclass(frozen=True)
@@ -43,9 +48,11 @@ class FindManyTaskUseCaseOutput:
     """Output for find many tasks use case."""
 
     items: list[TaskItem]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
+    etag: str = ""
 
 
 class FindManyTaskUseCase:
@@ -65,28 +72,43 @@ class FindManyTaskUseCase:
         """Execute find many tasks use case."""
         self._logger.info(f"Find tasks for meeting: {input.meeting_id}")
 
+        after = None
+        if input.cursor is not None:
+            try:
+                after = decode_cursor(input.cursor)
+            except BadRequestError as e:
+                return failure(e)
+
+        # One extra row tells whether a next page exists
         tasks_result = await self._task_repository.find_by_meeting_id(
             input.meeting_id,
-            limit=input.limit,
+            limit=input.limit + 1,
             offset=input.offset,
             status=input.status,
+            after=after,
         )
 
         if tasks_result.is_failure():
             self._logger.error(f"Failed to find tasks: {tasks_result.error}")
             return failure(tasks_result.error)
 
-        count_result = await self._task_repository.count_by_meeting_id(
-            input.meeting_id,
-            status=input.status,
-        )
+        total = None
+        if input.include_total:
+            count_result = await self._task_repository.count_by_meeting_id(
+                input.meeting_id,
+                status=input.status,
+            )
+
+            if count_result.is_failure():
+                self._logger.error(f"Failed to count tasks: {count_result.error}")
+                return failure(count_result.error)
 
-        if count_result.is_failure():
-            self._logger.error(f"Failed to count tasks: {count_result.error}")
-            return failure(count_result.error)
+            total = count_result.data
 
-        tasks = tasks_result.data
-        total = count_result.data
+        tasks = tasks_result.data[: input.limit]
+        next_cursor = None
+        if len(tasks_result.data) > input.limit:
+            next_cursor = encode_cursor(tasks[-1].created_at, tasks[-1].id)
 
         items = [
             TaskItem(
@@ -108,6 +130,12 @@ class FindManyTaskUseCase:
             total=total,
             limit=input.limit,
             offset=input.offset,
+            next_cursor=next_cursor,
+            etag=weak_etag(
+                total,
+                next_cursor,
+                *(f"{task.id}@{task.updated_at.isoformat()}" for task in tasks),
+            ),
         )
 
         self._logger.info(f"Find tasks: done. Found {len(items)} tasks")
@@ -3,20 +3,31 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 from uuid import UUID
 
+from app.domain.model.meeting.meeting import Meeting
 from app.domain.model.meeting.meeting_repository import MeetingRepository
 from app.domain.model.user.user_repository import UserRepository
 from app.domain.support.logger.logger import Logger
 from app.use_case.interfaces import UseCase
+from app.util.cursor import decode_cursor, encode_cursor
 from app.util.enums.status import Status
-from app.util.exceptions import DatabaseError, UnexpectedError
+from app.util.etag import weak_etag
+from app.util.exceptions import BadRequestError, DatabaseError, UnexpectedError
 from app.util.result import Result, failure, success
 
 log = logging.getLogger(__name__)
 
 
+# Columns only returned when requested through `fields`
+MEETING_LIST_OPTIONAL_FIELDS = frozenset({
+    "transcribe_text",
+    "summarize",
+    "key_notes",
+})
+
+
 class MeetingListItem(TypedDict):
     """Single meeting item in list."""
 
@@ -27,10 +38,9 @@ class MeetingListItem(TypedDict):
     audio_url: str | None
     duration: float | None
     status: Status
-    transcribe_text: str | None
-    summarize: str | None
-    transcribe_segments: list | None
-    key_notes: list | None
+    transcribe_text: NotRequired[str | None]
+    summarize: NotRequired[str | None]
+    key_notes: NotRequired[list | None]
     transcribe_total: int
     transcribe_done: int
     summarize_total: int
@@ -47,18 +57,23 @@ class FindMeetingListUseCaseInput:
     limit: int = 10
     offset: int = 0
     status: Status | None = None
+    fields: frozenset[str] = frozenset()
+    cursor: str | None = None
+    include_total: bool = True
 
 
 class FindMeetingListUseCaseOutput(TypedDict):
     """Output for find meeting list use case."""
 
     items: list[MeetingListItem]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None
+    etag: str
 
 
-FindMeetingListUseCaseException = DatabaseError | UnexpectedError
+FindMeetingListUseCaseException = BadRequestError | DatabaseError | UnexpectedError
 
 
 class FindMeetingListUseCase(
@@ -92,63 +107,98 @@ class FindMeetingListUseCase(
         )
 
         # Get user from auth0_user_id
-        user_result = await self._user_repository.find_by_auth0_id(input.auth0_user_id)
+        user_result = await self._user_repository.find_identity_by_auth0_id(
+            input.auth0_user_id
+        )
         if not user_result.success or user_result.data is None:
             self._logger.error(f"User not found: {input.auth0_user_id}")
             return failure(UnexpectedError(f"User not found: {input.auth0_user_id}"))
 
         user = user_result.data
 
-        # Find meetings by user_id
+        after = None
+        if input.cursor is not None:
+            try:
+                after = decode_cursor(input.cursor)
+            except BadRequestError as e:
+                return failure(e)
+
+        # Find meetings by user_id, one extra row tells whether a next page exists
         find_result = await self._meeting_repository.find_many(
             user_id=user.id,
-            limit=input.limit,
+            limit=input.limit + 1,
             offset=input.offset,
             status=input.status,
+            include_fields=input.fields,
+            after=after,
         )
 
         if find_result.success is False:
             self._logger.error(f"Database error: {find_result.error}")
             return failure(DatabaseError(str(find_result.error)))
 
-        count_result = await self._meeting_repository.count(
-            user_id=user.id, status=input.status
-        )
-
-        if count_result.success is False:
-            self._logger.error(f"Database error: {count_result.error}")
-            return failure(DatabaseError(str(count_result.error)))
-
-        items = [
-            MeetingListItem(
-                id=meeting.id,
-                user_id=meeting.user_id,
-                title=meeting.title,
-                description=meeting.description,
-                audio_url=meeting.audio_url,
-                duration=meeting.duration,
-                status=meeting.status,
-                transcribe_text=meeting.transcribe_text,
-                summarize=meeting.summarize,
-                transcribe_segments=meeting.transcribe_segments,
-                key_notes=meeting.key_notes,
-                transcribe_total=meeting.transcribe_total,
-                transcribe_done=meeting.transcribe_done,
-                summarize_total=meeting.summarize_total,
-                summarize_done=meeting.summarize_done,
-                created_at=meeting.created_at,
-                updated_at=meeting.updated_at,
+        total = None
+        if input.include_total:
+            count_result = await self._meeting_repository.count(
+                user_id=user.id, status=input.status
             )
-            for meeting in find_result.data
-        ]
+
+            if count_result.success is False:
+                self._logger.error(f"Database error: {count_result.error}")
+                return failure(DatabaseError(str(count_result.error)))
+
+            total = count_result.data
+
+        meetings = find_result.data[: input.limit]
+        next_cursor = None
+        if len(find_result.data) > input.limit:
+            last = meetings[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        items = [self._to_item(meeting, input.fields) for meeting in meetings]
+        etag = weak_etag(
+            total,
+            next_cursor,
+            *(f"{meeting.id}@{meeting.updated_at.isoformat()}" for meeting in meetings),
+        )
 
         self._logger.info(f"Find meeting list: done. Found {len(items)} meetings")
 
         return success(
             FindMeetingListUseCaseOutput(
                 items=items,
-                total=count_result.data,
+                total=total,
                 limit=input.limit,
                 offset=input.offset,
+                next_cursor=next_cursor,
+                etag=etag,
             )
         )
+
+    @staticmethod
+    def _to_item(meeting: Meeting, fields: frozenset[str]) -> MeetingListItem:
+        """Build list item, adding heavy columns only when requested."""
+        item = MeetingListItem(
+            id=meeting.id,
+            user_id=meeting.user_id,
+            title=meeting.title,
+            description=meeting.description,
+            audio_url=meeting.audio_url,
+            duration=meeting.duration,
+            status=meeting.status,
+            transcribe_total=meeting.transcribe_total,
+            transcribe_done=meeting.transcribe_done,
+            summarize_total=meeting.summarize_total,
+            summarize_done=meeting.summarize_done,
+            created_at=meeting.created_at,
+            updated_at=meeting.updated_at,
+        )
+
+        if "transcribe_text" in fields:
+            item["transcribe_text"] = meeting.transcribe_text
+        if "summarize" in fields:
+            item["summarize"] = meeting.summarize
+        if "key_notes" in fields:
+            item["key_notes"] = meeting.key_notes
+
+        return item
@@ -0,0 +1,105 @@
+"""Find meeting segments by time range use case."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.model.meeting.meeting_repository import MeetingRepository
+from app.domain.model.meeting.transcript_segment import TranscriptSegment
+from app.domain.model.user.user_repository import UserRepository
+from app.domain.support.logger.logger import Logger
+from app.use_case.interfaces import UseCase
+from app.util.exceptions import (
+    BadRequestError,
+    DatabaseError,
+    MeetingNotFoundException,
+    UnexpectedError,
+)
+from app.util.result import Result, failure, success
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FindMeetingSegmentsUseCaseInput:
+    """Input for find meeting segments use case."""
+
+    meeting_id: UUID
+    auth0_user_id: str
+    start_at: float = 0.0
+    end_at: float | None = None
+    limit: int = 500
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FindMeetingSegmentsUseCaseOutput:
+    """Output for find meeting segments use case."""
+
+    segments: list[TranscriptSegment]
+
+
+FindMeetingSegmentsUseCaseException = (
+    MeetingNotFoundException | BadRequestError | DatabaseError | UnexpectedError
+)
+
+
+class FindMeetingSegmentsUseCase(
+    UseCase[
+        FindMeetingSegmentsUseCaseInput,
+        FindMeetingSegmentsUseCaseOutput,
+        FindMeetingSegmentsUseCaseException,
+    ]
+):
+    """Find the transcript segments of a meeting within a time range."""
+
+    def __init__(
+        self,
+        *,
+        meeting_repository: MeetingRepository,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> None:
+        self._meeting_repository = meeting_repository
+        self._user_repository = user_repository
+        self._logger = logger
+
+    async def execute(
+        self, input: FindMeetingSegmentsUseCaseInput
+    ) -> Result[FindMeetingSegmentsUseCaseOutput, FindMeetingSegmentsUseCaseException]:
+        """Execute find meeting segments use case."""
+        self._logger.info(
+            f"Find meeting segments: started. ID: '{input.meeting_id}', "
+            f"Range: {input.start_at}-{input.end_at}"
+        )
+
+        if input.end_at is not None and input.end_at <= input.start_at:
+            return failure(BadRequestError("'to' must be greater than 'from'"))
+
+        user_result = await self._user_repository.find_identity_by_auth0_id(
+            input.auth0_user_id
+        )
+        if not user_result.success or user_result.data is None:
+            self._logger.error(f"User not found: {input.auth0_user_id}")
+            return failure(UnexpectedError(f"User not found: {input.auth0_user_id}"))
+
+        owned_result = await self._meeting_repository.find_updated_at(
+            input.meeting_id, user_result.data.id
+        )
+        if owned_result.success is False:
+            self._logger.error(f"Database error: {owned_result.error}")
+            return failure(DatabaseError(str(owned_result.error)))
+
+        if owned_result.data is None:
+            return failure(MeetingNotFoundException(input.meeting_id))
+
+        segments_result = await self._meeting_repository.find_segments(
+            input.meeting_id,
+            start_at=input.start_at,
+            end_at=input.end_at,
+            limit=input.limit,
+        )
+        if segments_result.success is False:
+            self._logger.error(f"Database error: {segments_result.error}")
+            return failure(DatabaseError(str(segments_result.error)))
+
+        self._logger.info(
+            f"Find meeting segments: done. Count: {len(segments_result.data)}"
+        )
+        return success(FindMeetingSegmentsUseCaseOutput(segments=segments_result.data))
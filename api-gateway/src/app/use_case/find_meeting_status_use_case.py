@@ -6,6 +6,7 @@ from uuid import UUID
 
 from app.domain.model.meeting.meeting_repository import MeetingRepository
 from app.domain.support.logger.logger import Logger
+from app.domain.support.meeting_status.meeting_status_cache import MeetingStatusCache
 from app.util.enums.status import Status
 from app.util.result import Result, failure, success
 
@@ -37,9 +38,11 @@ class FindMeetingStatusUseCase:
     def __init__(
         self,
         meeting_repository: MeetingRepository,
+        meeting_status_cache: MeetingStatusCache,
         logger: Logger,
     ) -> None:
         self._meeting_repository = meeting_repository
+        self._meeting_status_cache = meeting_status_cache
         self._logger = logger
 
     async def execute(
@@ -48,15 +51,19 @@ class FindMeetingStatusUseCase:
         """Execute get meeting status use case."""
         self._logger.info(f"Get meeting status: {input.meeting_id}")
 
-        result = await self._meeting_repository.find_status_in_progress_by_id(
-            input.meeting_id
-        )
+        # Workers keep a snapshot in Redis; fall back to Postgres without one
+        meeting = await self._meeting_status_cache.get(input.meeting_id)
+        if meeting is None:
+            result = await self._meeting_repository.find_status_in_progress_by_id(
+                input.meeting_id
+            )
+
+            if result.is_failure():
+                self._logger.error(f"Failed to get meeting status: {result.error}")
+                return failure(result.error)
 
-        if result.is_failure():
-            self._logger.error(f"Failed to get meeting status: {result.error}")
-            return failure(result.error)
+            meeting = result.data
 
-        meeting = result.data
         if meeting is None:
             error = Exception(f"Meeting not found: {input.meeting_id}")
             self._logger.error(str(error))
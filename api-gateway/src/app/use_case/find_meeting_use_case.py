@@ -2,13 +2,17 @@
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from app.domain.model.meeting.meeting import Meeting
 from app.domain.model.meeting.meeting_repository import MeetingRepository
 from app.domain.model.user.user_repository import UserRepository
 from app.domain.support.logger.logger import Logger
+from app.domain.support.meeting_cache.meeting_cache import MeetingCache
+from app.domain.support.meeting_cache.meeting_view_loader import MeetingViewLoader
 from app.use_case.interfaces import UseCase
+from app.util.etag import etag_matches, weak_etag
 from app.util.exceptions import DatabaseError, MeetingNotFoundException, UnexpectedError
 from app.util.result import Result, failure, success
 
@@ -21,13 +25,25 @@ class FindMeetingUseCaseInput:
 
     meeting_id: UUID
     auth0_user_id: str
+    if_none_match: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FindMeetingUseCaseOutput:
+    """Output for find meeting use case."""
+
+    etag: str
+    # None when the client's copy (If-None-Match) is still current
+    meeting: Meeting | None
 
 
 FindMeetingUseCaseException = MeetingNotFoundException | DatabaseError | UnexpectedError
 
 
 class FindMeetingUseCase(
-    UseCase[FindMeetingUseCaseInput, Meeting, FindMeetingUseCaseException]
+    UseCase[
+        FindMeetingUseCaseInput, FindMeetingUseCaseOutput, FindMeetingUseCaseException
+    ]
 ):
     """Find meeting by ID use case."""
 
@@ -36,15 +52,19 @@ class FindMeetingUseCase(
         *,
         meeting_repository: MeetingRepository,
         user_repository: UserRepository,
+        meeting_cache: MeetingCache,
+        meeting_view_loader: MeetingViewLoader,
         logger: Logger,
     ) -> None:
         self._meeting_repository = meeting_repository
         self._user_repository = user_repository
+        self._meeting_cache = meeting_cache
+        self._meeting_view_loader = meeting_view_loader
         self._logger = logger
 
     async def execute(
         self, input: FindMeetingUseCaseInput
-    ) -> Result[Meeting, FindMeetingUseCaseException]:
+    ) -> Result[FindMeetingUseCaseOutput, FindMeetingUseCaseException]:
         """Execute find meeting use case."""
         self._logger.debug("execute find-meeting-use-case")
         self._logger.info(
@@ -52,24 +72,61 @@ class FindMeetingUseCase(
         )
 
         # Get user from auth0_user_id
-        user_result = await self._user_repository.find_by_auth0_id(input.auth0_user_id)
+        user_result = await self._user_repository.find_identity_by_auth0_id(
+            input.auth0_user_id
+        )
         if not user_result.success or user_result.data is None:
             self._logger.error(f"User not found: {input.auth0_user_id}")
             return failure(UnexpectedError(f"User not found: {input.auth0_user_id}"))
 
         user = user_result.data
 
-        # Find meeting by ID and user_id
-        find_result = await self._meeting_repository.find_by_id(
-            input.meeting_id, user.id
-        )
+        cached = await self._meeting_cache.get(input.meeting_id, user.id)
+        if cached is not None:
+            self._logger.info(f"Find meeting: done (cached). ID: '{cached.id}'")
+            return success(self._to_output(cached, input.if_none_match))
+
+        # Revalidate against updated_at before loading the heavy columns
+        if input.if_none_match:
+            not_modified = await self._revalidate(input, user.id)
+            if not_modified is not None:
+                return not_modified
+
+        # Concurrent views of the same meeting share one database load
+        find_result = await self._meeting_view_loader.load(input.meeting_id, user.id)
 
         if find_result.success is False:
             self._logger.error(f"Database error: {find_result.error}")
             return failure(DatabaseError(str(find_result.error)))
 
-        meeting = find_result.data
+        return self._found(input, find_result.data)
+
+    async def _revalidate(
+        self, input: FindMeetingUseCaseInput, user_id: UUID
+    ) -> Result[FindMeetingUseCaseOutput, FindMeetingUseCaseException] | None:
+        """Answer from updated_at alone when possible, else return None."""
+        version_result = await self._meeting_repository.find_updated_at(
+            input.meeting_id, user_id
+        )
+        if version_result.success is False:
+            self._logger.error(f"Database error: {version_result.error}")
+            return failure(DatabaseError(str(version_result.error)))
 
+        if version_result.data is None:
+            return failure(MeetingNotFoundException(input.meeting_id))
+
+        etag = meeting_etag(input.meeting_id, version_result.data)
+        if not etag_matches(input.if_none_match, etag):
+            return None
+
+        self._logger.info(
+            f"Find meeting: done (not modified). ID: '{input.meeting_id}'"
+        )
+        return success(FindMeetingUseCaseOutput(etag=etag, meeting=None))
+
+    def _found(
+        self, input: FindMeetingUseCaseInput, meeting: Meeting | None
+    ) -> Result[FindMeetingUseCaseOutput, FindMeetingUseCaseException]:
         if meeting is None:
             self._logger.debug(
                 f"Meeting not found or not owned by user: {input.meeting_id}"
@@ -77,4 +134,18 @@ class FindMeetingUseCase(
             return failure(MeetingNotFoundException(input.meeting_id))
 
         self._logger.info(f"Find meeting: done. ID: '{meeting.id}'")
-        return success(meeting)
+        return success(self._to_output(meeting, input.if_none_match))
+
+    @staticmethod
+    def _to_output(
+        meeting: Meeting, if_none_match: str | None
+    ) -> FindMeetingUseCaseOutput:
+        etag = meeting_etag(meeting.id, meeting.updated_at)
+        if etag_matches(if_none_match, etag):
+            return FindMeetingUseCaseOutput(etag=etag, meeting=None)
+        return FindMeetingUseCaseOutput(etag=etag, meeting=meeting)
+
+
+def meeting_etag(meeting_id: UUID, updated_at: datetime) -> str:
+    """ETag of a meeting representation; every write bumps updated_at."""
+    return weak_etag(meeting_id, updated_at.isoformat())
@@ -0,0 +1,78 @@
+"""Reconcile meeting counters use case."""
+
+from dataclasses import dataclass
+from typing import TypedDict
+
+from app.domain.model.meeting.meeting_counter_repository import (
+    MeetingCounterRepository,
+)
+from app.domain.support.logger.logger import Logger
+from app.infrastructure.db_client.transaction_manager import TransactionManager
+from app.util.result import Result, failure, success
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ReconcileMeetingCountersUseCaseInput:
+    """Input for reconcile meeting counters use case."""
+
+    batch_size: int = 500
+
+
+class ReconcileMeetingCountersUseCaseOutput(TypedDict):
+    """Output for reconcile meeting counters use case."""
+
+    batches: int
+    corrected: int
+
+
+class ReconcileMeetingCountersUseCase:
+    """Correct drift between meeting_counters and the meetings table."""
+
+    def __init__(
+        self,
+        *,
+        meeting_counter_repository: MeetingCounterRepository,
+        transaction_manager: TransactionManager,
+        logger: Logger,
+    ) -> None:
+        self._meeting_counter_repository = meeting_counter_repository
+        self._transaction_manager = transaction_manager
+        self._logger = logger
+
+    async def execute(
+        self, input: ReconcileMeetingCountersUseCaseInput
+    ) -> Result[ReconcileMeetingCountersUseCaseOutput, Exception]:
+        """Execute reconcile meeting counters use case."""
+        self._logger.info("Reconcile meeting counters: started.")
+
+        output = ReconcileMeetingCountersUseCaseOutput(batches=0, corrected=0)
+        after_user_id = None
+
+        try:
+            while True:
+                batch_result = await self._meeting_counter_repository.reconcile(
+                    after_user_id=after_user_id, limit=input.batch_size
+                )
+                if not batch_result.success:
+                    await self._transaction_manager.rollback()
+                    return failure(batch_result.error)
+
+                corrected, after_user_id = batch_result.data
+                if after_user_id is None:
+                    break
+
+                # Commit per batch so counter row locks are held briefly
+                await self._transaction_manager.commit()
+                output["batches"] += 1
+                output["corrected"] += corrected
+
+            self._logger.info(
+                f"Reconcile meeting counters: done. Batches: {output['batches']}, "
+                f"corrected: {output['corrected']}"
+            )
+            return success(output)
+
+        except Exception as e:
+            self._logger.error(f"Reconcile meeting counters: failed. Error: {e!s}")
+            await self._transaction_manager.rollback()
+            return failure(e)
@@ -0,0 +1,168 @@
+"""Relay outbox use case."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TypedDict
+
+from app.domain.model.meeting.meeting_repository import MeetingRepository
+from app.domain.model.outbox.outbox_message import OutboxMessage
+from app.domain.model.outbox.outbox_repository import OutboxRepository
+from app.domain.support.logger.logger import Logger
+from app.domain.support.task_queue.task_publisher import TaskPublisher
+from app.infrastructure.db_client.transaction_manager import TransactionManager
+from app.util.enums.outbox_status import OutboxStatus
+from app.util.result import Result, failure, success
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RelayOutboxUseCaseInput:
+    """Input for relay outbox use case."""
+
+    batch_size: int
+
+
+class RelayOutboxUseCaseOutput(TypedDict):
+    """Output for relay outbox use case."""
+
+    claimed: int
+    published: int
+    retried: int
+    dead: int
+
+
+class RelayOutboxUseCase:
+    """
+    Publish one batch of pending outbox messages to the broker.
+
+    A message given up on fails the meeting it was meant to start, in the
+    same transaction, so the meeting does not stay in progress forever.
+    """
+
+    def __init__(
+        self,
+        *,
+        outbox_repository: OutboxRepository,
+        meeting_repository: MeetingRepository,
+        task_publisher: TaskPublisher,
+        transaction_manager: TransactionManager,
+        logger: Logger,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+    ) -> None:
+        self._outbox_repository = outbox_repository
+        self._meeting_repository = meeting_repository
+        self._task_publisher = task_publisher
+        self._transaction_manager = transaction_manager
+        self._logger = logger
+        self._max_attempts = max_attempts
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+
+    async def execute(
+        self, input: RelayOutboxUseCaseInput
+    ) -> Result[RelayOutboxUseCaseOutput, Exception]:
+        """Execute relay outbox use case."""
+        try:
+            claim_result = await self._outbox_repository.claim_pending(
+                limit=input.batch_size
+            )
+            if not claim_result.success:
+                return failure(claim_result.error)
+
+            messages = claim_result.data
+            output = RelayOutboxUseCaseOutput(
+                claimed=len(messages), published=0, retried=0, dead=0
+            )
+            if not messages:
+                return success(output)
+
+            # Publish the whole batch concurrently; confirms arrive together
+            publish_results = await asyncio.gather(
+                *(
+                    self._task_publisher.publish(
+                        task_id=str(message.id),
+                        task_name=message.task_name,
+                        args=message.args,
+                        kwargs=message.kwargs,
+                        queue=message.queue,
+                    )
+                    for message in messages
+                )
+            )
+
+            published_ids = []
+            for message, publish_result in zip(messages, publish_results, strict=True):
+                if publish_result.success:
+                    published_ids.append(message.id)
+                    continue
+
+                record_result = await self._record_failure(
+                    message, str(publish_result.error)
+                )
+                if not record_result.success:
+                    await self._transaction_manager.rollback()
+                    return failure(record_result.error)
+
+                if message.status == OutboxStatus.DEAD:
+                    output["dead"] += 1
+                else:
+                    output["retried"] += 1
+
+            if published_ids:
+                delete_result = await self._outbox_repository.delete_many(published_ids)
+                if not delete_result.success:
+                    await self._transaction_manager.rollback()
+                    return failure(delete_result.error)
+                output["published"] = len(published_ids)
+
+            await self._transaction_manager.commit()
+
+            self._logger.info(
+                f"Relay outbox: done. Published: {output['published']}, "
+                f"retried: {output['retried']}, dead: {output['dead']}"
+            )
+
+            return success(output)
+
+        except Exception as e:
+            self._logger.error(f"Relay outbox: failed. Error: {e!s}")
+            await self._transaction_manager.rollback()
+            return failure(e)
+
+    async def _record_failure(
+        self, message: OutboxMessage, error: str
+    ) -> Result[None, Exception]:
+        """Save a failed attempt, failing the message's meeting on giving up."""
+        self._reschedule(message, error)
+        save_result = await self._outbox_repository.save(message)
+        if not save_result.success:
+            return failure(save_result.error)
+
+        if message.status != OutboxStatus.DEAD or message.meeting_id is None:
+            return success(None)
+
+        fail_result = await self._meeting_repository.mark_failed(message.meeting_id)
+        if not fail_result.success:
+            return failure(fail_result.error)
+        if fail_result.data is not None:
+            self._logger.error(
+                f"Relay outbox: meeting {message.meeting_id} marked {fail_result.data}"
+            )
+        return success(None)
+
+    def _reschedule(self, message: OutboxMessage, error: str) -> None:
+        """Back off exponentially, giving up after max_attempts."""
+        if message.attempts + 1 >= self._max_attempts:
+            self._logger.error(
+                f"Relay outbox: giving up on {message.task_name} ({message.id}) "
+                f"after {message.attempts + 1} attempts. Error: {error}"
+            )
+            message.mark_dead(error=error)
+            return
+
+        delay = min(
+            self._retry_base_seconds * 2**message.attempts, self._retry_max_seconds
+        )
+        message.schedule_retry(error=error, delay=timedelta(seconds=delay))
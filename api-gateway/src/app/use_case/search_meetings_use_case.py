@@ -0,0 +1,87 @@
+"""Search meetings use case."""
+
+from dataclasses import dataclass
+
+from app.domain.model.meeting.meeting_repository import MeetingRepository
+from app.domain.model.meeting.meeting_search_hit import MeetingSearchHit
+from app.domain.model.user.user_repository import UserRepository
+from app.domain.support.logger.logger import Logger
+from app.use_case.interfaces import UseCase
+from app.util.exceptions import BadRequestError, DatabaseError, UnexpectedError
+from app.util.result import Result, failure, success
+
+# Longer queries only add tsquery terms nobody typed on purpose
+MAX_QUERY_LENGTH = 256
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchMeetingsUseCaseInput:
+    """Input for search meetings use case."""
+
+    auth0_user_id: str
+    query: str
+    limit: int = 20
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchMeetingsUseCaseOutput:
+    """Output for search meetings use case."""
+
+    hits: list[MeetingSearchHit]
+
+
+SearchMeetingsUseCaseException = BadRequestError | DatabaseError | UnexpectedError
+
+
+class SearchMeetingsUseCase(
+    UseCase[
+        SearchMeetingsUseCaseInput,
+        SearchMeetingsUseCaseOutput,
+        SearchMeetingsUseCaseException,
+    ]
+):
+    """Full-text search across a user's meetings."""
+
+    def __init__(
+        self,
+        *,
+        meeting_repository: MeetingRepository,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> None:
+        self._meeting_repository = meeting_repository
+        self._user_repository = user_repository
+        self._logger = logger
+
+    async def execute(
+        self, input: SearchMeetingsUseCaseInput
+    ) -> Result[SearchMeetingsUseCaseOutput, SearchMeetingsUseCaseException]:
+        """Execute search meetings use case."""
+        query = input.query.strip()
+        if not query:
+            return failure(BadRequestError("Search query must not be empty"))
+        if len(query) > MAX_QUERY_LENGTH:
+            return failure(
+                BadRequestError(
+                    f"Search query must be at most {MAX_QUERY_LENGTH} characters"
+                )
+            )
+
+        self._logger.info(f"Search meetings: started. User: '{input.auth0_user_id}'")
+
+        user_result = await self._user_repository.find_identity_by_auth0_id(
+            input.auth0_user_id
+        )
+        if not user_result.success or user_result.data is None:
+            self._logger.error(f"User not found: {input.auth0_user_id}")
+            return failure(UnexpectedError(f"User not found: {input.auth0_user_id}"))
+
+        search_result = await self._meeting_repository.search(
+            user_id=user_result.data.id, query=query, limit=input.limit
+        )
+        if search_result.success is False:
+            self._logger.error(f"Database error: {search_result.error}")
+            return failure(DatabaseError(str(search_result.error)))
+
+        self._logger.info(f"Search meetings: done. Hits: {len(search_result.data)}")
+        return success(SearchMeetingsUseCaseOutput(hits=search_result.data))
@@ -0,0 +1,92 @@
+"""Semantic search meetings use case."""
+
+from dataclasses import dataclass
+
+from app.domain.model.user.user_repository import UserRepository
+from app.domain.support.logger.logger import Logger
+from app.domain.support.semantic_index.semantic_index import SemanticHit, SemanticIndex
+from app.use_case.interfaces import UseCase
+from app.use_case.search_meetings_use_case import MAX_QUERY_LENGTH
+from app.util.exceptions import BadRequestError, DatabaseError, UnexpectedError
+from app.util.result import Result, failure, success
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SemanticSearchMeetingsUseCaseInput:
+    """Input for semantic search meetings use case."""
+
+    auth0_user_id: str
+    query: str
+    limit: int = 10
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SemanticSearchMeetingsUseCaseOutput:
+    """Output for semantic search meetings use case."""
+
+    hits: list[SemanticHit]
+
+
+SemanticSearchMeetingsUseCaseException = (
+    BadRequestError | DatabaseError | UnexpectedError
+)
+
+
+class SemanticSearchMeetingsUseCase(
+    UseCase[
+        SemanticSearchMeetingsUseCaseInput,
+        SemanticSearchMeetingsUseCaseOutput,
+        SemanticSearchMeetingsUseCaseException,
+    ]
+):
+    """Find transcript passages similar to a free-text query."""
+
+    def __init__(
+        self,
+        *,
+        semantic_index: SemanticIndex,
+        user_repository: UserRepository,
+        logger: Logger,
+    ) -> None:
+        self._semantic_index = semantic_index
+        self._user_repository = user_repository
+        self._logger = logger
+
+    async def execute(
+        self, input: SemanticSearchMeetingsUseCaseInput
+    ) -> Result[
+        SemanticSearchMeetingsUseCaseOutput, SemanticSearchMeetingsUseCaseException
+    ]:
+        """Execute semantic search meetings use case."""
+        query = input.query.strip()
+        if not query:
+            return failure(BadRequestError("Search query must not be empty"))
+        if len(query) > MAX_QUERY_LENGTH:
+            return failure(
+                BadRequestError(
+                    f"Search query must be at most {MAX_QUERY_LENGTH} characters"
+                )
+            )
+
+        self._logger.info(
+            f"Semantic search meetings: started. User: '{input.auth0_user_id}'"
+        )
+
+        user_result = await self._user_repository.find_identity_by_auth0_id(
+            input.auth0_user_id
+        )
+        if not user_result.success or user_result.data is None:
+            self._logger.error(f"User not found: {input.auth0_user_id}")
+            return failure(UnexpectedError(f"User not found: {input.auth0_user_id}"))
+
+        search_result = await self._semantic_index.search(
+            user_id=user_result.data.id, query=query, limit=input.limit
+        )
+        if search_result.success is False:
+            self._logger.error(f"Database error: {search_result.error}")
+            return failure(DatabaseError(str(search_result.error)))
+
+        self._logger.info(
+            f"Semantic search meetings: done. Hits: {len(search_result.data)}"
+        )
+        return success(SemanticSearchMeetingsUseCaseOutput(hits=search_result.data))
@@ -7,6 +7,7 @@ from uuid import UUID
 
 from app.domain.model.meeting.meeting_repository import MeetingRepository
 from app.domain.support.logger.logger import Logger
+from app.domain.support.meeting_cache.meeting_cache import MeetingCache
 from app.infrastructure.db_client.transaction_manager import TransactionManager
 from app.util.enums.status import Status
 from app.util.result import Result, failure, success
@@ -26,7 +27,6 @@ class UpdateMeetingUseCaseInput:
     status: Status | None = None
     transcribe_text: str | None = None
     summarize: str | None = None
-    transcribe_segments: list | None = None
     key_notes: list | None = None
 
 
@@ -44,10 +44,12 @@ class UpdateMeetingUseCase:
         self,
         *,
         meeting_repository: MeetingRepository,
+        meeting_cache: MeetingCache,
         transaction_manager: TransactionManager,
         logger: Logger,
     ) -> None:
         self._meeting_repository = meeting_repository
+        self._meeting_cache = meeting_cache
         self._transaction_manager = transaction_manager
         self._logger = logger
 
@@ -93,15 +95,12 @@ class UpdateMeetingUseCase:
                 meeting.summarize = input.summarize
                 meeting.updated_at = datetime.now(UTC)
 
-            if input.transcribe_segments is not None:
-                meeting.transcribe_segments = input.transcribe_segments
-                meeting.updated_at = datetime.now(UTC)
-
             if input.key_notes is not None:
                 meeting.key_notes = input.key_notes
                 meeting.updated_at = datetime.now(UTC)
 
             await self._transaction_manager.commit()
+            await self._meeting_cache.invalidate(meeting.id)
 
             self._logger.info(f"Update meeting: done. ID: '{meeting.id}'")
 
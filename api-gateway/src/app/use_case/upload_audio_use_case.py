@@ -98,16 +98,13 @@ class UploadAudioUseCase:
                 status=Status.PROCESSING,
             )
 
-            # Save meeting and update quota
+            # Save meeting, update quota and enqueue transcription atomically
             save_result = await self._save_meeting_and_update_quota(
-                meeting, user, duration_seconds
+                meeting, user, duration_seconds, audio_url
             )
             if not save_result.success:
-                return save_result
-
-            # Send transcribe task
-            task_result = self._task_queue.send_transcribe_task(meeting.id, audio_url)
-            task_id = task_result.data if task_result.success else "failed"
+                return failure(save_result.error)
+            task_id = save_result.data
 
             self._logger.info(f"Upload completed: {meeting.id}, {duration_seconds}s")
 
@@ -167,9 +164,13 @@ class UploadAudioUseCase:
         return success((duration_seconds, user))
 
     async def _save_meeting_and_update_quota(
-        self, meeting: Meeting, user: User, duration_seconds: float
-    ) -> Result[None, Exception]:
-        """Save meeting and update user quota in transaction."""
+        self, meeting: Meeting, user: User, duration_seconds: float, audio_url: str
+    ) -> Result[str, Exception]:
+        """Save meeting, update user quota and enqueue transcription in transaction.
+
+        The transcribe task is written to the outbox, so it is dispatched if and
+        only if the meeting commits.
+        """
         save_result = await self._meeting_repository.save(meeting)
         if not save_result.success:
             await self._transaction_manager.rollback()
@@ -181,5 +182,10 @@ class UploadAudioUseCase:
             await self._transaction_manager.rollback()
             return failure(update_result.error)
 
+        task_result = await self._task_queue.send_transcribe_task(meeting.id, audio_url)
+        if not task_result.success:
+            await self._transaction_manager.rollback()
+            return failure(task_result.error)
+
         await self._transaction_manager.commit()
-        return success(None)
+        return success(task_result.data)
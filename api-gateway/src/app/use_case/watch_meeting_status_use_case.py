@@ -0,0 +1,129 @@
+"""Watch meeting status use case."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.model.meeting.meeting_repository import (
+    MeetingRepository,
+    MeetingStatusInProgress,
+)
+from app.domain.support.logger.logger import Logger
+from app.domain.support.meeting_status.meeting_event_listener import (
+    MeetingEventListener,
+    MeetingEventSubscription,
+)
+from app.domain.support.meeting_status.meeting_status_cache import MeetingStatusCache
+from app.infrastructure.db_client.transaction_manager import TransactionManager
+from app.use_case.find_meeting_status_use_case import FindMeetingStatusUseCaseOutput
+from app.util.exceptions import MeetingNotFoundException
+from app.util.result import Result, failure, success
+
+# None marks an idle interval, letting the caller send a keep-alive
+WatchMeetingStatusUseCaseOutput = AsyncIterator[FindMeetingStatusUseCaseOutput | None]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WatchMeetingStatusUseCaseInput:
+    """Input for watch meeting status use case."""
+
+    meeting_id: UUID
+    heartbeat_seconds: float = 15.0
+
+
+class WatchMeetingStatusUseCase:
+    """Stream meeting status changes until the pipeline finishes."""
+
+    def __init__(
+        self,
+        *,
+        meeting_repository: MeetingRepository,
+        meeting_status_cache: MeetingStatusCache,
+        meeting_event_listener: MeetingEventListener,
+        transaction_manager: TransactionManager,
+        logger: Logger,
+    ) -> None:
+        self._meeting_repository = meeting_repository
+        self._meeting_status_cache = meeting_status_cache
+        self._meeting_event_listener = meeting_event_listener
+        self._transaction_manager = transaction_manager
+        self._logger = logger
+
+    async def execute(
+        self, input: WatchMeetingStatusUseCaseInput
+    ) -> Result[WatchMeetingStatusUseCaseOutput, Exception]:
+        """Execute watch meeting status use case.
+
+        The subscription is opened before the current status is read so no
+        event published in between is lost.
+        """
+        self._logger.info(f"Watch meeting status: started. ID: '{input.meeting_id}'")
+
+        try:
+            subscription = await self._meeting_event_listener.subscribe(
+                input.meeting_id
+            )
+        except Exception as e:
+            self._logger.error(f"Watch meeting status: subscribe failed. Error: {e!s}")
+            return failure(e)
+
+        try:
+            current = await self._meeting_status_cache.get(input.meeting_id)
+            if current is None:
+                result = await self._meeting_repository.find_status_in_progress_by_id(
+                    input.meeting_id
+                )
+                # Release the pooled connection before a long-lived stream
+                await self._transaction_manager.rollback()
+
+                if result.is_failure():
+                    await subscription.close()
+                    return failure(result.error)
+                current = result.data
+
+            if current is None:
+                await subscription.close()
+                return failure(MeetingNotFoundException(str(input.meeting_id)))
+
+        except Exception as e:
+            self._logger.error(f"Watch meeting status: failed. Error: {e!s}")
+            await subscription.close()
+            return failure(e)
+
+        return success(self._stream(current, subscription, input.heartbeat_seconds))
+
+    async def _stream(
+        self,
+        current: MeetingStatusInProgress,
+        subscription: MeetingEventSubscription,
+        heartbeat_seconds: float,
+    ) -> WatchMeetingStatusUseCaseOutput:
+        try:
+            yield _to_output(current)
+            while not current.status.is_terminal:
+                try:
+                    async with asyncio.timeout(heartbeat_seconds):
+                        current = await subscription.next()
+                except TimeoutError:
+                    yield None
+                    continue
+                yield _to_output(current)
+
+            self._logger.info(
+                f"Watch meeting status: done. ID: '{current.id}', "
+                f"Status: {current.status}"
+            )
+        finally:
+            await subscription.close()
+
+
+def _to_output(status: MeetingStatusInProgress) -> FindMeetingStatusUseCaseOutput:
+    return FindMeetingStatusUseCaseOutput(
+        meeting_id=status.id,
+        status=status.status,
+        transcribe_done=status.transcribe_done,
+        transcribe_total=status.transcribe_total,
+        summarize_done=status.summarize_done,
+        summarize_total=status.summarize_total,
+    )
@@ -0,0 +1,36 @@
+"""Content-Encoding negotiation and incremental gzip compression."""
+
+import zlib
+from collections.abc import AsyncIterator
+
+# zlib wbits for a gzip container
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Check whether an Accept-Encoding header allows gzip."""
+    if not accept_encoding:
+        return False
+
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower().removeprefix("q=")
+        try:
+            return not params or float(quality) > 0
+        except ValueError:
+            return False
+    return False
+
+
+async def gzip_stream(
+    chunks: AsyncIterator[bytes], *, level: int = 6
+) -> AsyncIterator[bytes]:
+    """Compress a byte stream chunk by chunk, flushing after each chunk."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,32 @@
+"""Opaque keyset pagination cursors."""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from app.util.exceptions import BadRequestError
+
+INVALID_CURSOR_MESSAGE = "Invalid pagination cursor"
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encode the (created_at, id) position of the last item on a page."""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        BadRequestError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, item_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise BadRequestError(INVALID_CURSOR_MESSAGE) from e
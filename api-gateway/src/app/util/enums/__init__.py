@@ -2,8 +2,10 @@
 
 from app.util.enums.status import Status
 from app.util.enums.task_status import TaskStatus
+from app.util.enums.transcript_format import TranscriptFormat
 
 __all__ = [
     "Status",
     "TaskStatus",
+    "TranscriptFormat",
 ]
@@ -0,0 +1,10 @@
+"""Outbox message status enum."""
+
+from enum import StrEnum
+
+
+class OutboxStatus(StrEnum):
+    """Outbox message status enumeration"""
+
+    PENDING = "pending"
+    DEAD = "dead"
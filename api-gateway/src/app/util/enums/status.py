@@ -14,3 +14,24 @@ class Status(StrEnum):
     SUMMARIZED = "summarized"
     COMPLETED = "completed"
     SUMMARIZE_FAILED = "summarize_failed"
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the pipeline has stopped working on the meeting.
+
+        SUMMARIZED is not: key notes and tasks are still being extracted.
+        """
+        return self in {
+            Status.COMPLETED,
+            Status.TRANSCRIBE_FAILED,
+            Status.SUMMARIZE_FAILED,
+        }
+
+    @property
+    def failure(self) -> "Status":
+        """Status of a meeting that failed at this stage; terminal ones stay."""
+        if self.is_terminal:
+            return self
+        if self in {Status.PROCESSING, Status.TRANSCRIBING}:
+            return Status.TRANSCRIBE_FAILED
+        return Status.SUMMARIZE_FAILED
@@ -0,0 +1,22 @@
+"""Transcript export format enum."""
+
+from enum import StrEnum
+
+
+class TranscriptFormat(StrEnum):
+    """Transcript export format enumeration"""
+
+    SRT = "srt"
+    VTT = "vtt"
+    TXT = "txt"
+    JSON = "json"
+
+    @property
+    def media_type(self) -> str:
+        """Content type of the exported file."""
+        return {
+            TranscriptFormat.SRT: "application/x-subrip",
+            TranscriptFormat.VTT: "text/vtt",
+            TranscriptFormat.TXT: "text/plain",
+            TranscriptFormat.JSON: "application/json",
+        }[self]
@@ -0,0 +1,30 @@
+"""Weak entity tags for conditional GET requests."""
+
+import hashlib
+
+
+def weak_etag(*parts: object) -> str:
+    """Build a weak ETag from the values a representation depends on."""
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = _opaque_tag(etag)
+    return any(
+        _opaque_tag(candidate.strip()) == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
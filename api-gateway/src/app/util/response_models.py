@@ -24,8 +24,15 @@ class PaginationMeta(BaseModel):
 
     page: int = Field(..., description="Current page number (1-indexed)")
     page_size: int = Field(..., description="Number of items per page")
-    total_items: int = Field(..., description="Total number of items")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_items: int | None = Field(
+        None, description="Total number of items (omitted when not requested)"
+    )
+    total_pages: int | None = Field(
+        None, description="Total number of pages (omitted when not requested)"
+    )
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page, null on the last page"
+    )
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -0,0 +1,18 @@
+"""HTML-safe rendering of full-text search highlights."""
+
+import html
+
+# Private-use code points stand in for <mark> while the database highlights,
+# so highlight tags can be told apart from markup in the stored text
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+HIGHLIGHT_MARKERS = HIGHLIGHT_START + HIGHLIGHT_STOP
+
+
+def render_snippet(highlighted: str) -> str:
+    """Escape a highlighted fragment, then turn its markers into <mark> tags."""
+    return (
+        html.escape(highlighted)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
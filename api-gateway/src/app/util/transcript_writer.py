@@ -0,0 +1,83 @@
+"""Incremental transcript rendering (SRT, WebVTT, plain text, JSON)."""
+
+from collections.abc import AsyncIterator, Callable
+
+import orjson
+
+from app.domain.model.meeting.transcript_segment import TranscriptSegment
+from app.util.enums.transcript_format import TranscriptFormat
+
+# Rendered cues are coalesced into writes of about this size
+DEFAULT_FLUSH_BYTES = 64 * 1024
+
+
+async def render_transcript(
+    segments: AsyncIterator[TranscriptSegment],
+    format: TranscriptFormat,
+    *,
+    flush_bytes: int = DEFAULT_FLUSH_BYTES,
+) -> AsyncIterator[bytes]:
+    """Render segments as they arrive; only one buffer is held at a time."""
+    render_cue = _CUE_RENDERERS[format]
+    buffer = bytearray(_HEADERS.get(format, b""))
+
+    index = 0
+    async for segment in segments:
+        index += 1
+        buffer += render_cue(index, segment)
+        if len(buffer) >= flush_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+
+    buffer += _FOOTERS.get(format, b"")
+    if buffer:
+        yield bytes(buffer)
+
+
+def format_timestamp(seconds: float, *, separator: str = ".") -> str:
+    """Format seconds as HH:MM:SS<separator>mmm."""
+    total_ms = max(0, round(seconds * 1000))
+    hours, rest = divmod(total_ms, 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    secs, ms = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{ms:03d}"
+
+
+def _srt_cue(index: int, segment: TranscriptSegment) -> bytes:
+    start = format_timestamp(segment.start, separator=",")
+    end = format_timestamp(segment.end, separator=",")
+    return f"{index}\n{start} --> {end}\n{segment.text.strip()}\n\n".encode()
+
+
+def _vtt_cue(_index: int, segment: TranscriptSegment) -> bytes:
+    start = format_timestamp(segment.start)
+    end = format_timestamp(segment.end)
+    return f"{start} --> {end}\n{segment.text.strip()}\n\n".encode()
+
+
+def _txt_cue(_index: int, segment: TranscriptSegment) -> bytes:
+    return f"{segment.text.strip()}\n".encode()
+
+
+def _json_cue(index: int, segment: TranscriptSegment) -> bytes:
+    item = orjson.dumps({
+        "start": segment.start,
+        "end": segment.end,
+        "text": segment.text,
+    })
+    return item if index == 1 else b"," + item
+
+
+_CUE_RENDERERS: dict[TranscriptFormat, Callable[[int, TranscriptSegment], bytes]] = {
+    TranscriptFormat.SRT: _srt_cue,
+    TranscriptFormat.VTT: _vtt_cue,
+    TranscriptFormat.TXT: _txt_cue,
+    TranscriptFormat.JSON: _json_cue,
+}
+_HEADERS = {
+    TranscriptFormat.VTT: b"WEBVTT\n\n",
+    TranscriptFormat.JSON: b'{"segments":[',
+}
+_FOOTERS = {
+    TranscriptFormat.JSON: b"]}",
+}
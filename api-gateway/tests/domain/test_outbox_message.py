@@ -0,0 +1,45 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.domain.model.outbox import OutboxMessage
+from app.util.enums.outbox_status import OutboxStatus
+
+
+def test_create_is_pending_and_due_now() -> None:
+    message = OutboxMessage.create(
+        task_name="audio.transcribe.start", queue="audio.transcribe", args=["m"]
+    )
+
+    assert message.status == OutboxStatus.PENDING
+    assert message.attempts == 0
+    assert message.available_at == message.created_at
+    assert message.args == ["m"]
+    assert message.kwargs == {}
+
+
+def test_create_rejects_empty_task_name() -> None:
+    with pytest.raises(ValueError, match="task name"):
+        OutboxMessage.create(task_name="")
+
+
+def test_schedule_retry_delays_next_attempt() -> None:
+    message = OutboxMessage.create(task_name="t")
+    before = datetime.now(UTC)
+
+    message.schedule_retry(error="broker down", delay=timedelta(seconds=30))
+
+    assert message.status == OutboxStatus.PENDING
+    assert message.attempts == 1
+    assert message.last_error == "broker down"
+    assert message.available_at >= before + timedelta(seconds=30)
+
+
+def test_mark_dead_keeps_message_for_inspection() -> None:
+    message = OutboxMessage.create(task_name="t")
+
+    message.mark_dead(error="rejected")
+
+    assert message.status == OutboxStatus.DEAD
+    assert message.attempts == 1
+    assert message.last_error == "rejected"
@@ -0,0 +1,120 @@
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from app.domain.model.user.user import User
+from app.domain.model.user.user_identity import UserIdentity
+from app.infrastructure.persistence.repository.cached_user_repository_impl import (
+    CachedUserRepositoryImpl,
+)
+from app.util.enums.user_type import UserType
+from app.util.result import Result, success
+
+
+class FakeUserRepository:
+    def __init__(self, user: User) -> None:
+        self.user = user
+        self.identity_reads = 0
+
+    async def find_identity_by_auth0_id(
+        self, auth0_user_id: str
+    ) -> Result[UserIdentity | None, Exception]:
+        self.identity_reads += 1
+        if auth0_user_id != self.user.auth0_user_id:
+            return success(None)
+        return success(UserIdentity.from_user(self.user))
+
+    async def save(self, user: User) -> Result[User, Exception]:
+        return success(user)
+
+
+class FakeCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, UserIdentity] = {}
+        self.invalidations: list[str] = []
+
+    async def get(self, auth0_user_id: str) -> UserIdentity | None:
+        return self.entries.get(auth0_user_id)
+
+    async def set(self, identity: UserIdentity) -> None:
+        self.entries[identity.auth0_user_id] = identity
+
+    async def invalidate(self, auth0_user_id: str) -> None:
+        self.invalidations.append(auth0_user_id)
+        self.entries.pop(auth0_user_id, None)
+
+
+class FakeTransactionManager:
+    def __init__(self) -> None:
+        self.callbacks: list[Callable[[], Awaitable[None]]] = []
+
+    async def commit(self) -> None:
+        for callback in self.callbacks:
+            await callback()
+        self.callbacks = []
+
+    async def rollback(self) -> None:
+        self.callbacks = []
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self.callbacks.append(callback)
+
+
+@pytest.fixture
+def user() -> User:
+    return User.create(auth0_user_id="auth0|1", email="a@example.com")
+
+
+def make_repository(
+    user: User,
+) -> tuple[
+    CachedUserRepositoryImpl, FakeUserRepository, FakeCache, FakeTransactionManager
+]:
+    inner = FakeUserRepository(user)
+    cache = FakeCache()
+    transaction_manager = FakeTransactionManager()
+    repository = CachedUserRepositoryImpl(
+        repository=inner,  # type: ignore[arg-type]
+        cache=cache,
+        transaction_manager=transaction_manager,  # type: ignore[arg-type]
+    )
+    return repository, inner, cache, transaction_manager
+
+
+@pytest.mark.asyncio
+async def test_identity_reads_go_through_the_cache(user: User) -> None:
+    repository, inner, _, _ = make_repository(user)
+
+    first = await repository.find_identity_by_auth0_id("auth0|1")
+    second = await repository.find_identity_by_auth0_id("auth0|1")
+
+    assert first.data == second.data == UserIdentity.from_user(user)
+    assert inner.identity_reads == 1
+
+
+@pytest.mark.asyncio
+async def test_save_invalidates_again_after_commit(user: User) -> None:
+    repository, _, cache, transaction_manager = make_repository(user)
+    await repository.find_identity_by_auth0_id("auth0|1")
+
+    user.user_type = UserType.PREMIUM
+    await repository.save(user)
+    assert cache.invalidations == ["auth0|1"]
+
+    # A concurrent request re-caches the row it read before the commit
+    await cache.set(UserIdentity.from_user(user))
+    await transaction_manager.commit()
+
+    assert cache.invalidations == ["auth0|1", "auth0|1"]
+    assert await cache.get("auth0|1") is None
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_save_keeps_cache(user: User) -> None:
+    repository, _, cache, transaction_manager = make_repository(user)
+    await repository.find_identity_by_auth0_id("auth0|1")
+
+    await repository.save(user)
+    await transaction_manager.rollback()
+
+    assert cache.invalidations == []
@@ -0,0 +1,92 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.domain.model.meeting.meeting import Meeting
+from app.infrastructure.cache.meeting_cache_impl import (
+    INVALIDATION_TOMBSTONE_SECONDS,
+    MeetingCacheImpl,
+    decode_meeting,
+    encode_meeting,
+)
+from app.util.enums.status import Status
+
+
+def _meeting() -> Meeting:
+    return Meeting(
+        id=uuid4(),
+        user_id=uuid4(),
+        title="Weekly sync",
+        status=Status.COMPLETED,
+        summarize="Summary",
+        key_notes=["Ship it"],
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2026, 1, 2, tzinfo=UTC),
+    )
+
+
+def test_decode_returns_a_fresh_copy() -> None:
+    meeting = _meeting()
+
+    decoded = decode_meeting(encode_meeting(meeting))
+
+    assert decoded is not meeting
+    assert decoded.id == meeting.id
+    assert decoded.user_id == meeting.user_id
+    assert decoded.status is Status.COMPLETED
+    assert decoded.key_notes == ["Ship it"]
+    assert decoded.updated_at == meeting.updated_at
+
+
+@pytest.mark.asyncio
+async def test_get_is_scoped_to_the_owner() -> None:
+    cache = MeetingCacheImpl(redis=FakeAsyncRedis(), ttl_seconds=60)
+    meeting = _meeting()
+    await cache.set(meeting)
+
+    cached = await cache.get(meeting.id, meeting.user_id)
+
+    assert cached is not None
+    assert cached.title == "Weekly sync"
+    assert await cache.get(meeting.id, uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_the_entry() -> None:
+    cache = MeetingCacheImpl(redis=FakeAsyncRedis(), ttl_seconds=60)
+    meeting = _meeting()
+    await cache.set(meeting)
+
+    await cache.invalidate(meeting.id)
+
+    assert await cache.get(meeting.id, meeting.user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_load_that_raced_an_invalidation_is_not_cached() -> None:
+    redis = FakeAsyncRedis()
+    cache = MeetingCacheImpl(redis=redis, ttl_seconds=3600)
+    stale = _meeting()
+
+    await cache.invalidate(stale.id)
+    await cache.set(stale)
+
+    assert await cache.get(stale.id, stale.user_id) is None
+    assert await redis.ttl(f"meeting:{stale.id}:view") <= (
+        INVALIDATION_TOMBSTONE_SECONDS
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_caches_again_once_the_tombstone_expires() -> None:
+    redis = FakeAsyncRedis()
+    cache = MeetingCacheImpl(redis=redis, ttl_seconds=3600)
+    meeting = _meeting()
+    await cache.invalidate(meeting.id)
+
+    await redis.delete(f"meeting:{meeting.id}:view")  # Tombstone expired
+    await cache.set(meeting)
+
+    assert await cache.get(meeting.id, meeting.user_id) is not None
@@ -0,0 +1,68 @@
+import asyncio
+import json
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from app.infrastructure.cache.meeting_event_listener_impl import (
+    MeetingEventListenerImpl,
+)
+from app.infrastructure.cache.meeting_status_cache_impl import events_channel
+from app.util.enums.status import Status
+
+
+@pytest.mark.asyncio
+async def test_subscriber_receives_published_snapshots() -> None:
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    listener = MeetingEventListenerImpl(redis=redis)
+    meeting_id = uuid4()
+
+    subscription = await listener.subscribe(meeting_id)
+    await redis.publish(
+        events_channel(meeting_id),
+        json.dumps({
+            "meeting_id": str(meeting_id),
+            "status": "summarizing",
+            "summarize_done": "2",
+            "summarize_total": "5",
+        }),
+    )
+
+    async with asyncio.timeout(5):
+        event = await subscription.next()
+
+    assert event.id == meeting_id
+    assert event.status == Status.SUMMARIZING
+    assert (event.summarize_done, event.summarize_total) == (2, 5)
+
+    await subscription.close()
+    await subscription.close()
+    await listener.close()
+
+
+@pytest.mark.asyncio
+async def test_next_is_bounded_by_the_caller() -> None:
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    listener = MeetingEventListenerImpl(redis=redis)
+    subscription = await listener.subscribe(uuid4())
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.05):
+            await subscription.next()
+
+    await subscription.close()
+    await listener.close()
+
+
+@pytest.mark.parametrize(
+    ("status", "terminal"),
+    [
+        (Status.SUMMARIZED, False),
+        (Status.COMPLETED, True),
+        (Status.TRANSCRIBE_FAILED, True),
+        (Status.SUMMARIZE_FAILED, True),
+    ],
+)
+def test_only_end_states_are_terminal(status: Status, terminal: bool) -> None:
+    assert status.is_terminal is terminal
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+
+def test_evicts_least_recently_used() -> None:
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_entries_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_size=10, ttl_seconds=5)
+    cache.set("a", 1)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 5)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_non_positive_ttl_is_not_stored() -> None:
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_size=10, ttl_seconds=60)
+
+    cache.set("a", 1, ttl_seconds=0)
+
+    assert cache.get("a") is None
+
+
+def test_pop_and_clear() -> None:
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,106 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.domain.model.outbox import OutboxMessage
+from app.use_case.relay_outbox_use_case import (
+    RelayOutboxUseCase,
+    RelayOutboxUseCaseInput,
+)
+from app.util.enums.outbox_status import OutboxStatus
+from app.util.enums.status import Status
+from app.util.result import Result, failure, success
+
+
+class FakeOutboxRepository:
+    def __init__(self, messages: list[OutboxMessage]) -> None:
+        self.messages = messages
+        self.saved: list[OutboxMessage] = []
+
+    async def claim_pending(self, *, limit: int) -> Result:
+        return success(self.messages[:limit])
+
+    async def save(self, message: OutboxMessage) -> Result:
+        self.saved.append(message)
+        return success(None)
+
+    async def delete_many(self, _ids) -> Result:
+        return success(None)
+
+
+class FakeMeetingRepository:
+    def __init__(self) -> None:
+        self.failed: list[UUID] = []
+
+    async def mark_failed(self, id: UUID) -> Result:
+        self.failed.append(id)
+        return success(Status.TRANSCRIBE_FAILED)
+
+
+class DownPublisher:
+    async def publish(self, **_kwargs) -> Result:
+        return failure(ConnectionError("broker down"))
+
+
+class FakeTransactionManager:
+    def __init__(self) -> None:
+        self.committed = False
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None:
+        pass
+
+
+class NullLogger:
+    def debug(self, message: str, **kwargs) -> None:
+        pass
+
+    info = warning = error = debug
+
+
+def _use_case(outbox, meetings, transactions, max_attempts) -> RelayOutboxUseCase:
+    return RelayOutboxUseCase(
+        outbox_repository=outbox,
+        meeting_repository=meetings,
+        task_publisher=DownPublisher(),
+        transaction_manager=transactions,
+        logger=NullLogger(),
+        max_attempts=max_attempts,
+        retry_base_seconds=1,
+        retry_max_seconds=60,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dead_message_fails_its_meeting_in_the_same_transaction() -> None:
+    meeting_id = uuid4()
+    message = OutboxMessage.create(task_name="t", meeting_id=meeting_id)
+    meetings = FakeMeetingRepository()
+    transactions = FakeTransactionManager()
+
+    result = await _use_case(
+        FakeOutboxRepository([message]), meetings, transactions, max_attempts=1
+    ).execute(RelayOutboxUseCaseInput(batch_size=10))
+
+    assert result.data["dead"] == 1
+    assert message.status == OutboxStatus.DEAD
+    assert meetings.failed == [meeting_id]
+    assert transactions.committed
+
+
+@pytest.mark.asyncio
+async def test_retried_message_leaves_its_meeting_alone() -> None:
+    message = OutboxMessage.create(task_name="t", meeting_id=uuid4())
+    meetings = FakeMeetingRepository()
+
+    result = await _use_case(
+        FakeOutboxRepository([message]),
+        meetings,
+        FakeTransactionManager(),
+        max_attempts=5,
+    ).execute(RelayOutboxUseCaseInput(batch_size=10))
+
+    assert result.data["retried"] == 1
+    assert meetings.failed == []
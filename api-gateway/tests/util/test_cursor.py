@@ -0,0 +1,36 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.util.cursor import INVALID_CURSOR_MESSAGE, decode_cursor, encode_cursor
+from app.util.exceptions import BadRequestError
+
+
+def test_round_trip() -> None:
+    created_at = datetime(2026, 1, 15, 16, 15, 30, 123456, tzinfo=UTC)
+    item_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, item_id)) == (created_at, item_id)
+
+
+def test_cursor_is_url_safe_without_padding() -> None:
+    cursor = encode_cursor(datetime.now(UTC), uuid4())
+
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        "bm8tc2VwYXJhdG9y",  # "no-separator"
+        "bm90LWEtZGF0ZXxub3QtYS11dWlk",  # "not-a-date|not-a-uuid"
+        "/w",  # invalid UTF-8
+    ],
+)
+def test_malformed_cursor_is_a_bad_request(cursor: str) -> None:
+    with pytest.raises(BadRequestError, match=INVALID_CURSOR_MESSAGE):
+        decode_cursor(cursor)
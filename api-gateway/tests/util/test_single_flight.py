@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.util.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    waiters = [asyncio.ensure_future(single_flight.do("key", load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [42, 42, 42]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_key_is_forgotten_after_completion() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await single_flight.do("key", load) == 1
+    assert await single_flight.do("key", load) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(single_flight.do("key", load))
+    second = asyncio.ensure_future(single_flight.do("key", load))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller() -> None:
+    single_flight = SingleFlight()
+
+    async def load() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        single_flight.do("key", load),
+        single_flight.do("key", load),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
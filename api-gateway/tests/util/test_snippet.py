@@ -0,0 +1,21 @@
+from app.util.snippet import HIGHLIGHT_START, HIGHLIGHT_STOP, render_snippet
+
+
+def test_markers_become_mark_tags() -> None:
+    highlighted = f"ship the {HIGHLIGHT_START}release{HIGHLIGHT_STOP} today"
+
+    assert render_snippet(highlighted) == "ship the <mark>release</mark> today"
+
+
+def test_markup_in_text_is_escaped() -> None:
+    highlighted = (
+        f'<img src=x onerror="alert(1)"> {HIGHLIGHT_START}alert{HIGHLIGHT_STOP}'
+    )
+
+    assert render_snippet(highlighted) == (
+        "&lt;img src=x onerror=&quot;alert(1)&quot;&gt; <mark>alert</mark>"
+    )
+
+
+def test_literal_mark_tags_in_text_are_escaped() -> None:
+    assert render_snippet("<mark>x</mark>") == "&lt;mark&gt;x&lt;/mark&gt;"
@@ -0,0 +1,22 @@
+import pytest
+
+from app.util.enums.status import Status
+
+
+@pytest.mark.parametrize(
+    ("status", "failure"),
+    [
+        (Status.PROCESSING, Status.TRANSCRIBE_FAILED),
+        (Status.TRANSCRIBING, Status.TRANSCRIBE_FAILED),
+        (Status.TRANSCRIBED, Status.SUMMARIZE_FAILED),
+        (Status.SUMMARIZING, Status.SUMMARIZE_FAILED),
+        (Status.SUMMARIZED, Status.SUMMARIZE_FAILED),
+        (Status.COMPLETED, Status.COMPLETED),
+        (Status.TRANSCRIBE_FAILED, Status.TRANSCRIBE_FAILED),
+    ],
+)
+def test_failure_is_the_failed_status_of_the_stage(
+    status: Status, failure: Status
+) -> None:
+    assert status.failure is failure
+    assert failure.is_terminal
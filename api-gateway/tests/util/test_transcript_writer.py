@@ -0,0 +1,71 @@
+from collections.abc import AsyncIterator
+
+import orjson
+import pytest
+
+from app.domain.model.meeting.transcript_segment import TranscriptSegment
+from app.util.enums.transcript_format import TranscriptFormat
+from app.util.transcript_writer import format_timestamp, render_transcript
+
+SEGMENTS = [
+    TranscriptSegment(start=0.0, end=1.5, text=" Hello "),
+    TranscriptSegment(start=1.5, end=3661.25, text="World"),
+]
+
+
+async def _segments() -> AsyncIterator[TranscriptSegment]:
+    for segment in SEGMENTS:
+        yield segment
+
+
+async def _render(format: TranscriptFormat, flush_bytes: int = 1024) -> bytes:
+    chunks = [
+        chunk
+        async for chunk in render_transcript(
+            _segments(), format, flush_bytes=flush_bytes
+        )
+    ]
+    return b"".join(chunks)
+
+
+def test_format_timestamp() -> None:
+    assert format_timestamp(3661.25) == "01:01:01.250"
+    assert format_timestamp(-1, separator=",") == "00:00:00,000"
+
+
+@pytest.mark.asyncio
+async def test_srt_numbers_cues() -> None:
+    body = await _render(TranscriptFormat.SRT)
+
+    assert body.decode() == (
+        "1\n00:00:00,000 --> 00:00:01,500\nHello\n\n"
+        "2\n00:00:01,500 --> 01:01:01,250\nWorld\n\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_vtt_has_header_and_no_numbers() -> None:
+    body = await _render(TranscriptFormat.VTT)
+
+    assert body.decode() == (
+        "WEBVTT\n\n"
+        "00:00:00.000 --> 00:00:01.500\nHello\n\n"
+        "00:00:01.500 --> 01:01:01.250\nWorld\n\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_txt_is_one_line_per_segment() -> None:
+    assert await _render(TranscriptFormat.TXT) == b"Hello\nWorld\n"
+
+
+@pytest.mark.asyncio
+async def test_json_is_valid_across_flushes() -> None:
+    body = await _render(TranscriptFormat.JSON, flush_bytes=1)
+
+    assert orjson.loads(body) == {
+        "segments": [
+            {"start": 0.0, "end": 1.5, "text": " Hello "},
+            {"start": 1.5, "end": 3661.25, "text": "World"},
+        ]
+    }
@@ -0,0 +1 @@
+"""Code shared by the API gateway and the pipeline workers."""
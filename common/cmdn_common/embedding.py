@@ -0,0 +1,129 @@
+"""Hashed bag-of-words text embeddings and transcript windowing.
+
+Transcripts are cut into ~30 second windows and embedded with a hashed bag
+of words (unigrams and bigrams), so no model or external service is needed.
+The transcribe worker indexes meetings, the summarize worker rebuilds stale
+indexes and the API gateway embeds search queries; all of them must embed
+the same way. Bump EMBEDDER_VERSION when anything here changes, so indexes
+written by the previous version are ignored and rebuilt.
+"""
+
+import re
+import zlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Protocol
+
+import numpy as np
+
+EMBEDDER_VERSION = 1
+DIMENSIONS = 512  # Power of two, so a hash maps to a column with a mask
+WINDOW_SECONDS = 30.0
+
+_TOKEN_RE = re.compile(r"\w+")
+_SIGN_BIT = 1 << 31
+
+
+class TimedText(Protocol):
+    """A transcript segment: text spoken between two offsets in seconds."""
+
+    start: float
+    end: float
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class MeetingIndex:
+    """Window embeddings of one meeting, rows in time order."""
+
+    vectors: np.ndarray  # (windows, DIMENSIONS) float16, L2-normalised
+    centroid: np.ndarray  # (DIMENSIONS,) float32, L2-normalised
+    starts: list[float]
+    ends: list[float]
+    seq_from: list[int]  # First segment (meeting_segments.seq) of each window
+    seq_to: list[int]  # Last segment of each window, inclusive
+
+    @property
+    def size(self) -> int:
+        """Number of windows."""
+        return len(self.starts)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens, dropping single characters."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if len(token) > 1]
+
+
+def embed_texts(texts: Sequence[str]) -> np.ndarray:
+    """Embed texts as L2-normalised float32 rows of a hashed feature space."""
+    matrix = np.zeros((len(texts), DIMENSIONS), dtype=np.float32)
+
+    for row, text in enumerate(texts):
+        tokens = tokenize(text)
+        features = tokens + [f"{a} {b}" for a, b in pairwise(tokens)]
+        if not features:
+            continue
+        hashes = np.fromiter(
+            (zlib.crc32(feature.encode()) for feature in features),
+            dtype=np.uint32,
+            count=len(features),
+        )
+        signs = np.where(hashes & _SIGN_BIT, -1.0, 1.0).astype(np.float32)
+        np.add.at(matrix[row], hashes & (DIMENSIONS - 1), signs)
+
+    # Sublinear term frequency keeps repeated filler words from dominating
+    matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def build_meeting_index(
+    segments: Sequence[TimedText], *, seqs: Sequence[int] | None = None
+) -> MeetingIndex | None:
+    """Embed a transcript window by window; None when there is no text.
+
+    seqs gives the meeting_segments.seq of each segment and defaults to the
+    segment's position in the transcript.
+    """
+    if seqs is None:
+        seqs = range(len(segments))
+
+    texts: list[str] = []
+    starts: list[float] = []
+    ends: list[float] = []
+    seq_from: list[int] = []
+    seq_to: list[int] = []
+
+    window: list[str] = []
+    for i, (seq, segment) in enumerate(zip(seqs, segments, strict=True)):
+        if not window:
+            seq_from.append(seq)
+            starts.append(segment.start)
+        window.append(segment.text.strip())
+
+        last = i == len(segments) - 1
+        if last or segment.end - starts[-1] >= WINDOW_SECONDS:
+            texts.append(" ".join(window))
+            ends.append(segment.end)
+            seq_to.append(seq)
+            window = []
+
+    if not texts:
+        return None
+
+    vectors = embed_texts(texts)
+    centroid = vectors.mean(axis=0)
+    norm = np.linalg.norm(centroid)
+    if norm == 0:
+        return None
+
+    return MeetingIndex(
+        vectors=vectors.astype(np.float16),
+        centroid=(centroid / norm).astype(np.float32),
+        starts=starts,
+        ends=ends,
+        seq_from=seq_from,
+        seq_to=seq_to,
+    )
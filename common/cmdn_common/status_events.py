@@ -0,0 +1,65 @@
+"""Meeting status snapshots and events published to Redis.
+
+Workers keep one snapshot hash per meeting and publish the merged snapshot
+on the meeting's channel after every change. The gateway serves status
+polls from the hash and streams the events to clients. Publishing is
+best-effort: a Redis outage must never fail a task, the database stays
+authoritative.
+"""
+
+import json
+import logging
+from uuid import UUID
+
+from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+STATUS_TTL_SECONDS = 24 * 3600
+
+
+def status_key(meeting_id: UUID) -> str:
+    """Redis key of the status snapshot hash of a meeting."""
+    return f"meeting:{meeting_id}:status"
+
+
+def events_channel(meeting_id: UUID) -> str:
+    """Redis pub/sub channel of the status events of a meeting."""
+    return f"meeting:{meeting_id}:events"
+
+
+def publish_status(
+    redis: Redis, meeting_id: UUID, status: str, **counters: int | None
+) -> None:
+    """Update the status snapshot and publish the merged snapshot as an event.
+
+    Counters (e.g. transcribe_done=3) are merged into the snapshot; those
+    passed as None keep their previous value.
+    """
+    fields: dict[str, str | int] = {"meeting_id": str(meeting_id), "status": status}
+    fields.update({
+        name: value for name, value in counters.items() if value is not None
+    })
+
+    try:
+        key = status_key(meeting_id)
+
+        pipe = redis.pipeline()
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, STATUS_TTL_SECONDS)
+        pipe.hgetall(key)
+        snapshot = pipe.execute()[-1]
+
+        redis.publish(events_channel(meeting_id), json.dumps(_decode(snapshot)))
+    except Exception as e:
+        logger.warning(f"Failed to publish status for meeting {meeting_id}: {e}")
+
+
+def _decode(snapshot: dict) -> dict[str, str]:
+    """Snapshot fields as text, whether or not the client decodes responses."""
+    return {
+        (k.decode() if isinstance(k, bytes) else k): (
+            v.decode() if isinstance(v, bytes) else v
+        )
+        for k, v in snapshot.items()
+    }
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from cmdn_common.embedding import (
+    DIMENSIONS,
+    build_meeting_index,
+    embed_texts,
+    tokenize,
+)
+
+
+@dataclass
+class _Segment:
+    start: float
+    end: float
+    text: str
+
+
+# Pinned output of EMBEDDER_VERSION 1. Stored indexes are only comparable
+# with queries embedded the same way, so a change here must bump the version.
+PINNED_TEXT = "Ship the release on Friday, then ship the docs."
+PINNED_COLUMNS = {
+    15: 0.3681,
+    45: 0.2323,
+    64: -0.2323,
+    199: 0.2323,
+    285: -0.2323,
+    292: -0.3681,
+    301: -0.2323,
+    318: 0.2323,
+    392: 0.2323,
+    439: 0.2323,
+    455: 0.2323,
+    456: 0.2323,
+    486: 0.3681,
+    498: 0.2323,
+}
+
+
+def test_embedding_matches_pinned_vector() -> None:
+    (row,) = embed_texts([PINNED_TEXT])
+
+    columns = np.flatnonzero(row)
+    assert columns.tolist() == sorted(PINNED_COLUMNS)
+    assert row[columns].tolist() == pytest.approx(
+        list(PINNED_COLUMNS.values()), abs=1e-4
+    )
+
+
+def test_tokenize_drops_single_characters() -> None:
+    assert tokenize("A plan, B-side & Q3") == ["plan", "side", "q3"]
+
+
+def test_rows_are_unit_length_or_zero() -> None:
+    matrix = embed_texts(["budget review", "", "a"])
+
+    assert matrix.shape == (3, DIMENSIONS)
+    assert np.linalg.norm(matrix[0]) == pytest.approx(1.0)
+    assert not matrix[1].any()
+    assert not matrix[2].any()
+
+
+def test_index_cuts_windows_at_window_seconds() -> None:
+    segments = [
+        _Segment(0.0, 10.0, "budget review"),
+        _Segment(10.0, 31.0, "hiring plan"),
+        _Segment(31.0, 40.0, "launch date"),
+    ]
+
+    index = build_meeting_index(segments, seqs=[5, 6, 7])
+
+    assert index is not None
+    assert index.size == 2
+    assert index.starts == [0.0, 31.0]
+    assert index.ends == [31.0, 40.0]
+    assert index.seq_from == [5, 7]
+    assert index.seq_to == [6, 7]
+    assert index.vectors.shape == (2, DIMENSIONS)
+    assert np.linalg.norm(index.centroid) == pytest.approx(1.0, abs=1e-6)
+
+
+def test_index_defaults_seqs_to_positions() -> None:
+    index = build_meeting_index([_Segment(0.0, 1.0, "hello world")])
+
+    assert index is not None
+    assert (index.seq_from, index.seq_to) == ([0], [0])
+
+
+def test_index_is_none_without_text() -> None:
+    assert build_meeting_index([]) is None
+    assert build_meeting_index([_Segment(0.0, 1.0, "a")]) is None
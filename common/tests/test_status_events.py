@@ -0,0 +1,66 @@
+import json
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from cmdn_common.status_events import (
+    STATUS_TTL_SECONDS,
+    events_channel,
+    publish_status,
+    status_key,
+)
+
+
+@pytest.fixture(params=[True, False], ids=["decoded", "raw"])
+def redis(request: pytest.FixtureRequest) -> fakeredis.FakeRedis:
+    return fakeredis.FakeRedis(decode_responses=request.param)
+
+
+def test_publishes_merged_snapshot(redis: fakeredis.FakeRedis) -> None:
+    meeting_id = uuid4()
+    pubsub = redis.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(events_channel(meeting_id))
+
+    publish_status(redis, meeting_id, "transcribing", transcribe_total=4)
+    publish_status(redis, meeting_id, "transcribing", transcribe_done=1)
+
+    events = [
+        json.loads(message["data"])
+        for _ in range(3)
+        if (message := pubsub.get_message()) is not None
+    ]
+    assert len(events) == 2
+    assert events[-1] == {
+        "meeting_id": str(meeting_id),
+        "status": "transcribing",
+        "transcribe_total": "4",
+        "transcribe_done": "1",
+    }
+    assert 0 < redis.ttl(status_key(meeting_id)) <= STATUS_TTL_SECONDS
+
+
+def test_none_counters_keep_previous_value(redis: fakeredis.FakeRedis) -> None:
+    meeting_id = uuid4()
+
+    publish_status(redis, meeting_id, "summarizing", summarize_done=2)
+    publish_status(redis, meeting_id, "summarized", summarize_done=None)
+
+    snapshot = redis.hgetall(status_key(meeting_id))
+    assert {
+        (k.decode() if isinstance(k, bytes) else k): (
+            v.decode() if isinstance(v, bytes) else v
+        )
+        for k, v in snapshot.items()
+    } == {
+        "meeting_id": str(meeting_id),
+        "status": "summarized",
+        "summarize_done": "2",
+    }
+
+
+def test_redis_errors_are_swallowed() -> None:
+    redis = fakeredis.FakeRedis()
+    redis.connected = False
+
+    publish_status(redis, uuid4(), "transcribed")
@@ -0,0 +1,28 @@
+"""Cache layer for summarize service."""
+
+from src.cache.answers import cache_answer, get_cached_answer
+from src.cache.checkpoints import SummaryCheckpoints
+from src.cache.events import publish_status
+from src.cache.llm import (
+    cache_response,
+    evict_response,
+    get_cache_stats,
+    get_cached_response,
+    response_key,
+)
+from src.cache.pipeline import TranscriptPipeline
+from src.cache.redis import get_redis
+
+__all__ = [
+    "SummaryCheckpoints",
+    "TranscriptPipeline",
+    "cache_answer",
+    "cache_response",
+    "evict_response",
+    "get_cache_stats",
+    "get_cached_answer",
+    "get_cached_response",
+    "get_redis",
+    "publish_status",
+    "response_key",
+]
@@ -0,0 +1,43 @@
+"""Cached answers to questions about a meeting.
+
+Keys include a version of the meeting (its updated_at), so re-summarising or
+editing a meeting orphans its old answers; the TTL cleans them up.
+"""
+
+import hashlib
+import json
+import logging
+from uuid import UUID
+
+from src.cache.redis import get_redis
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _answer_key(meeting_id: UUID, version: str, question: str) -> str:
+    """Generate Redis key for an answer to a normalised question."""
+    digest = hashlib.sha256(f"{version}\n{question}".encode()).hexdigest()[:32]
+    return f"meeting:{meeting_id}:qa:{digest}"
+
+
+def get_cached_answer(meeting_id: UUID, version: str, question: str) -> dict | None:
+    """Get a cached answer, treating Redis errors as a miss."""
+    try:
+        raw = get_redis().get(_answer_key(meeting_id, version, question))
+    except Exception as e:
+        logger.warning(f"Failed to read cached answer for meeting {meeting_id}: {e}")
+        return None
+    return json.loads(raw) if raw else None
+
+
+def cache_answer(meeting_id: UUID, version: str, question: str, answer: dict) -> None:
+    """Cache an answer (best-effort)."""
+    try:
+        get_redis().set(
+            _answer_key(meeting_id, version, question),
+            json.dumps(answer, ensure_ascii=False),
+            ex=settings.qa_cache_ttl_seconds,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache answer for meeting {meeting_id}: {e}")
@@ -0,0 +1,56 @@
+"""Checkpoints of intermediate summaries.
+
+Every LLM output of the summarisation tree (chunk summaries, then every
+merge) is stored under a digest of its model and prompt as soon as it
+finishes, so a retried task only repeats the calls that did not, and a
+change of routed model does not reuse the other model's outputs. A
+meeting's outputs share one Redis hash, which expires as a whole.
+Checkpoints are best-effort: a Redis error only costs the recomputation.
+"""
+
+import hashlib
+import logging
+from uuid import UUID
+
+from src.cache.redis import get_redis
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCheckpoints:
+    """Prompt outputs of one meeting's summarisation."""
+
+    def __init__(self, meeting_id: UUID):
+        self.meeting_id = meeting_id
+
+    @property
+    def _key(self) -> str:
+        return f"meeting:{self.meeting_id}:summary"
+
+    @staticmethod
+    def _field(model: str, prompt: str) -> str:
+        """Hash field of a prompt's output from model."""
+        return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()[:32]
+
+    def load(self, model: str, prompts: list[str]) -> list[str | None]:
+        """Get model's stored output of each prompt, None where there is none."""
+        if not prompts:
+            return []
+        try:
+            return get_redis().hmget(
+                self._key, [self._field(model, p) for p in prompts]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load summary checkpoints: {e}")
+            return [None] * len(prompts)
+
+    def save(self, model: str, prompt: str, output: str) -> None:
+        """Store model's output of a finished prompt."""
+        try:
+            pipe = get_redis().pipeline()
+            pipe.hset(self._key, self._field(model, prompt), output)
+            pipe.expire(self._key, settings.summary_checkpoint_ttl_seconds)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to save summary checkpoint: {e}")
@@ -0,0 +1,29 @@
+"""Meeting status snapshots and events published to Redis.
+
+Shared with the transcribe service through cmdn_common.status_events; this
+module binds the summarize counters and the worker's Redis client.
+"""
+
+from uuid import UUID
+
+from cmdn_common.status_events import publish_status as _publish_status
+
+from src.cache.redis import get_redis
+from src.utils.enums import MeetingStatus
+
+
+def publish_status(
+    meeting_id: UUID,
+    status: MeetingStatus,
+    *,
+    summarize_done: int | None = None,
+    summarize_total: int | None = None,
+) -> None:
+    """Update status snapshot and publish the merged snapshot as an event."""
+    _publish_status(
+        get_redis(),
+        meeting_id,
+        status.value,
+        summarize_done=summarize_done,
+        summarize_total=summarize_total,
+    )
@@ -0,0 +1,63 @@
+"""Content-addressed cache of LLM responses.
+
+Keys digest everything that determines a completion (model, prompt
+version, parameters and the prompt itself), so retries and re-runs of a
+summarisation reuse every call that already succeeded. Reads refresh the
+TTL, so entries still in use stay while idle ones expire. Hits and misses
+are counted in a Redis hash for monitoring. Caching is best-effort: a
+Redis error counts as a miss.
+"""
+
+import hashlib
+import json
+import logging
+
+from src.cache.redis import get_redis
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+STATS_KEY = "llm:cache:stats"
+
+
+def response_key(**params: object) -> str:
+    """Generate Redis key for a completion from its parameters."""
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return f"llm:response:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+def get_cached_response(key: str) -> str | None:
+    """Get a cached response, refreshing its TTL and counting the lookup."""
+    try:
+        redis = get_redis()
+        response = redis.getex(key, ex=settings.llm_cache_ttl_seconds)
+        redis.hincrby(STATS_KEY, "hits" if response is not None else "misses")
+    except Exception as e:
+        logger.warning(f"Failed to read LLM cache: {e}")
+        return None
+    return response
+
+
+def cache_response(key: str, response: str) -> None:
+    """Cache a response (best-effort)."""
+    try:
+        get_redis().set(key, response, ex=settings.llm_cache_ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Failed to write LLM cache: {e}")
+
+
+def evict_response(key: str) -> None:
+    """Drop a cached response (best-effort)."""
+    try:
+        get_redis().delete(key)
+    except Exception as e:
+        logger.warning(f"Failed to evict LLM cache entry: {e}")
+
+
+def get_cache_stats() -> dict[str, int]:
+    """Hit and miss counts since the stats were last reset."""
+    stats = get_redis().hgetall(STATS_KEY)
+    return {
+        "hits": int(stats.get("hits", 0)),
+        "misses": int(stats.get("misses", 0)),
+    }
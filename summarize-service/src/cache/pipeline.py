@@ -0,0 +1,94 @@
+"""Transcript chunks buffered for pipelined summarisation.
+
+The transcribe service hands over each audio chunk's segments as soon as it
+is transcribed, in any order. They are kept here until the summarizer has
+consumed them in order, along with how far it got.
+"""
+
+import json
+import logging
+from uuid import UUID
+
+from redis.exceptions import LockNotOwnedError
+from redis.lock import Lock
+
+from src.cache.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_TTL_SECONDS = 6 * 3600
+# Lease on the pipeline, renewed as each chunk summary finishes
+LOCK_TIMEOUT_SECONDS = 15 * 60
+
+
+class TranscriptPipeline:
+    """Buffered transcript chunks and progress of one meeting."""
+
+    def __init__(self, meeting_id: UUID):
+        self.meeting_id = meeting_id
+        prefix = f"meeting:{meeting_id}:pipeline"
+        self._chunks_key = f"{prefix}:chunks"
+        self._state_key = f"{prefix}:state"
+        self._lock_key = f"{prefix}:lock"
+
+    def add_chunk(self, chunk_id: int, lines: list[str]) -> None:
+        """Buffer a transcribed chunk and flag the pipeline for another pass."""
+        pipe = get_redis().pipeline()
+        pipe.hset(self._chunks_key, str(chunk_id), json.dumps(lines))
+        pipe.hset(self._state_key, "dirty", 1)
+        pipe.expire(self._chunks_key, PIPELINE_TTL_SECONDS)
+        pipe.expire(self._state_key, PIPELINE_TTL_SECONDS)
+        pipe.execute()
+
+    def contiguous_lines(self) -> tuple[int, list[str]]:
+        """Lines of chunks 0..n-1 that have all arrived, and n."""
+        chunks = get_redis().hgetall(self._chunks_key)
+        lines: list[str] = []
+        count = 0
+        while (data := chunks.get(str(count))) is not None:
+            lines.extend(json.loads(data))
+            count += 1
+        return count, lines
+
+    def lock(self) -> Lock:
+        """Non-blocking lock; one worker advances a meeting at a time."""
+        return get_redis().lock(
+            self._lock_key, timeout=LOCK_TIMEOUT_SECONDS, blocking=False
+        )
+
+    def extend_lock(self, lock: Lock) -> None:
+        """Renew the lease; raises LockNotOwnedError if it already expired."""
+        lock.extend(LOCK_TIMEOUT_SECONDS, replace_ttl=True)
+
+    def release_lock(self, lock: Lock) -> None:
+        """Release the lock, logging if it expired while held."""
+        try:
+            lock.release()
+        except LockNotOwnedError:
+            logger.warning(
+                f"Pipeline lock of {self.meeting_id} expired while held; "
+                f"another worker may have advanced it meanwhile"
+            )
+
+    def take_dirty(self) -> bool:
+        """Clear the new-chunk flag, returning whether it was set."""
+        return bool(get_redis().hdel(self._state_key, "dirty"))
+
+    def is_dirty(self) -> bool:
+        """Whether chunks arrived since the flag was last taken."""
+        return bool(get_redis().hexists(self._state_key, "dirty"))
+
+    def summarized(self) -> int:
+        """Number of summary chunks already summarized."""
+        return int(get_redis().hget(self._state_key, "summarized") or 0)
+
+    def set_summarized(self, count: int) -> None:
+        """Record the number of summary chunks summarized."""
+        get_redis().hset(self._state_key, "summarized", count)
+
+    def clear(self) -> None:
+        """Drop the buffered chunks once the full transcript is summarized."""
+        try:
+            get_redis().delete(self._chunks_key, self._state_key)
+        except Exception as e:
+            logger.warning(f"Failed to clear pipeline of {self.meeting_id}: {e}")
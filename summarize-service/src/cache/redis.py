@@ -0,0 +1,23 @@
+"""Redis client management."""
+
+import redis
+
+from src.config import settings
+
+
+class _RedisClientHolder:
+    """Holder for Redis client singleton."""
+
+    _instance: redis.Redis | None = None
+
+    @classmethod
+    def get_client(cls) -> redis.Redis:
+        """Get or create Redis client."""
+        if cls._instance is None:
+            cls._instance = redis.from_url(settings.redis_url, decode_responses=True)
+        return cls._instance
+
+
+def get_redis() -> redis.Redis:
+    """Get Redis client (singleton)."""
+    return _RedisClientHolder.get_client()
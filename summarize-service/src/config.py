@@ -2,13 +2,27 @@
 
 from pathlib import Path
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 ENV_FILE = PROJECT_ROOT / ".env"
 
 
+class ModelRateLimit(BaseModel):
+    """Provider quota of one model, shared by every worker."""
+
+    requests_per_minute: int = Field(ge=1)
+    tokens_per_minute: int = Field(ge=1)
+
+
+class ModelPrice(BaseModel):
+    """Price of a model in USD per million tokens."""
+
+    input_per_million: float = Field(ge=0.0)
+    output_per_million: float = Field(ge=0.0)
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
@@ -41,13 +55,46 @@ class Settings(BaseSettings):
     llm_base_url: str
     llm_max_tokens: int = Field(ge=1)
     llm_temperature: float = Field(ge=0.0, le=2.0)
+    # Models per stage as JSON, e.g. {"chunk": "fast-model", "merge": "fast-model",
+    # "extract": "fast-model"}; stages not listed use llm_model
+    llm_stage_models: dict[str, str] = Field(default_factory=dict)
+    # Transcripts under this many tokens use the chunk model for merges too
+    llm_short_transcript_tokens: int = Field(default=0, ge=0)
+    # Prices for models LiteLLM does not know (e.g. proxy aliases)
+    llm_model_prices: dict[str, ModelPrice] = Field(default_factory=dict)
+    # Connections kept open to the LLM proxy, shared by all tasks of a worker
+    llm_max_connections: int = Field(default=64, ge=1)
+    llm_timeout_seconds: float = Field(default=120.0, gt=0)
+    # Per-model quotas as JSON, e.g. {"best-model": {"requests_per_minute": 500,
+    # "tokens_per_minute": 200000}}; models not listed are not limited
+    llm_rate_limits: dict[str, ModelRateLimit] = Field(default_factory=dict)
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, ge=60)
 
     # Summarization
-    summary_chunk_size: int = Field(ge=1000)
+    # Chunk size in model tokens; chunks end on sentence or segment boundaries
+    summary_chunk_tokens: int = Field(default=12000, ge=500)
+    summary_chunk_overlap_tokens: int = Field(default=200, ge=0)
+    # Extractive pre-filter: share of the transcript kept (1.0 disables it),
+    # applied only to transcripts of at least this many sentences/segments
+    summary_prefilter_keep_ratio: float = Field(default=1.0, gt=0.0, le=1.0)
+    summary_prefilter_min_units: int = Field(default=300, ge=1)
     max_retries: int = Field(ge=1, le=10)
     retry_delay: float = Field(ge=0.1)
+    # Chunk summaries requested from the LLM at once
+    summary_concurrency: int = Field(default=4, ge=1, le=32)
+    # Tokens of chunk summaries merged in one call; longer meetings merge in levels
+    summary_merge_budget_tokens: int = Field(default=24000, ge=1000)
+    summary_checkpoint_ttl_seconds: int = Field(default=24 * 3600, ge=60)
+
+    # Question answering
+    qa_top_k: int = Field(default=6, ge=1, le=50)
+    qa_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, ge=60)
 
     # Celery
+    # threads runs many I/O-bound tasks per process; prefork autoscales processes
+    celery_pool: str = Field(default="threads", pattern="^(threads|prefork|solo)$")
+    celery_concurrency: int = Field(default=8, ge=1)
     celery_autoscale: str
     celery_prefetch_multiplier: int = Field(ge=1)
     celery_max_tasks_per_child: int = Field(ge=1)
@@ -2,6 +2,10 @@
 
 from src.database.repository import (
     get_meeting,
+    get_meeting_embedding,
+    list_segments,
+    list_segments_in_ranges,
+    save_meeting_embedding,
     save_tasks,
     update_key_notes,
     update_meeting_status,
@@ -13,7 +17,11 @@ __all__ = [
     "SessionLocal",
     "engine",
     "get_meeting",
+    "get_meeting_embedding",
     "get_session",
+    "list_segments",
+    "list_segments_in_ranges",
+    "save_meeting_embedding",
     "save_tasks",
     "update_key_notes",
     "update_meeting_status",
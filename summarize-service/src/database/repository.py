@@ -2,9 +2,10 @@
 
 from uuid import UUID
 
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from src.models import Meeting, Task
+from src.models import Meeting, MeetingEmbedding, MeetingSegment, Task
 from src.utils.enums import MeetingStatus
 from src.utils.exceptions import MeetingNotFoundError
 
@@ -57,3 +58,47 @@ def save_tasks(session: Session, tasks: list[Task]) -> int:
     """Save multiple tasks in batch."""
     session.add_all(tasks)
     return len(tasks)
+
+
+def list_segments(session: Session, meeting_id: UUID) -> list[MeetingSegment]:
+    """List transcript segments of a meeting in transcript order."""
+    return (
+        session.query(MeetingSegment)
+        .filter(MeetingSegment.meeting_id == meeting_id)
+        .order_by(MeetingSegment.seq)
+        .all()
+    )
+
+
+def list_segments_in_ranges(
+    session: Session, meeting_id: UUID, ranges: list[tuple[int, int]]
+) -> list[MeetingSegment]:
+    """List segments whose seq falls in any of the inclusive ranges."""
+    if not ranges:
+        return []
+    return (
+        session.query(MeetingSegment)
+        .filter(
+            MeetingSegment.meeting_id == meeting_id,
+            or_(
+                *(
+                    MeetingSegment.seq.between(seq_from, seq_to)
+                    for seq_from, seq_to in ranges
+                )
+            ),
+        )
+        .order_by(MeetingSegment.seq)
+        .all()
+    )
+
+
+def get_meeting_embedding(
+    session: Session, meeting_id: UUID
+) -> MeetingEmbedding | None:
+    """Get the semantic index of a meeting, if it has one."""
+    return session.get(MeetingEmbedding, meeting_id)
+
+
+def save_meeting_embedding(session: Session, embedding: MeetingEmbedding) -> None:
+    """Insert or replace the semantic index of a meeting (does not commit)."""
+    session.merge(embedding)
@@ -1,6 +1,7 @@
 """Data models."""
 
 from src.models.meeting import Base, Meeting
+from src.models.meeting_index import MeetingEmbedding, MeetingSegment
 from src.models.task import Task
 
-__all__ = ["Base", "Meeting", "Task"]
+__all__ = ["Base", "Meeting", "MeetingEmbedding", "MeetingSegment", "Task"]
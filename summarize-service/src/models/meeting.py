@@ -22,7 +22,6 @@ class Meeting(Base):
     duration = Column(Float, nullable=True, comment="Audio duration in seconds")
     status = Column(String(50), nullable=False, default="processing")
     transcribe_text = Column(Text, nullable=True)
-    transcribe_segments = Column(JSONB, nullable=True)
     summary_text = Column(Text, nullable=True)
     key_notes = Column(JSONB, nullable=True)
     transcribe_total = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,50 @@
+"""Transcript segment and semantic index models."""
+
+from sqlalchemy import (
+    Column,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from src.models.meeting import Base
+
+
+class MeetingSegment(Base):
+    """Timed transcript segment, written by the transcribe service."""
+
+    __tablename__ = "meeting_segments"
+
+    meeting_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq = Column(Integer, primary_key=True)
+    start = Column(Float, nullable=False, comment="Start time in seconds")
+    end = Column(Float, nullable=False, comment="End time in seconds")
+    text = Column(Text, nullable=False)
+
+
+class MeetingEmbedding(Base):
+    """Window embeddings of a meeting transcript."""
+
+    __tablename__ = "meeting_embeddings"
+
+    meeting_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version = Column(SmallInteger, nullable=False)
+    dimensions = Column(Integer, nullable=False)
+    centroid = Column(LargeBinary, nullable=False, comment="float32 vector")
+    vectors = Column(LargeBinary, nullable=False, comment="float16 window matrix")
+    starts = Column(ARRAY(Float), nullable=False)
+    ends = Column(ARRAY(Float), nullable=False)
+    seq_from = Column(ARRAY(Integer), nullable=False)
+    seq_to = Column(ARRAY(Integer), nullable=False)
@@ -1,5 +1,17 @@
 """External service providers for summarize service."""
 
-from src.providers.llm import LLMClient
+from src.providers.llm import LLMClient, get_llm_client
+from src.providers.rate_limit import RateLimiter, fair_share, rate_limit_state
+from src.providers.routing import route_model
+from src.providers.usage import UsageLedger, track_usage
 
-__all__ = ["LLMClient"]
+__all__ = [
+    "LLMClient",
+    "RateLimiter",
+    "UsageLedger",
+    "fair_share",
+    "get_llm_client",
+    "rate_limit_state",
+    "route_model",
+    "track_usage",
+]
@@ -1,18 +1,61 @@
-"""LiteLLM AI client."""
+"""LiteLLM AI client.
 
+One client per process: completions run as coroutines on a background event
+loop sharing a keep-alive connection pool, so any number of worker threads
+can keep requests in flight without a socket (or TLS handshake) per call.
+"""
+
+import asyncio
 import logging
+import threading
+import time
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
+import httpx
 import litellm
+from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.cache.llm import (
+    cache_response,
+    evict_response,
+    get_cached_response,
+    response_key,
+)
 from src.config import settings
+from src.providers.rate_limit import RateLimiter
+from src.providers.routing import route_model
+from src.providers.usage import current_ledger
+from src.utils.enums import LLMStage
 from src.utils.exceptions import AIServiceError
+from src.utils.prompts import PROMPTS_VERSION
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class _EventLoopThread:
+    """Event loop running in a daemon thread, accepting work from any thread."""
+
+    def __init__(self, name: str):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
 
 class LLMClient:
-    """LiteLLM AI client with retry logic."""
+    """LiteLLM AI client with retry logic and a response cache.
+
+    Use get_llm_client() rather than building one per task.
+    """
 
     def __init__(self):
         self.model = settings.llm_model
@@ -20,25 +63,176 @@ class LLMClient:
         self.api_key = settings.google_api_key
         self.max_tokens = settings.llm_max_tokens
         self.temperature = settings.llm_temperature
+        self.cache_enabled = settings.llm_cache_enabled
+
+        self._runner = _EventLoopThread("llm-client")
+        self._client = AsyncOpenAI(
+            base_url=self.api_base,
+            api_key=self.api_key,
+            max_retries=0,  # Retried by tenacity
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_connections,
+                ),
+                timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=10.0),
+            ),
+        )
+
+        self._limiters = {
+            model: RateLimiter(model, limit)
+            for model, limit in settings.llm_rate_limits.items()
+        }
+
         logger.info(f"🤖 LiteLLM initialized: {self.model} @ {self.api_base}")
 
+    def count_tokens(self, text: str) -> int:
+        """Count prompt tokens of text for the configured model."""
+        return litellm.token_counter(model=self.model, text=text)
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        stage: LLMStage,
+        model: str | None = None,
+        cache: bool = True,
+        response_format: dict | None = None,
+    ) -> str:
+        """Generate text, serving repeated prompts from the response cache.
+
+        The model is routed by stage unless given. response_format, if given,
+        is passed to the model (e.g. a JSON schema).
+        """
+        model = model or route_model(stage)
+        if not (cache and self.cache_enabled):
+            return self._complete(prompt, model, stage, response_format)
+
+        key = self._cache_key(prompt, model, response_format)
+        cached = get_cached_response(key)
+        if cached is not None:
+            logger.debug("LLM cache hit")
+            if (ledger := current_ledger()) is not None:
+                ledger.record(stage, model, cached=True)
+            return cached
+
+        response = self._complete(prompt, model, stage, response_format)
+        cache_response(key, response)
+        return response
+
+    def evict(
+        self,
+        prompt: str,
+        *,
+        stage: LLMStage,
+        model: str | None = None,
+        response_format: dict | None = None,
+    ) -> None:
+        """Drop a cached response, e.g. one that failed validation."""
+        if self.cache_enabled:
+            model = model or route_model(stage)
+            evict_response(self._cache_key(prompt, model, response_format))
+
+    def _cache_key(self, prompt: str, model: str, response_format: dict | None) -> str:
+        return response_key(
+            model=model,
+            prompts_version=PROMPTS_VERSION,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            response_format=response_format,
+            prompt=prompt,
+        )
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
     )
-    def generate(self, prompt: str) -> str:
-        """Generate text with retry logic."""
+    def _complete(
+        self,
+        prompt: str,
+        model: str,
+        stage: LLMStage,
+        response_format: dict | None = None,
+    ) -> str:
+        """Generate text with retry logic, within the model's rate limit."""
+        limiter = self._limiters.get(model)
+        reserved = 0
+        if limiter is not None:
+            # Providers count max_tokens against the limit until the call ends
+            reserved = self.count_tokens(prompt) + self.max_tokens
+            limiter.acquire(reserved)
+
+        started = time.perf_counter()
+        response = self._runner.run(self._acompletion(prompt, model, response_format))
+        latency = time.perf_counter() - started
+
+        usage = getattr(response, "usage", None)
+        if limiter is not None and usage is not None:
+            limiter.refund(reserved - usage.total_tokens)
+
+        if (ledger := current_ledger()) is not None:
+            ledger.record(
+                stage,
+                model,
+                prompt_tokens=usage.prompt_tokens if usage else 0,
+                completion_tokens=usage.completion_tokens if usage else 0,
+                cost=self._cost(model, response),
+                latency_seconds=latency,
+            )
+        return response.choices[0].message.content.strip()
+
+    @staticmethod
+    def _cost(model: str, response: Any) -> float:
+        """Cost of a completion from configured prices, else LiteLLM's table."""
+        usage = getattr(response, "usage", None)
+        price = settings.llm_model_prices.get(model)
+        if price is not None and usage is not None:
+            return (
+                usage.prompt_tokens * price.input_per_million
+                + usage.completion_tokens * price.output_per_million
+            ) / 1_000_000
         try:
-            response = litellm.completion(
-                model=self.model,
+            return litellm.completion_cost(completion_response=response)
+        except Exception:
+            return 0.0  # Unknown model (e.g. a proxy alias without a price)
+
+    async def _acompletion(
+        self, prompt: str, model: str, response_format: dict | None
+    ) -> Any:
+        """Call the model on the shared connection pool."""
+        try:
+            return await litellm.acompletion(
+                client=self._client,
+                model=model,
                 messages=[{"role": "user", "content": prompt}],
                 api_base=self.api_base,
                 api_key=self.api_key,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
+                response_format=response_format,
                 custom_llm_provider="openai",  # OpenAI-compatible API
             )
-            return response.choices[0].message.content.strip()
         except Exception as e:
             logger.error(f"LiteLLM API error: {e}")
             raise AIServiceError(f"Failed to generate content: {e}") from e
+
+
+class _LLMClientHolder:
+    """Holder for LLM client singleton."""
+
+    _instance: LLMClient | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_client(cls) -> LLMClient:
+        """Get or create LLM client."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = LLMClient()
+        return cls._instance
+
+
+def get_llm_client() -> LLMClient:
+    """Get LLM client (singleton per process)."""
+    return _LLMClientHolder.get_client()
@@ -0,0 +1,212 @@
+"""Cluster-wide LLM rate limiting.
+
+Every worker draws from the same Redis token buckets per model: one for
+requests and one for tokens per minute, refilled continuously. Buckets and
+waiters live in one Lua script, so checks are atomic across processes and
+use the Redis clock. Waiting callers are served fairly: the caller (usually
+a meeting) served least recently goes first, so one long meeting cannot
+starve the others.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from src.cache.redis import get_redis
+from src.config import ModelRateLimit, settings
+
+logger = logging.getLogger(__name__)
+
+# Waiters that stopped polling for this long are dropped from the queue
+WAITER_STALE_MS = 5000
+# Upper bound on one sleep, so waiters keep their place fresh
+MAX_POLL_SECONDS = 1.0
+# Sleep when the bucket has capacity but it is another caller's turn
+TURN_POLL_MS = 50
+# Idle buckets expire; a missing bucket is a full one
+BUCKET_TTL_MS = 120000
+# Callers not served for this long are forgotten (they go first next time)
+SERVED_TTL_MS = 3600000
+
+_fair_share_key: ContextVar[str] = ContextVar("llm_fair_share_key", default="-")
+
+# Returns 0 when granted, else milliseconds to wait before asking again
+_ACQUIRE_SCRIPT = """
+local bucket, waiting, served, stats = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local rpm, tpm = tonumber(ARGV[1]), tonumber(ARGV[2])
+local cost, caller = tonumber(ARGV[3]), ARGV[4]
+local stale, turn_poll = tonumber(ARGV[5]), tonumber(ARGV[6])
+local ttl, served_ttl = tonumber(ARGV[7]), tonumber(ARGV[8])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', served, '-inf', now - served_ttl)
+
+-- Register as waiting, then check it is this caller's turn
+redis.call('HSET', waiting, caller, now)
+local entries = redis.call('HGETALL', waiting)
+local turn, turn_served = nil, nil
+for i = 1, #entries, 2 do
+  local other, seen = entries[i], tonumber(entries[i + 1])
+  if now - seen > stale then
+    redis.call('HDEL', waiting, other)
+  else
+    local last = tonumber(redis.call('ZSCORE', served, other) or '0')
+    if turn == nil or last < turn_served then
+      turn, turn_served = other, last
+    end
+  end
+end
+if turn ~= caller then
+  redis.call('HINCRBY', stats, 'deferred', 1)
+  return turn_poll
+end
+
+-- Refill both buckets for the time since the last call
+local state = redis.call('HMGET', bucket, 'requests', 'tokens', 'ts')
+local requests = tonumber(state[1]) or rpm
+local tokens = tonumber(state[2]) or tpm
+local elapsed = math.max(0, now - (tonumber(state[3]) or now))
+requests = math.min(rpm, requests + elapsed * rpm / 60000)
+tokens = math.min(tpm, tokens + elapsed * tpm / 60000)
+cost = math.min(cost, tpm)
+
+local wait = 0
+if requests >= 1 and tokens >= cost then
+  requests = requests - 1
+  tokens = tokens - cost
+  redis.call('HDEL', waiting, caller)
+  redis.call('ZADD', served, now, caller)
+  redis.call('HINCRBY', stats, 'granted', 1)
+else
+  wait = math.ceil(math.max(
+    (1 - requests) * 60000 / rpm, (cost - tokens) * 60000 / tpm, 1))
+  redis.call('HINCRBY', stats, 'throttled', 1)
+end
+
+redis.call('HSET', bucket, 'requests', requests, 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', bucket, ttl)
+redis.call('PEXPIRE', waiting, stale * 2)
+redis.call('PEXPIRE', served, served_ttl)
+return wait
+"""
+
+# Returns unused tokens to the bucket, refilled first and capped at capacity
+_REFUND_SCRIPT = """
+local bucket = KEYS[1]
+local rpm, tpm = tonumber(ARGV[1]), tonumber(ARGV[2])
+local refund, ttl = tonumber(ARGV[3]), tonumber(ARGV[4])
+
+local state = redis.call('HMGET', bucket, 'requests', 'tokens', 'ts')
+if not state[3] then
+  return 0
+end
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local elapsed = math.max(0, now - tonumber(state[3]))
+local requests = math.min(rpm, tonumber(state[1]) + elapsed * rpm / 60000)
+local tokens = math.min(tpm, tonumber(state[2]) + elapsed * tpm / 60000 + refund)
+
+redis.call('HSET', bucket, 'requests', requests, 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', bucket, ttl)
+return 0
+"""
+
+
+@contextmanager
+def fair_share(key: str) -> Iterator[None]:
+    """Queue LLM calls made in this context under key (e.g. a meeting id)."""
+    token = _fair_share_key.set(key)
+    try:
+        yield
+    finally:
+        _fair_share_key.reset(token)
+
+
+def _keys(model: str) -> list[str]:
+    prefix = f"llm:ratelimit:{model}"
+    return [prefix, f"{prefix}:waiting", f"{prefix}:served", f"{prefix}:stats"]
+
+
+class RateLimiter:
+    """Token buckets for one model, shared by all workers through Redis."""
+
+    def __init__(self, model: str, limit: ModelRateLimit):
+        self.model = model
+        self.limit = limit
+        self._keys = _keys(model)
+        redis = get_redis()
+        self._acquire = redis.register_script(_ACQUIRE_SCRIPT)
+        self._refund = redis.register_script(_REFUND_SCRIPT)
+
+    def acquire(self, tokens: int) -> None:
+        """Block until a request costing tokens may be sent."""
+        caller = _fair_share_key.get()
+        waited = 0.0
+        while True:
+            wait_ms = self._acquire(
+                keys=self._keys,
+                args=[
+                    self.limit.requests_per_minute,
+                    self.limit.tokens_per_minute,
+                    tokens,
+                    caller,
+                    WAITER_STALE_MS,
+                    TURN_POLL_MS,
+                    BUCKET_TTL_MS,
+                    SERVED_TTL_MS,
+                ],
+            )
+            if not wait_ms:
+                break
+            delay = min(int(wait_ms) / 1000, MAX_POLL_SECONDS)
+            time.sleep(delay)
+            waited += delay
+
+        if waited:
+            logger.debug(f"Rate limit: {caller} waited {waited:.2f}s for {self.model}")
+
+    def refund(self, tokens: int) -> None:
+        """Return tokens reserved but not used (best-effort)."""
+        if tokens <= 0:
+            return
+        try:
+            self._refund(
+                keys=self._keys[:1],
+                args=[
+                    self.limit.requests_per_minute,
+                    self.limit.tokens_per_minute,
+                    tokens,
+                    BUCKET_TTL_MS,
+                ],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to refund rate limit tokens: {e}")
+
+
+def rate_limit_state(model: str) -> dict[str, float | int]:
+    """Current bucket levels, waiting callers and counters of a model.
+
+    A missing bucket is a full one; a model without a limit has no bucket and
+    reports unlimited levels.
+    """
+    bucket, waiting, _, stats = _keys(model)
+    limit = settings.llm_rate_limits.get(model)
+    redis = get_redis()
+    levels = redis.hgetall(bucket)
+    counters = redis.hgetall(stats)
+    return {
+        "requests_available": float(
+            levels.get("requests", limit.requests_per_minute if limit else "inf")
+        ),
+        "tokens_available": float(
+            levels.get("tokens", limit.tokens_per_minute if limit else "inf")
+        ),
+        "waiting": redis.hlen(waiting),
+        "granted": int(counters.get("granted", 0)),
+        "throttled": int(counters.get("throttled", 0)),
+        "deferred": int(counters.get("deferred", 0)),
+    }
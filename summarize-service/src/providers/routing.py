@@ -0,0 +1,22 @@
+"""Model routing by pipeline stage.
+
+Map-side calls (chunk summaries, intermediate merges, extraction) can go to a
+cheaper, faster model while the final merge keeps the strongest one. Short
+meetings, whose final summary is small, can be routed to the chunk model
+entirely.
+"""
+
+from src.config import settings
+from src.utils.enums import LLMStage
+
+
+def route_model(stage: LLMStage, transcript_tokens: int | None = None) -> str:
+    """Model for a call of the given stage."""
+    models = settings.llm_stage_models
+    if (
+        transcript_tokens is not None
+        and transcript_tokens < settings.llm_short_transcript_tokens
+        and stage in {LLMStage.MERGE, LLMStage.FINAL}
+    ):
+        stage = LLMStage.CHUNK
+    return models.get(stage.value, settings.llm_model)
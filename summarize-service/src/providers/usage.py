@@ -0,0 +1,94 @@
+"""Per-meeting accounting of LLM latency, tokens and cost."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from src.utils.enums import LLMStage
+
+
+@dataclass
+class StageUsage:
+    """Totals of the calls of one stage and model."""
+
+    calls: int = 0
+    cached: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    latency_seconds: float = 0.0
+
+
+class UsageLedger:
+    """Usage of the LLM calls made within one track_usage() block.
+
+    Shared by the threads a task fans out to, so recording is locked.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: dict[tuple[LLMStage, str], StageUsage] = {}
+
+    def record(
+        self,
+        stage: LLMStage,
+        model: str,
+        *,
+        cached: bool = False,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: float = 0.0,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        """Add one call."""
+        with self._lock:
+            usage = self._stages.setdefault((stage, model), StageUsage())
+            usage.calls += 1
+            usage.cached += cached
+            usage.prompt_tokens += prompt_tokens
+            usage.completion_tokens += completion_tokens
+            usage.cost += cost
+            usage.latency_seconds += latency_seconds
+
+    @property
+    def total_cost(self) -> float:
+        """Cost of all calls, in USD."""
+        with self._lock:
+            return sum(usage.cost for usage in self._stages.values())
+
+    def summary(self) -> str:
+        """One line per stage and model, plus the total cost."""
+        with self._lock:
+            lines = [
+                f"{stage.value}/{model}: {usage.calls} calls "
+                f"({usage.cached} cached), "
+                f"{usage.prompt_tokens}+{usage.completion_tokens} tokens, "
+                f"{usage.latency_seconds:.1f}s, ${usage.cost:.4f}"
+                for (stage, model), usage in self._stages.items()
+            ]
+        if not lines:
+            return "no LLM calls"
+        return "; ".join(lines) + f"; total ${self.total_cost:.4f}"
+
+
+_current_ledger: ContextVar[UsageLedger | None] = ContextVar(
+    "llm_usage_ledger", default=None
+)
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageLedger]:
+    """Record LLM calls made in this context (and contexts copied from it)."""
+    ledger = UsageLedger()
+    token = _current_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _current_ledger.reset(token)
+
+
+def current_ledger() -> UsageLedger | None:
+    """Ledger of the enclosing track_usage() block, if any."""
+    return _current_ledger.get()
@@ -1,22 +1,45 @@
 """Business logic services for summarize service."""
 
+from src.services.extraction import (
+    MeetingInsights,
+    extract_insights,
+    parse_insights,
+    save_insights,
+)
 from src.services.meeting import (
     complete_summarization,
     fail_summarization,
     start_summarization,
     update_key_notes,
 )
+from src.services.pipeline import advance_pipeline
+from src.services.qa import answer_question, normalize_question
+from src.services.retrieval import (
+    Passage,
+    ensure_meeting_index,
+    retrieve_passages,
+)
 from src.services.summarization import (
-    extract_key_notes,
-    generate_tasks,
+    batch_by_tokens,
+    generate_concurrently,
     summarize_transcript,
 )
 
 __all__ = [
+    "MeetingInsights",
+    "Passage",
+    "advance_pipeline",
+    "answer_question",
+    "batch_by_tokens",
     "complete_summarization",
-    "extract_key_notes",
+    "ensure_meeting_index",
+    "extract_insights",
     "fail_summarization",
-    "generate_tasks",
+    "generate_concurrently",
+    "normalize_question",
+    "parse_insights",
+    "retrieve_passages",
+    "save_insights",
     "start_summarization",
     "summarize_transcript",
     "update_key_notes",
@@ -0,0 +1,140 @@
+"""Structured extraction of key notes and tasks from a summary."""
+
+import json
+import logging
+import re
+from datetime import date
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy.orm import Session
+
+from src.cache.events import publish_status
+from src.database.repository import get_meeting, save_tasks
+from src.models import Task
+from src.providers.llm import LLMClient
+from src.utils.enums import LLMStage, MeetingStatus
+from src.utils.exceptions import AIServiceError
+from src.utils.prompts import EXTRACT_INSIGHTS_PROMPT, REPAIR_JSON_PROMPT
+
+logger = logging.getLogger(__name__)
+
+# Some models wrap JSON in a Markdown code fence despite the instructions
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+
+class KeyNote(BaseModel):
+    """Categorised note from a meeting."""
+
+    category: str = Field(min_length=1, max_length=50)
+    note: str = Field(min_length=1)
+
+
+class ExtractedTask(BaseModel):
+    """Action item from a meeting."""
+
+    title: str = Field(min_length=1, max_length=255)
+    description: str | None = None
+    assignee: str | None = Field(default=None, max_length=255)
+    due_date: date | None = None
+    priority: str = Field(default="trung bình", max_length=50)
+
+
+class MeetingInsights(BaseModel):
+    """Key notes and tasks extracted from one summary."""
+
+    key_notes: list[KeyNote]
+    tasks: list[ExtractedTask]
+
+
+INSIGHTS_SCHEMA = MeetingInsights.model_json_schema()
+INSIGHTS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "meeting_insights", "schema": INSIGHTS_SCHEMA},
+}
+
+
+def parse_insights(response: str) -> MeetingInsights:
+    """Validate an LLM response against the insights schema.
+
+    Raises:
+        ValidationError: If the response is not valid JSON for the schema
+    """
+    match = _CODE_FENCE_RE.match(response.strip())
+    return MeetingInsights.model_validate_json(match[1] if match else response)
+
+
+def extract_insights(summary: str, llm_client: LLMClient) -> MeetingInsights:
+    """Extract key notes and tasks in one schema-constrained call.
+
+    A response that fails validation is evicted from the LLM cache and sent
+    back once with the validation errors for repair.
+
+    Raises:
+        AIServiceError: If the repaired response is still invalid
+    """
+    logger.info("Extracting key notes and tasks")
+    prompt = EXTRACT_INSIGHTS_PROMPT.format(text=summary)
+    response = llm_client.generate(
+        prompt, stage=LLMStage.EXTRACT, response_format=INSIGHTS_RESPONSE_FORMAT
+    )
+
+    try:
+        return parse_insights(response)
+    except ValidationError as e:
+        logger.warning(f"Invalid insights JSON, asking for a repair: {e}")
+        llm_client.evict(
+            prompt, stage=LLMStage.EXTRACT, response_format=INSIGHTS_RESPONSE_FORMAT
+        )
+        error = e
+
+    repair_prompt = REPAIR_JSON_PROMPT.format(
+        error=error,
+        schema=json.dumps(INSIGHTS_SCHEMA, ensure_ascii=False),
+        response=response,
+    )
+    repaired = llm_client.generate(
+        repair_prompt,
+        stage=LLMStage.EXTRACT,
+        cache=False,
+        response_format=INSIGHTS_RESPONSE_FORMAT,
+    )
+
+    try:
+        return parse_insights(repaired)
+    except ValidationError as e:
+        raise AIServiceError(f"Invalid insights JSON after repair: {e}") from e
+
+
+def save_insights(session: Session, meeting_id: UUID, insights: MeetingInsights) -> int:
+    """Save key notes and tasks and complete the meeting in one transaction.
+
+    Returns the number of tasks created.
+    """
+    meeting = get_meeting(session, meeting_id)
+    meeting.key_notes = [note.model_dump() for note in insights.key_notes]
+    meeting.status = MeetingStatus.COMPLETED.value
+    session.add(meeting)
+
+    tasks = [
+        Task(
+            id=uuid4(),
+            meeting_id=meeting_id,
+            title=task.title,
+            description=task.description,
+            status="pending",
+            assignee=task.assignee,
+            due_date=task.due_date.isoformat() if task.due_date else None,
+            priority=task.priority,
+        )
+        for task in insights.tasks
+    ]
+    count = save_tasks(session, tasks)
+    session.commit()
+    publish_status(meeting_id, MeetingStatus.COMPLETED)
+
+    logger.info(
+        f"Saved {len(insights.key_notes)} key notes and {count} tasks "
+        f"for meeting {meeting_id}"
+    )
+    return count
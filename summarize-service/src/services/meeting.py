@@ -5,6 +5,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from src.cache.events import publish_status
 from src.database.repository import get_meeting, update_meeting_status
 from src.utils.enums import MeetingStatus
 from src.utils.exceptions import InvalidStatusError
@@ -15,17 +16,26 @@ logger = logging.getLogger(__name__)
 def start_summarization(session: Session, meeting_id: UUID) -> None:
     """Mark meeting as summarizing.
 
+    A failed summarization may be started again; it reuses the summaries
+    checkpointed by the failed run.
+
     Raises:
-        InvalidStatusError: If meeting is not in transcribed status
+        InvalidStatusError: If meeting is not transcribed or summarize_failed
     """
     logger.info(f"Starting summarization for meeting {meeting_id}")
     meeting = get_meeting(session, meeting_id)
 
-    if meeting.status not in {MeetingStatus.TRANSCRIBED.value}:
+    if meeting.status not in {
+        MeetingStatus.TRANSCRIBED.value,
+        MeetingStatus.SUMMARIZE_FAILED.value,
+    }:
         raise InvalidStatusError(f"Cannot summarize meeting in status {meeting.status}")
 
     update_meeting_status(session, meeting_id, MeetingStatus.SUMMARIZING)
     session.commit()
+    publish_status(
+        meeting_id, MeetingStatus.SUMMARIZING, summarize_done=0, summarize_total=0
+    )
 
 
 def complete_summarization(session: Session, meeting_id: UUID, summary: str) -> None:
@@ -36,6 +46,7 @@ def complete_summarization(session: Session, meeting_id: UUID, summary: str) ->
     meeting.status = MeetingStatus.SUMMARIZED.value
     session.add(meeting)
     session.commit()
+    publish_status(meeting_id, MeetingStatus.SUMMARIZED)
 
 
 def update_key_notes(session: Session, meeting_id: UUID, key_notes: list[dict]) -> None:
@@ -55,3 +66,4 @@ def fail_summarization(session: Session, meeting_id: UUID, error: str) -> None:
     meeting.error_message = error
     session.add(meeting)
     session.commit()
+    publish_status(meeting_id, MeetingStatus.SUMMARIZE_FAILED)
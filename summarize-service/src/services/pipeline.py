@@ -0,0 +1,122 @@
+"""Pipelined summarisation of a transcript that is still being produced.
+
+Chunk summaries are generated as transcribed audio arrives, with the same
+chunker, settings, prompt and model as summarize_transcript. Greedy chunking
+of a prefix yields the same chunks as the full transcript except for the
+last one, so every chunk summarized early is reused when the full transcript
+is summarized, and only the reduce is left. Outputs are carried over by the
+summary checkpoints, and by the LLM response cache when it is enabled.
+"""
+
+import logging
+from collections.abc import Callable
+from functools import partial
+
+from redis.exceptions import LockNotOwnedError
+
+from src.cache.checkpoints import SummaryCheckpoints
+from src.cache.pipeline import TranscriptPipeline
+from src.providers.llm import LLMClient
+from src.providers.routing import route_model
+from src.services.summarization import generate_concurrently
+from src.utils.enums import LLMStage
+from src.utils.prompts import CHUNK_SUMMARY_PROMPT
+from src.utils.text import TextChunker
+
+logger = logging.getLogger(__name__)
+
+
+def advance_pipeline(
+    pipeline: TranscriptPipeline,
+    total_chunks: int,
+    llm_client: LLMClient,
+    max_chunk_tokens: int,
+    overlap_tokens: int = 0,
+    concurrency: int = 1,
+    checkpoints: SummaryCheckpoints | None = None,
+) -> None:
+    """Summarize whatever the buffered transcript allows.
+
+    Only one worker advances a meeting at a time; others just leave their
+    chunk flagged, and the lock holder keeps going until nothing new came in.
+    The lock is renewed as each chunk summary finishes; a holder that lost
+    it stops, since another worker may have taken over. Without checkpoints
+    or the response cache the final run could not reuse anything, so nothing
+    is summarized early.
+    """
+    if checkpoints is None and not llm_client.cache_enabled:
+        logger.info(
+            f"Pipeline {pipeline.meeting_id}: no checkpoints or LLM cache, "
+            f"leaving the transcript to the final summarization"
+        )
+        return
+
+    while True:
+        lock = pipeline.lock()
+        if not lock.acquire():
+            return
+        try:
+            while pipeline.take_dirty():
+                _summarize_ready_chunks(
+                    pipeline,
+                    total_chunks,
+                    llm_client,
+                    max_chunk_tokens,
+                    overlap_tokens,
+                    concurrency,
+                    checkpoints,
+                    on_done=lambda _, lock=lock: pipeline.extend_lock(lock),
+                )
+        except LockNotOwnedError:
+            return  # Logged by release_lock
+        finally:
+            pipeline.release_lock(lock)
+
+        # A chunk may have arrived between the last pass and the release
+        if not pipeline.is_dirty():
+            return
+
+
+def _summarize_ready_chunks(
+    pipeline: TranscriptPipeline,
+    total_chunks: int,
+    llm_client: LLMClient,
+    max_chunk_tokens: int,
+    overlap_tokens: int,
+    concurrency: int,
+    checkpoints: SummaryCheckpoints | None,
+    on_done: Callable[[int], None] | None = None,
+) -> None:
+    """Summarize chunks that can no longer change, checkpointing the results."""
+    arrived, lines = pipeline.contiguous_lines()
+    if not lines:
+        return
+
+    chunker = TextChunker(llm_client.count_tokens)
+    chunks = chunker.chunk(lines, max_chunk_tokens, overlap_tokens)
+
+    # The last chunk may still grow, unless the transcript is complete; a
+    # transcript that fits one chunk is summarized directly instead
+    final = arrived == total_chunks
+    ready = chunks if final and len(chunks) > 1 else chunks[:-1]
+
+    done = pipeline.summarized()
+    if len(ready) <= done:
+        return
+
+    logger.info(
+        f"Pipeline {pipeline.meeting_id}: {arrived}/{total_chunks} audio chunks, "
+        f"summarizing chunks {done + 1}-{len(ready)}"
+    )
+    prompts = [CHUNK_SUMMARY_PROMPT.format(text=chunk) for chunk in ready[done:]]
+    model = route_model(LLMStage.CHUNK)
+    generate_concurrently(
+        prompts,
+        llm_client,
+        concurrency,
+        on_done,
+        stage=LLMStage.CHUNK,
+        model=model,
+        on_output=None if checkpoints is None else partial(checkpoints.save, model),
+    )
+    pipeline.set_summarized(len(ready))
@@ -0,0 +1,78 @@
+"""Question answering over a meeting transcript."""
+
+import logging
+import re
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.cache.answers import cache_answer, get_cached_answer
+from src.database.repository import get_meeting
+from src.providers.llm import LLMClient
+from src.services.retrieval import retrieve_passages
+from src.utils.enums import LLMStage
+from src.utils.prompts import QA_PROMPT
+from src.utils.text import format_timestamp
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = "?!.,;: "
+
+
+def normalize_question(question: str) -> str:
+    """Fold case, whitespace and trailing punctuation for cache lookups."""
+    collapsed = _WHITESPACE_RE.sub(" ", question).lower()
+    return collapsed.rstrip(_TRAILING_PUNCTUATION).strip()
+
+
+def answer_question(
+    session: Session,
+    meeting_id: UUID,
+    question: str,
+    llm_client: LLMClient,
+    top_k: int,
+) -> dict:
+    """Answer a question from the most relevant transcript passages.
+
+    Only the top_k passages go to the LLM; a meeting without an index falls
+    back to its summary. Answers are cached per meeting version and
+    normalised question.
+    """
+    normalized = normalize_question(question)
+    if not normalized:
+        raise ValueError("Question is empty")
+
+    meeting = get_meeting(session, meeting_id)
+    version = meeting.updated_at.isoformat()
+
+    cached = get_cached_answer(meeting_id, version, normalized)
+    if cached is not None:
+        logger.info(f"Answer cache hit for meeting {meeting_id}")
+        return cached
+
+    passages = retrieve_passages(session, meeting_id, normalized, top_k)
+    if passages:
+        context = "\n\n".join(
+            f"[{format_timestamp(passage.start)}] {passage.text}"
+            for passage in passages
+        )
+    elif meeting.summary_text:
+        logger.info(f"No passages for meeting {meeting_id}, answering from summary")
+        context = meeting.summary_text
+    else:
+        raise ValueError("Meeting has no indexed transcript or summary")
+
+    logger.info(
+        f"Answering question for meeting {meeting_id}: {len(passages)} passages"
+    )
+    prompt = QA_PROMPT.format(context=context, question=question.strip())
+    answer = {
+        "answer": llm_client.generate(prompt, stage=LLMStage.ANSWER),
+        "sources": [
+            {"start": passage.start, "end": passage.end} for passage in passages
+        ],
+    }
+
+    cache_answer(meeting_id, version, normalized, answer)
+    return answer
@@ -0,0 +1,127 @@
+"""Per-meeting passage retrieval over the semantic index.
+
+The transcribe service indexes a meeting when it stores the segments;
+summarisation rebuilds the index only when it is missing or was written by
+an older embedder, so question answering can always rely on it.
+"""
+
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+from cmdn_common.embedding import (
+    DIMENSIONS,
+    EMBEDDER_VERSION,
+    build_meeting_index,
+    embed_texts,
+)
+from sqlalchemy.orm import Session
+
+from src.database.repository import (
+    get_meeting_embedding,
+    list_segments,
+    list_segments_in_ranges,
+    save_meeting_embedding,
+)
+from src.models import MeetingEmbedding, MeetingSegment
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Passage:
+    """Transcript window retrieved for a question."""
+
+    start: float
+    end: float
+    text: str
+    score: float
+
+
+def build_meeting_embedding(
+    meeting_id: UUID, segments: list[MeetingSegment]
+) -> MeetingEmbedding | None:
+    """Embed a transcript window by window; None when there is no text."""
+    index = build_meeting_index(segments, seqs=[segment.seq for segment in segments])
+    if index is None:
+        return None
+
+    return MeetingEmbedding(
+        meeting_id=meeting_id,
+        version=EMBEDDER_VERSION,
+        dimensions=DIMENSIONS,
+        centroid=index.centroid.tobytes(),
+        vectors=index.vectors.tobytes(),
+        starts=index.starts,
+        ends=index.ends,
+        seq_from=index.seq_from,
+        seq_to=index.seq_to,
+    )
+
+
+def ensure_meeting_index(session: Session, meeting_id: UUID) -> bool:
+    """Build the meeting's index unless a current one exists (commits).
+
+    Returns whether the meeting has a usable index afterwards.
+    """
+    existing = get_meeting_embedding(session, meeting_id)
+    if existing is not None and existing.version == EMBEDDER_VERSION:
+        return True
+
+    embedding = build_meeting_embedding(meeting_id, list_segments(session, meeting_id))
+    if embedding is None:
+        logger.info(f"No text to index for meeting {meeting_id}")
+        return False
+
+    save_meeting_embedding(session, embedding)
+    session.commit()
+    logger.info(f"Indexed meeting {meeting_id}: {len(embedding.starts)} windows")
+    return True
+
+
+def retrieve_passages(
+    session: Session, meeting_id: UUID, question: str, top_k: int
+) -> list[Passage]:
+    """Top-k transcript windows for a question, in transcript order.
+
+    Empty when the meeting has no current index or nothing matches.
+    """
+    embedding = get_meeting_embedding(session, meeting_id)
+    if embedding is None or embedding.version != EMBEDDER_VERSION:
+        return []
+
+    query = embed_texts([question])[0]
+    if not query.any():
+        return []
+
+    vectors = np.frombuffer(embedding.vectors, dtype=np.float16).reshape(
+        -1, embedding.dimensions
+    )
+    scores = vectors.astype(np.float32) @ query
+
+    k = min(top_k, len(scores))
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = sorted(int(i) for i in best if scores[i] > 0)
+    if not best:
+        return []
+
+    ranges = [(embedding.seq_from[i], embedding.seq_to[i]) for i in best]
+    segments = list_segments_in_ranges(session, meeting_id, ranges)
+
+    passages = []
+    for i, (seq_from, seq_to) in zip(best, ranges, strict=True):
+        text = " ".join(
+            segment.text.strip()
+            for segment in segments
+            if seq_from <= segment.seq <= seq_to
+        )
+        passages.append(
+            Passage(
+                start=embedding.starts[i],
+                end=embedding.ends[i],
+                text=text,
+                score=float(scores[i]),
+            )
+        )
+    return passages
@@ -1,107 +1,293 @@
 """AI Summarization service."""
 
-import json
 import logging
-from uuid import UUID, uuid4
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from functools import partial
 
-from sqlalchemy.orm import Session
-
-from src.database.repository import save_tasks
-from src.models import Task
+from src.cache.checkpoints import SummaryCheckpoints
+from src.models import MeetingSegment
 from src.providers.llm import LLMClient
+from src.providers.routing import route_model
+from src.utils.enums import LLMStage
+from src.utils.exceptions import GenerationError, MergeBudgetError
+from src.utils.extractive import select_salient
 from src.utils.prompts import (
     CHUNK_SUMMARY_PROMPT,
-    GENERATE_TASKS_PROMPT,
-    KEY_NOTES_PROMPT,
     MERGE_SUMMARIES_PROMPT,
 )
-from src.utils.text import TextChunker
+from src.utils.text import TextChunker, split_sentences, timestamped_lines
 
 logger = logging.getLogger(__name__)
 
 
 def summarize_transcript(
-    transcript: str, max_chunk_size: int, llm_client: LLMClient
+    transcript: str,
+    max_chunk_tokens: int,
+    llm_client: LLMClient,
+    on_progress: Callable[[int, int], None] | None = None,
+    concurrency: int = 1,
+    merge_budget_tokens: int = 24000,
+    checkpoints: SummaryCheckpoints | None = None,
+    overlap_tokens: int = 0,
+    segments: list[MeetingSegment] | None = None,
+    keep_ratio: float = 1.0,
+    prefilter_min_units: int = 0,
 ) -> str:
-    """Summarize transcript with automatic chunking if needed."""
-    chunker = TextChunker()
+    """Summarize transcript with automatic chunking if needed.
+
+    Chunks hold up to max_chunk_tokens of whole segments (as timestamped
+    lines) when segments are given, otherwise of whole sentences, and repeat
+    up to overlap_tokens of the previous chunk. A keep_ratio below 1 first
+    drops the least central units of transcripts with at least
+    prefilter_min_units units.
+
+    Chunk summaries are merged in a tree: batches that fit merge_budget_tokens
+    are merged level by level until one summary remains, and a summary that
+    fits no batch with a neighbour moves up a level unchanged. Up to
+    concurrency LLM calls run at once, and each output is saved to
+    checkpoints as it finishes, so a retry only repeats the calls that did
+    not. on_progress, if given, is called with (done, total) LLM calls; total
+    grows as levels are planned.
+
+    Chunk summaries and intermediate merges use the chunk and merge models,
+    and the call producing the final summary the final model (see
+    route_model).
+    """
+    chunker = TextChunker(llm_client.count_tokens)
+
+    def report(done: int, total: int) -> None:
+        if on_progress is not None:
+            on_progress(done, total)
 
     # Check if chunking needed
-    if not chunker.should_chunk(transcript, max_chunk_size):
+    transcript_tokens = llm_client.count_tokens(transcript)
+    if transcript_tokens <= max_chunk_tokens:
         logger.info(f"Direct summarization ({len(transcript)} chars)")
+        report(0, 1)
         prompt = CHUNK_SUMMARY_PROMPT.format(text=transcript)
-        return llm_client.generate(prompt)
+        summary = llm_client.generate(
+            prompt,
+            stage=LLMStage.FINAL,
+            model=route_model(LLMStage.FINAL, transcript_tokens),
+        )
+        report(1, 1)
+        return summary
 
     # Chunk and summarize
-    chunks = chunker.chunk(transcript, max_chunk_size)
-    logger.info(f"Chunked summarization: {len(chunks)} chunks")
-
-    summaries = []
-    for i, chunk in enumerate(chunks, 1):
-        logger.info(f"Processing chunk {i}/{len(chunks)}")
-        prompt = CHUNK_SUMMARY_PROMPT.format(text=chunk)
-        summary = llm_client.generate(prompt)
-        summaries.append(summary)
-
-    # Merge summaries
-    logger.info(f"Merging {len(summaries)} summaries")
-    merged_text = "\n\n".join(summaries)
-    prompt = MERGE_SUMMARIES_PROMPT.format(text=merged_text)
-    return llm_client.generate(prompt)
-
-
-def extract_key_notes(summary: str, llm_client: LLMClient) -> list[dict]:
-    """Extract key notes from summary."""
-    logger.info("Extracting key notes")
-    prompt = KEY_NOTES_PROMPT.format(text=summary)
-    response = llm_client.generate(prompt)
-
-    try:
-        # Parse JSON response
-        key_notes = json.loads(response)
-        logger.info(f"Extracted {len(key_notes)} key notes")
-        return key_notes
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse key notes JSON: {e}")
+    units = (
+        timestamped_lines((segment.start, segment.text) for segment in segments)
+        if segments
+        else split_sentences(transcript)
+    )
+    salient = select_salient(units, keep_ratio, prefilter_min_units)
+    if len(salient) < len(units):
+        logger.info(
+            f"Pre-filter kept {len(salient)}/{len(units)} units "
+            f"({sum(map(len, salient))}/{sum(map(len, units))} chars)"
+        )
+        units = salient
+    chunks = chunker.chunk(units, max_chunk_tokens, overlap_tokens)
+    logger.info(
+        f"Chunked summarization: {len(chunks)} chunks, concurrency {concurrency}"
+    )
+
+    # One call per chunk plus at least the final merge
+    total = len(chunks) + 1
+    report(0, total)
+
+    summaries = _run_level(
+        0,
+        [CHUNK_SUMMARY_PROMPT.format(text=chunk) for chunk in chunks],
+        llm_client,
+        concurrency,
+        checkpoints,
+        stage=LLMStage.CHUNK,
+        model=route_model(LLMStage.CHUNK, transcript_tokens),
+        on_done=lambda n: report(n, total),
+    )
+    done = len(chunks)
+
+    # Merge level by level until one summary remains
+    level = 1
+    while len(summaries) > 1:
+        batches = batch_by_tokens(
+            summaries, llm_client.count_tokens, merge_budget_tokens
+        )
+        if len(batches) == len(summaries):
+            raise MergeBudgetError(len(summaries), merge_budget_tokens)
+
+        merges = sum(len(batch) > 1 for batch in batches)
+        # Another level follows unless this one merges everything
+        last = len(batches) == 1
+        total = done + merges + (0 if last else 1)
+        stage = LLMStage.FINAL if last else LLMStage.MERGE
+        logger.info(
+            f"Merge level {level}: {len(summaries)} summaries in {len(batches)} batches"
+        )
+
+        summaries = _merge_level(
+            level,
+            batches,
+            llm_client,
+            concurrency,
+            checkpoints,
+            stage=stage,
+            model=route_model(stage, transcript_tokens),
+            on_done=lambda n, base=done, total=total: report(base + n, total),
+        )
+        done += merges
+        level += 1
+
+    report(done, done)
+    return summaries[0]
+
+
+def batch_by_tokens(
+    texts: list[str], count_tokens: Callable[[str], int], budget: int
+) -> list[list[str]]:
+    """Group consecutive texts into batches of at most budget tokens.
+
+    A text that fits with neither neighbour forms a batch of its own, so no
+    batch goes over the budget unless a single text already does.
+    """
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    used = 0
+
+    for text in texts:
+        tokens = count_tokens(text)
+        if batch and used + tokens > budget:
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(text)
+        used += tokens
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _merge_level(
+    level: int,
+    batches: list[list[str]],
+    llm_client: LLMClient,
+    max_workers: int,
+    checkpoints: SummaryCheckpoints | None,
+    stage: LLMStage,
+    model: str,
+    on_done: Callable[[int], None] | None = None,
+) -> list[str]:
+    """Merge each batch of two or more summaries; lone summaries move up as is."""
+    merged = iter(
+        _run_level(
+            level,
+            [
+                MERGE_SUMMARIES_PROMPT.format(text="\n\n".join(batch))
+                for batch in batches
+                if len(batch) > 1
+            ],
+            llm_client,
+            max_workers,
+            checkpoints,
+            stage=stage,
+            model=model,
+            on_done=on_done,
+        )
+    )
+    return [next(merged) if len(batch) > 1 else batch[0] for batch in batches]
+
+
+def _run_level(
+    level: int,
+    prompts: list[str],
+    llm_client: LLMClient,
+    max_workers: int,
+    checkpoints: SummaryCheckpoints | None,
+    stage: LLMStage,
+    model: str,
+    on_done: Callable[[int], None] | None = None,
+) -> list[str]:
+    """Generate one level of the tree, reusing checkpointed outputs of model."""
+    outputs = (
+        checkpoints.load(model, prompts)
+        if checkpoints is not None
+        else [None] * len(prompts)
+    )
+    missing = [i for i, output in enumerate(outputs) if output is None]
+    resumed = len(prompts) - len(missing)
+    if resumed:
+        logger.info(f"Level {level}: resumed {resumed}/{len(prompts)} outputs")
+        if on_done is not None:
+            on_done(resumed)
+
+    generated = generate_concurrently(
+        [prompts[i] for i in missing],
+        llm_client,
+        max_workers,
+        None if on_done is None else lambda n: on_done(resumed + n),
+        stage=stage,
+        model=model,
+        on_output=None if checkpoints is None else partial(checkpoints.save, model),
+    )
+    for i, output in zip(missing, generated, strict=True):
+        outputs[i] = output
+    return outputs
+
+
+def generate_concurrently(
+    prompts: list[str],
+    llm_client: LLMClient,
+    max_workers: int,
+    on_done: Callable[[int], None] | None = None,
+    *,
+    stage: LLMStage,
+    model: str | None = None,
+    on_output: Callable[[str, str], None] | None = None,
+) -> list[str]:
+    """Generate responses concurrently, returning them in prompt order.
+
+    Every prompt is attempted; on_done is called with the number finished so
+    far and on_output with (prompt, output) as each one succeeds; if either
+    raises, prompts not yet started are dropped. Raises GenerationError
+    naming each prompt that failed.
+    """
+    generate = partial(llm_client.generate, stage=stage, model=model)
+    if not prompts:
         return []
 
+    outputs: list[str | None] = [None] * len(prompts)
+    errors: dict[int, Exception] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(prompts)),
+        thread_name_prefix="summarize-chunk",
+    ) as executor:
+        # Each call runs in a copy of the caller's context (fair-share key)
+        futures = {
+            executor.submit(copy_context().run, generate, prompt): i
+            for i, prompt in enumerate(prompts)
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    outputs[i] = future.result()
+                    logger.info(f"{stage.value} {i + 1}/{len(prompts)} done")
+                except Exception as e:
+                    logger.error(f"{stage.value} {i + 1}/{len(prompts)} failed: {e}")
+                    errors[i] = e
+                else:
+                    if on_output is not None:
+                        on_output(prompts[i], outputs[i])
+                if on_done is not None:
+                    on_done(done)
+        except BaseException:
+            # A callback gave up (e.g. a lost lock): drop the calls not started
+            executor.shutdown(cancel_futures=True)
+            raise
 
-def generate_tasks(
-    session: Session, meeting_id: UUID, summary: str, llm_client: LLMClient
-) -> int:
-    """Generate tasks from summary and save to database."""
-    try:
-        logger.info("Generating tasks from summary")
-        prompt = GENERATE_TASKS_PROMPT.format(text=summary)
-        response = llm_client.generate(prompt)
-
-        # Parse JSON response
-        tasks_data = json.loads(response)
-        if not tasks_data:
-            logger.info("No tasks generated")
-            return 0
-
-        # Create Task objects
-        tasks = [
-            Task(
-                id=uuid4(),
-                meeting_id=meeting_id,
-                title=task_data.get("title", ""),
-                description=task_data.get("description"),
-                status="pending",
-                assignee=task_data.get("assignee"),
-                due_date=task_data.get("due_date"),
-                priority=task_data.get("priority", "medium"),
-            )
-            for task_data in tasks_data
-        ]
-
-        # Save to database
-        count = save_tasks(session, tasks)
-        session.commit()
-        logger.info(f"Created {count} tasks")
-        return count
-
-    except Exception as e:
-        logger.warning(f"Failed to generate tasks: {e}")
-        return 0
+    if errors:
+        raise GenerationError(stage.value, errors, len(prompts))
+    return outputs
@@ -2,16 +2,18 @@
 
 from .celery_app import app
 from .summarize import (
-    extract_key_notes_task,
-    generate_tasks_task,
+    answer_question_task,
+    extract_insights_task,
+    summarize_partial_task,
     summarize_transcript_task,
 )
 from .worker import start_worker
 
 __all__ = [
+    "answer_question_task",
     "app",
-    "extract_key_notes_task",
-    "generate_tasks_task",
+    "extract_insights_task",
     "start_worker",
+    "summarize_partial_task",
     "summarize_transcript_task",
 ]
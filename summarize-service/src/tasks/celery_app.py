@@ -13,8 +13,9 @@ app.conf.update(
     task_default_queue="audio.summarize",
     task_routes={
         "audio.summarize.generate": {"queue": "audio.summarize"},
-        "extract_key_notes_task": {"queue": "audio.summarize"},
-        "generate_tasks_task": {"queue": "audio.summarize"},
+        "audio.summarize.extract": {"queue": "audio.summarize"},
+        "audio.summarize.answer": {"queue": "audio.summarize"},
+        "audio.summarize.chunk": {"queue": "audio.summarize"},
     },
     task_acks_late=True,
     task_reject_on_worker_lost=True,
@@ -1,29 +1,47 @@
 """Celery tasks for summarization."""
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from uuid import UUID
 
+from src.cache.checkpoints import SummaryCheckpoints
+from src.cache.events import publish_status
+from src.cache.pipeline import TranscriptPipeline
 from src.config import settings
-from src.database.repository import get_meeting
+from src.database.repository import get_meeting, list_segments
 from src.database.session import get_session
-from src.providers.llm import LLMClient
+from src.providers.llm import get_llm_client
+from src.providers.rate_limit import fair_share
+from src.providers.usage import track_usage
+from src.services.extraction import extract_insights, save_insights
 from src.services.meeting import (
     complete_summarization,
     fail_summarization,
     start_summarization,
-    update_key_notes,
-)
-from src.services.summarization import (
-    extract_key_notes,
-    generate_tasks,
-    summarize_transcript,
 )
+from src.services.pipeline import advance_pipeline
+from src.services.qa import answer_question
+from src.services.retrieval import ensure_meeting_index
+from src.services.summarization import summarize_transcript
+from src.utils.enums import MeetingStatus
+from src.utils.text import timestamped_lines
 
 from .celery_app import app
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _meeting_llm_calls(meeting_id: str) -> Iterator[None]:
+    """Queue LLM calls fairly under the meeting and log their usage."""
+    with fair_share(meeting_id), track_usage() as usage:
+        try:
+            yield
+        finally:
+            logger.info(f"LLM usage for meeting {meeting_id}: {usage.summary()}")
+
+
 @app.task(name="audio.summarize.generate", bind=True)
 def summarize_transcript_task(self, meeting_id: str):
     """Generate summary from transcript and trigger key notes + tasks generation."""
@@ -31,7 +49,7 @@ def summarize_transcript_task(self, meeting_id: str):
     logger.info(f"Starting summarization task for meeting {meeting_uuid}")
 
     try:
-        with get_session() as session:
+        with get_session() as session, _meeting_llm_calls(meeting_id):
             # Start summarization
             start_summarization(session, meeting_uuid)
 
@@ -42,22 +60,45 @@ def summarize_transcript_task(self, meeting_id: str):
             if not transcript:
                 raise ValueError("Meeting has no transcript")
 
-            # Initialize AI client
-            llm_client = LLMClient()
+            # Shared AI client
+            llm_client = get_llm_client()
 
             # Generate summary
             summary = summarize_transcript(
-                transcript, settings.summary_chunk_size, llm_client
+                transcript,
+                settings.summary_chunk_tokens,
+                llm_client,
+                on_progress=lambda done, total: publish_status(
+                    meeting_uuid,
+                    MeetingStatus.SUMMARIZING,
+                    summarize_done=done,
+                    summarize_total=total,
+                ),
+                concurrency=settings.summary_concurrency,
+                merge_budget_tokens=settings.summary_merge_budget_tokens,
+                checkpoints=SummaryCheckpoints(meeting_uuid),
+                overlap_tokens=settings.summary_chunk_overlap_tokens,
+                segments=list_segments(session, meeting_uuid),
+                keep_ratio=settings.summary_prefilter_keep_ratio,
+                prefilter_min_units=settings.summary_prefilter_min_units,
             )
 
             # Save summary
             complete_summarization(session, meeting_uuid, summary)
+            TranscriptPipeline(meeting_uuid).clear()
 
             logger.info(f"Summary generated: {len(summary)} chars")
 
-        # Trigger parallel tasks for key notes and tasks generation
-        extract_key_notes_task.delay(meeting_id)
-        generate_tasks_task.delay(meeting_id)
+            # Index for question answering; best-effort, Q&A falls back to
+            # the summary without it
+            try:
+                ensure_meeting_index(session, meeting_uuid)
+            except Exception as e:
+                session.rollback()
+                logger.warning(f"Failed to index meeting {meeting_uuid}: {e}")
+
+        # Trigger key notes + tasks extraction
+        extract_insights_task.delay(meeting_id)
 
         return {
             "meeting_id": str(meeting_uuid),
@@ -72,14 +113,14 @@ def summarize_transcript_task(self, meeting_id: str):
         raise
 
 
-@app.task(name="extract_key_notes_task", bind=True)
-def extract_key_notes_task(self, meeting_id: str):
-    """Extract key notes from summary."""
+@app.task(name="audio.summarize.extract", bind=True)
+def extract_insights_task(self, meeting_id: str):
+    """Extract key notes and tasks from summary in one LLM call."""
     meeting_uuid = UUID(meeting_id)
-    logger.info(f"Extracting key notes for meeting {meeting_uuid}")
+    logger.info(f"Extracting key notes and tasks for meeting {meeting_uuid}")
 
     try:
-        with get_session() as session:
+        with get_session() as session, _meeting_llm_calls(meeting_id):
             # Get meeting
             meeting = get_meeting(session, meeting_uuid)
             summary = meeting.summary_text
@@ -87,55 +128,88 @@ def extract_key_notes_task(self, meeting_id: str):
             if not summary:
                 raise ValueError("Meeting has no summary")
 
-            # Initialize AI client
-            llm_client = LLMClient()
-
-            # Extract key notes
-            key_notes = extract_key_notes(summary, llm_client)
-
-            # Save key notes
-            update_key_notes(session, meeting_uuid, key_notes)
+            # Shared AI client
+            llm_client = get_llm_client()
 
-            logger.info(f"Extracted {len(key_notes)} key notes")
+            # Extract and save key notes and tasks together
+            insights = extract_insights(summary, llm_client)
+            tasks_count = save_insights(session, meeting_uuid, insights)
 
             return {
                 "meeting_id": str(meeting_uuid),
-                "key_notes_count": len(key_notes),
+                "key_notes_count": len(insights.key_notes),
+                "tasks_count": tasks_count,
             }
 
     except Exception as e:
-        logger.error(f"Key notes extraction failed: {e}", exc_info=True)
+        logger.error(f"Key notes and tasks extraction failed: {e}", exc_info=True)
+        # Leave a terminal status; summarizing again reuses the cached calls
+        with get_session() as session:
+            fail_summarization(
+                session, meeting_uuid, f"Key notes and tasks extraction failed: {e}"
+            )
         raise
 
 
-@app.task(name="generate_tasks_task", bind=True)
-def generate_tasks_task(self, meeting_id: str):
-    """Generate tasks from summary."""
+@app.task(name="audio.summarize.answer", bind=True)
+def answer_question_task(self, meeting_id: str, question: str):
+    """Answer a question about a meeting from its most relevant passages."""
     meeting_uuid = UUID(meeting_id)
-    logger.info(f"Generating tasks for meeting {meeting_uuid}")
+    logger.info(f"Answering question for meeting {meeting_uuid}")
 
     try:
-        with get_session() as session:
-            # Get meeting
-            meeting = get_meeting(session, meeting_uuid)
-            summary = meeting.summary_text
+        with get_session() as session, _meeting_llm_calls(meeting_id):
+            # Shared AI client
+            llm_client = get_llm_client()
 
-            if not summary:
-                raise ValueError("Meeting has no summary")
+            result = answer_question(
+                session, meeting_uuid, question, llm_client, settings.qa_top_k
+            )
 
-            # Initialize AI client
-            llm_client = LLMClient()
+            return {"meeting_id": str(meeting_uuid), **result}
 
-            # Generate tasks
-            tasks_count = generate_tasks(session, meeting_uuid, summary, llm_client)
+    except Exception as e:
+        logger.error(f"Question answering failed: {e}", exc_info=True)
+        raise
 
-            logger.info(f"Generated {tasks_count} tasks")
 
-            return {
-                "meeting_id": str(meeting_uuid),
-                "tasks_count": tasks_count,
-            }
+@app.task(name="audio.summarize.chunk", bind=True)
+def summarize_partial_task(
+    self, meeting_id: str, chunk_id: int, total_chunks: int, segments: list[dict]
+):
+    """Summarize transcript chunks while the rest of the audio is transcribed."""
+    meeting_uuid = UUID(meeting_id)
+    logger.info(
+        f"Received audio chunk {chunk_id + 1}/{total_chunks} for meeting {meeting_uuid}"
+    )
+
+    if settings.summary_prefilter_keep_ratio < 1:
+        # Pre-filtering scores the whole transcript, so partial chunks would
+        # not match the final ones
+        logger.info("Pre-filter enabled, skipping pipelined summarization")
+        return {"meeting_id": str(meeting_uuid), "chunk_id": chunk_id}
+
+    try:
+        pipeline = TranscriptPipeline(meeting_uuid)
+        lines = timestamped_lines(
+            (segment["start"], segment["text"]) for segment in segments
+        )
+        pipeline.add_chunk(chunk_id, lines)
+
+        with _meeting_llm_calls(meeting_id):
+            advance_pipeline(
+                pipeline,
+                total_chunks,
+                get_llm_client(),
+                settings.summary_chunk_tokens,
+                overlap_tokens=settings.summary_chunk_overlap_tokens,
+                concurrency=settings.summary_concurrency,
+                checkpoints=SummaryCheckpoints(meeting_uuid),
+            )
+
+        return {"meeting_id": str(meeting_uuid), "chunk_id": chunk_id}
 
     except Exception as e:
-        logger.error(f"Task generation failed: {e}", exc_info=True)
+        # The final summarization redoes anything missed here
+        logger.warning(f"Pipelined summarization failed: {e}", exc_info=True)
         raise
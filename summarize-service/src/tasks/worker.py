@@ -13,6 +13,33 @@ from .celery_app import app
 logger = logging.getLogger(__name__)
 
 
+def _concurrency_args() -> list[str]:
+    """Concurrency flags for the configured pool.
+
+    Tasks mostly wait on the LLM, so the threads pool runs many of them in
+    one process, sharing its LLM connection pool; prefork autoscales
+    processes instead.
+    """
+    if settings.celery_pool == "threads":
+        logger.info(f"  - Concurrency: {settings.celery_concurrency}")
+        return ["--concurrency", str(settings.celery_concurrency)]
+    if settings.celery_pool == "solo":
+        return []
+
+    logger.info(f"  - Autoscale: {settings.celery_autoscale}")
+    autoscale_parts = settings.celery_autoscale.split(",")
+    autoscale_arg = (
+        f"{autoscale_parts[0]},{autoscale_parts[1]}"
+        if len(autoscale_parts) == 2
+        else "10,1"
+    )
+    if autoscale_arg == "10,1":
+        logger.warning(
+            f"Invalid autoscale format: {settings.celery_autoscale}, using default: {autoscale_arg}"
+        )
+    return ["--autoscale", autoscale_arg]
+
+
 def start_worker():
     """Start Celery worker."""
     with contextlib.suppress(RuntimeError):
@@ -23,35 +50,23 @@ def start_worker():
     logger.info(f"  - Broker: {settings.get_rabbitmq_url()}")
     logger.info(f"  - Backend: {settings.redis_url}")
     logger.info("  - Queue: audio.summarize")
-    logger.info(f"  - Autoscale: {settings.celery_autoscale}")
+    logger.info(f"  - Pool: {settings.celery_pool}")
     logger.info(f"  - Prefetch: {settings.celery_prefetch_multiplier}")
     logger.info(f"  - Max tasks per child: {settings.celery_max_tasks_per_child}")
     logger.info(f"  - Log level: {settings.log_level}")
 
-    autoscale_parts = settings.celery_autoscale.split(",")
-    autoscale_arg = (
-        f"{autoscale_parts[0]},{autoscale_parts[1]}"
-        if len(autoscale_parts) == 2
-        else "10,1"
-    )
-    if autoscale_arg == "10,1":
-        logger.warning(
-            f"Invalid autoscale format: {settings.celery_autoscale}, using default: {autoscale_arg}"
-        )
-
     worker_args = [
         "worker",
         "--pool",
-        "solo",
+        settings.celery_pool,
         "--loglevel",
         settings.log_level.lower(),
         "--queues",
         "audio.summarize",
-        "--autoscale",
-        autoscale_arg,
         "--max-tasks-per-child",
         str(settings.celery_max_tasks_per_child),
     ]
+    worker_args.extend(_concurrency_args())
     worker_args.extend(sys.argv[1:])
 
     logger.info(f"Starting worker with args: {' '.join(worker_args)}")
@@ -15,3 +15,13 @@ class MeetingStatus(str, Enum):
     TRANSCRIBE_FAILED = "transcribe_failed"
     SUMMARIZE_FAILED = "summarize_failed"
     FAILED = "failed"
+
+
+class LLMStage(str, Enum):
+    """Pipeline step an LLM call belongs to, used for model routing."""
+
+    CHUNK = "chunk"
+    MERGE = "merge"
+    FINAL = "final"
+    EXTRACT = "extract"
+    ANSWER = "answer"
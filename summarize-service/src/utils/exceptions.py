@@ -29,6 +29,28 @@ class AIServiceError(SummarizeServiceError):
     pass
 
 
+class GenerationError(AIServiceError):
+    """One or more prompts of a batch of LLM calls could not be generated."""
+
+    def __init__(self, stage: str, errors: dict[int, Exception], total: int):
+        failed = ", ".join(f"{i + 1} ({error})" for i, error in sorted(errors.items()))
+        super().__init__(f"{len(errors)}/{total} {stage} calls failed: {failed}")
+        self.stage = stage
+        self.errors = errors
+        self.total = total
+
+
+class MergeBudgetError(AIServiceError):
+    """Summaries are too long for any two of them to share a merge prompt."""
+
+    def __init__(self, summaries: int, budget: int):
+        super().__init__(
+            f"Cannot merge {summaries} summaries: no two fit in {budget} tokens"
+        )
+        self.summaries = summaries
+        self.budget = budget
+
+
 class ConfigurationError(SummarizeServiceError):
     """Invalid configuration."""
 
@@ -0,0 +1,104 @@
+"""Extractive pre-filtering of transcript sentences.
+
+Scores units (sentences or timestamped segments) by TextRank centrality over
+hashed TF-IDF vectors, drops near-duplicates, and keeps the most central
+units up to a share of the transcript, in their original order. Filler and
+back-channel lines share little vocabulary with the rest of the meeting, so
+they rank last.
+"""
+
+import math
+import re
+import zlib
+from collections import Counter
+
+import numpy as np
+from cmdn_common.embedding import tokenize
+
+DIMENSIONS = 1024  # Power of two, so a hash maps to a column with a mask
+DAMPING = 0.85
+ITERATIONS = 30
+# Kept units a candidate is checked against for redundancy; near-duplicates
+# score alike, so they are selected close together
+REDUNDANCY_WINDOW = 64
+
+_TIMESTAMP_RE = re.compile(r"^\[[\d:]+\]\s*")
+
+
+def _tfidf_matrix(units: list[str]) -> np.ndarray:
+    """L2-normalised hashed TF-IDF rows, one per unit."""
+    tokenized = [tokenize(_TIMESTAMP_RE.sub("", unit)) for unit in units]
+    document_frequency = Counter(token for tokens in tokenized for token in set(tokens))
+    n = len(units)
+    idf = {
+        token: math.log((1 + n) / (1 + df)) + 1
+        for token, df in document_frequency.items()
+    }
+
+    matrix = np.zeros((n, DIMENSIONS), dtype=np.float32)
+    for row, tokens in enumerate(tokenized):
+        for token, count in Counter(tokens).items():
+            column = zlib.crc32(token.encode()) & (DIMENSIONS - 1)
+            matrix[row, column] += (1 + math.log(count)) * idf[token]
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def _textrank(matrix: np.ndarray) -> np.ndarray:
+    """PageRank over the cosine-similarity graph, without building it.
+
+    With S = M Mᵀ (self-loops removed), each step is two matrix-vector
+    products through M, so a pass is linear in the number of units.
+    """
+    n = matrix.shape[0]
+    self_similarity = np.einsum("ij,ij->i", matrix, matrix)
+    degree = matrix @ matrix.sum(axis=0) - self_similarity
+
+    rank = np.full(n, 1 / n, dtype=np.float32)
+    for _ in range(ITERATIONS):
+        weighted = np.divide(rank, degree, out=np.zeros_like(rank), where=degree > 0)
+        spread = matrix @ (matrix.T @ weighted) - self_similarity * weighted
+        rank = (1 - DAMPING) / n + DAMPING * spread
+    return rank
+
+
+def select_salient(
+    units: list[str],
+    keep_ratio: float,
+    min_units: int,
+    redundancy_threshold: float = 0.85,
+) -> list[str]:
+    """Keep the most central units, up to keep_ratio of the characters.
+
+    Transcripts with fewer than min_units units, or a keep_ratio of 1, are
+    returned unchanged. A unit more similar than redundancy_threshold to one
+    of the last REDUNDANCY_WINDOW units kept is dropped, which keeps the
+    selection linear in the number of units.
+    """
+    if keep_ratio >= 1 or len(units) < min_units:
+        return units
+
+    matrix = _tfidf_matrix(units)
+    rank = _textrank(matrix)
+
+    budget = keep_ratio * sum(len(unit) for unit in units)
+    recent = np.zeros((REDUNDANCY_WINDOW, DIMENSIONS), dtype=np.float32)
+    selected: list[int] = []
+    used = 0
+
+    for i in np.argsort(-rank, kind="stable"):
+        if used >= budget:
+            break
+        vector = matrix[i]
+        if not vector.any():
+            continue
+        window = recent[: len(selected)]  # Ring buffer, in no particular order
+        if selected and (window @ vector).max() > redundancy_threshold:
+            continue
+        recent[len(selected) % REDUNDANCY_WINDOW] = vector
+        selected.append(int(i))
+        used += len(units[i])
+
+    return [units[i] for i in sorted(selected)]
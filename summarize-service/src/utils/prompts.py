@@ -1,5 +1,8 @@
 """AI prompts cho các tác vụ tóm tắt."""
 
+# Tăng khi sửa prompt để bỏ qua các phản hồi LLM đã cache
+PROMPTS_VERSION = 1
+
 # Prompt tóm tắt từng đoạn
 CHUNK_SUMMARY_PROMPT = """Bạn là chuyên gia tóm tắt cuộc họp. Nhiệm vụ của bạn là tạo bản tóm tắt ngắn gọn, có cấu trúc tốt cho đoạn transcript cuộc họp sau đây.
 
@@ -32,10 +35,10 @@ MERGE_SUMMARIES_PROMPT = """Bạn là chuyên gia tóm tắt cuộc họp. Nhi
 **Định dạng đầu ra:**
 Cung cấp bản tóm tắt toàn diện nắm bắt tất cả các điểm chính của toàn bộ cuộc họp. Cấu trúc theo cách dễ hiểu kết quả cuộc họp và các bước tiếp theo."""
 
-# Prompt trích xuất ghi chú quan trọng
-KEY_NOTES_PROMPT = """Bạn là chuyên gia trích xuất thông tin có cấu trúc từ bản tóm tắt cuộc họp. Nhiệm vụ của bạn là xác định và phân loại các ghi chú quan trọng từ bản tóm tắt sau đây.
+# Prompt trích xuất ghi chú quan trọng và công việc trong một lần gọi
+EXTRACT_INSIGHTS_PROMPT = """Bạn là chuyên gia phân tích cuộc họp và quản lý dự án. Nhiệm vụ của bạn là trích xuất các ghi chú quan trọng và các công việc cần làm từ bản tóm tắt cuộc họp sau đây.
 
-**Hướng dẫn:**
+**Hướng dẫn cho ghi chú quan trọng ("key_notes"):**
 1. Trích xuất các điểm quan trọng, quyết định và insights
 2. Phân loại mỗi ghi chú một cách phù hợp:
    - "Quyết định": Các quyết định cuối cùng được đưa ra trong cuộc họp
@@ -44,63 +47,71 @@ KEY_NOTES_PROMPT = """Bạn là chuyên gia trích xuất thông tin có cấu t
    - "Rủi ro": Các rủi ro tiềm ẩn hoặc mối quan tâm được đề cập
    - "Câu hỏi": Các câu hỏi chưa được giải quyết hoặc chủ đề cần theo dõi
 3. Cụ thể và có thể hành động trong các ghi chú của bạn
-4. Ưu tiên sự rõ ràng và hữu ích
-
-**Bản tóm tắt cuộc họp:**
-{text}
-
-**Định dạng đầu ra:**
-Trả về một mảng JSON các ghi chú quan trọng. Mỗi ghi chú phải có trường "category" và "note".
-
-Ví dụ:
-[
-  {{"category": "Quyết định", "note": "Phê duyệt tăng ngân sách 15% cho chiến dịch marketing Q2"}},
-  {{"category": "Công việc", "note": "Anh John chuẩn bị báo cáo quý trước thứ Sáu"}},
-  {{"category": "Điểm quan trọng", "note": "Điểm hài lòng của khách hàng tăng 12% quý này"}},
-  {{"category": "Rủi ro", "note": "Có thể bị chậm trễ chuỗi cung ứng do hạn chế vận chuyển"}},
-  {{"category": "Câu hỏi", "note": "Cần làm rõ timeline cho việc ra mắt sản phẩm mới"}}
-]
 
-Chỉ trả về mảng JSON, không có văn bản bổ sung."""
-
-# Prompt tạo công việc
-GENERATE_TASKS_PROMPT = """Bạn là chuyên gia quản lý dự án. Nhiệm vụ của bạn là trích xuất các công việc có thể thực hiện từ bản tóm tắt cuộc họp sau đây và cấu trúc chúng thành các mục công việc.
-
-**Hướng dẫn:**
+**Hướng dẫn cho công việc ("tasks"):**
 1. Xác định tất cả các action items và tasks được đề cập trong bản tóm tắt
 2. Làm cho mỗi task cụ thể, có thể đo lường và có thể thực hiện
 3. Trích xuất thông tin người được giao nếu được đề cập (dùng null nếu không có)
 4. Suy luận ngày đến hạn hợp lý nếu được đề cập (dùng null nếu không có)
 5. Cung cấp mô tả task rõ ràng bao gồm ngữ cảnh
-6. Ưu tiên các tasks có người chịu trách nhiệm rõ ràng hoặc deadline
 
 **Bản tóm tắt cuộc họp:**
 {text}
 
 **Định dạng đầu ra:**
-Trả về một mảng JSON các tasks. Mỗi task phải có:
-- "title": Tiêu đề task rõ ràng, ngắn gọn (hướng hành động)
-- "description": Mô tả chi tiết với ngữ cảnh từ cuộc họp
-- "assignee": Người chịu trách nhiệm (null nếu không được đề cập)
-- "due_date": Ngày đến hạn theo định dạng YYYY-MM-DD (null nếu không được đề cập)
-- "priority": "cao", "trung bình", hoặc "thấp" dựa trên mức độ khẩn cấp được đề cập
+Trả về một đối tượng JSON với hai trường:
+- "key_notes": mảng các ghi chú, mỗi ghi chú có "category" và "note"
+- "tasks": mảng các task, mỗi task có:
+  - "title": Tiêu đề task rõ ràng, ngắn gọn (hướng hành động)
+  - "description": Mô tả chi tiết với ngữ cảnh từ cuộc họp
+  - "assignee": Người chịu trách nhiệm (null nếu không được đề cập)
+  - "due_date": Ngày đến hạn theo định dạng YYYY-MM-DD (null nếu không được đề cập)
+  - "priority": "cao", "trung bình", hoặc "thấp" dựa trên mức độ khẩn cấp được đề cập
 
 Ví dụ:
-[
-  {{
-    "title": "Chuẩn bị báo cáo ngân sách Marketing Q2",
-    "description": "Tạo báo cáo ngân sách chi tiết bao gồm phân tích ROI và đề xuất phân bổ chi tiêu marketing Q2",
-    "assignee": "Nguyễn Văn A",
-    "due_date": "2024-01-15",
-    "priority": "cao"
-  }},
-  {{
-    "title": "Lên lịch họp follow-up với team Design",
-    "description": "Phối hợp với team design để review mockup sản phẩm mới và thu thập feedback",
-    "assignee": null,
-    "due_date": null,
-    "priority": "trung bình"
-  }}
-]
-
-Chỉ trả về mảng JSON, không có văn bản bổ sung."""
+{{
+  "key_notes": [
+    {{"category": "Quyết định", "note": "Phê duyệt tăng ngân sách 15% cho chiến dịch marketing Q2"}},
+    {{"category": "Rủi ro", "note": "Có thể bị chậm trễ chuỗi cung ứng do hạn chế vận chuyển"}}
+  ],
+  "tasks": [
+    {{
+      "title": "Chuẩn bị báo cáo ngân sách Marketing Q2",
+      "description": "Tạo báo cáo ngân sách chi tiết bao gồm phân tích ROI và đề xuất phân bổ chi tiêu marketing Q2",
+      "assignee": "Nguyễn Văn A",
+      "due_date": "2024-01-15",
+      "priority": "cao"
+    }}
+  ]
+}}
+
+Chỉ trả về đối tượng JSON, không có văn bản bổ sung."""
+
+# Prompt sửa JSON không hợp lệ
+REPAIR_JSON_PROMPT = """Phản hồi JSON dưới đây không hợp lệ theo schema yêu cầu.
+
+**Lỗi:**
+{error}
+
+**JSON Schema:**
+{schema}
+
+**Phản hồi cần sửa:**
+{response}
+
+Hãy sửa phản hồi để khớp chính xác với schema, giữ nguyên nội dung. Chỉ trả về JSON đã sửa, không có văn bản bổ sung."""
+
+# Prompt trả lời câu hỏi về cuộc họp
+QA_PROMPT = """Bạn là trợ lý trả lời câu hỏi về một cuộc họp. Chỉ sử dụng các trích đoạn transcript dưới đây để trả lời.
+
+**Hướng dẫn:**
+1. Trả lời ngắn gọn, chính xác, bằng ngôn ngữ của câu hỏi
+2. Chỉ dựa vào thông tin có trong các trích đoạn, không suy đoán
+3. Khi trích dẫn, ghi kèm mốc thời gian [mm:ss] của trích đoạn tương ứng
+4. Nếu các trích đoạn không chứa câu trả lời, hãy nói rõ là cuộc họp không đề cập đến nội dung này
+
+**Các trích đoạn cuộc họp:**
+{context}
+
+**Câu hỏi:**
+{question}"""
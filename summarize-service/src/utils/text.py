@@ -1,13 +1,124 @@
 """Text processing utilities."""
 
+import math
+import re
+from collections.abc import Callable, Iterable
+
+# Sentence ends: terminal punctuation (with closing quotes/brackets) before
+# whitespace, or a line break
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?…])\s+|(?<=[.!?…][\"')\]])\s+|\n+")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences, dropping blank ones."""
+    return [
+        sentence for part in _SENTENCE_END_RE.split(text) if (sentence := part.strip())
+    ]
+
+
+def format_timestamp(seconds: float) -> str:
+    """Format seconds as [hh:]mm:ss."""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def timestamped_lines(segments: Iterable[tuple[float, str]]) -> list[str]:
+    """Render (start, text) segments as "[mm:ss] text" lines, skipping blanks."""
+    return [
+        f"[{format_timestamp(start)}] {text}"
+        for start, raw in segments
+        if (text := raw.strip())
+    ]
+
 
 class TextChunker:
-    """Text chunker."""
+    """Token-aware chunker packing whole sentences or segments.
+
+    Sizes are measured with count_tokens (the model's tokenizer), and every
+    unit is counted once, so chunking is linear in the transcript length.
+    """
+
+    def __init__(self, count_tokens: Callable[[str], int]):
+        self.count_tokens = count_tokens
 
-    def should_chunk(self, text: str, max_size: int) -> bool:
+    def should_chunk(self, text: str, max_tokens: int) -> bool:
         """Check if text needs chunking."""
-        return len(text) > max_size
+        return self.count_tokens(text) > max_tokens
+
+    def chunk(
+        self, units: list[str], max_tokens: int, overlap_tokens: int = 0
+    ) -> list[str]:
+        """Pack consecutive units into chunks of at most max_tokens.
+
+        Each chunk after the first repeats the trailing units of the previous
+        one, up to overlap_tokens, so context is not lost at the cut. The
+        newlines joining units count towards the limit, and a unit longer
+        than max_tokens is split on words (or within a word).
+        """
+        pieces: list[tuple[str, int]] = []
+        for unit in units:
+            tokens = self.count_tokens(unit)
+            if tokens > max_tokens:
+                pieces.extend(self._split_unit(unit, tokens, max_tokens))
+            else:
+                pieces.append((unit, tokens))
+
+        separator = self.count_tokens("\n")  # Pieces are joined by newlines
+        chunks: list[str] = []
+        start = 0  # First piece of the current chunk
+        used = 0  # Tokens of the current chunk, joiners included
+        fresh = 0  # Pieces not already sent in the previous chunk
+
+        for end, (_, tokens) in enumerate(pieces):
+            cost = tokens + separator if end > start else tokens
+            if fresh and used + cost > max_tokens:
+                chunks.append("\n".join(text for text, _ in pieces[start:end]))
+
+                # Carry trailing pieces back while they fit the overlap
+                start, used = end, 0
+                while (
+                    start > 0
+                    and end - start < fresh
+                    and used + pieces[start - 1][1] + separator <= overlap_tokens
+                    and used + pieces[start - 1][1] + separator + tokens <= max_tokens
+                ):
+                    start -= 1
+                    used += pieces[start][1] + separator
+                fresh = 0
+                cost = tokens
+
+            used += cost
+            fresh += 1
+
+        if fresh:
+            chunks.append("\n".join(text for text, _ in pieces[start:]))
+        return chunks
+
+    def _split_unit(
+        self, unit: str, tokens: int, max_tokens: int
+    ) -> list[tuple[str, int]]:
+        """Split an oversized unit into pieces of at most max_tokens.
+
+        The unit is cut into word runs of roughly max_tokens; a run still
+        over the limit is split again, within the word if it is a single one.
+        """
+        words = unit.split()
+        if len(words) > 1:
+            parts = min(len(words), math.ceil(tokens / max_tokens) + 1)
+            size = math.ceil(len(words) / parts)
+            runs = [" ".join(words[i : i + size]) for i in range(0, len(words), size)]
+        else:
+            middle = len(unit) // 2
+            runs = [unit[:middle], unit[middle:]]
 
-    def chunk(self, text: str, max_size: int) -> list[str]:
-        """Split text into chunks."""
-        return [text[i : i + max_size] for i in range(0, len(text), max_size)]
+        pieces = []
+        for run in runs:
+            run_tokens = self.count_tokens(run)
+            if run_tokens > max_tokens and len(run) > 1:
+                pieces.extend(self._split_unit(run, run_tokens, max_tokens))
+            else:
+                pieces.append((run, run_tokens))
+        return pieces
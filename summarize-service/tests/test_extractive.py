@@ -0,0 +1,32 @@
+from src.utils.extractive import select_salient
+
+UNITS = [
+    "We agreed to ship the billing release on Friday.",
+    "Uh huh.",
+    "The billing release needs the new invoice export.",
+    "The billing release needs the new invoice export.",
+    "Nam will finish the invoice export before Friday.",
+    "Ok.",
+    "Lan will test the billing release and the invoice export.",
+    "Someone mentioned the weather is nice today.",
+]
+
+
+def test_short_or_unfiltered_transcripts_are_unchanged() -> None:
+    assert select_salient(UNITS, keep_ratio=1.0, min_units=0) is UNITS
+    assert select_salient(UNITS, keep_ratio=0.5, min_units=100) is UNITS
+
+
+def test_keeps_central_units_in_order_within_budget() -> None:
+    kept = select_salient(UNITS, keep_ratio=0.6, min_units=0)
+
+    assert kept == sorted(kept, key=UNITS.index)
+    assert sum(map(len, kept)) <= 0.6 * sum(map(len, UNITS)) + max(map(len, UNITS))
+    assert "Uh huh." not in kept
+    assert "Someone mentioned the weather is nice today." not in kept
+
+
+def test_near_duplicates_are_dropped() -> None:
+    kept = select_salient(UNITS, keep_ratio=0.99, min_units=0)
+
+    assert kept.count("The billing release needs the new invoice export.") == 1
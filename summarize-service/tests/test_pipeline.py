@@ -0,0 +1,121 @@
+from uuid import uuid4
+
+import pytest
+
+from src.cache import (
+    checkpoints as checkpoints_module,
+    pipeline as pipeline_module,
+)
+from src.cache.checkpoints import SummaryCheckpoints
+from src.cache.pipeline import LOCK_TIMEOUT_SECONDS, TranscriptPipeline
+from src.providers.routing import route_model
+from src.services.pipeline import advance_pipeline
+from src.utils.enums import LLMStage
+
+
+class FakeLLM:
+    def __init__(self, on_generate=None, cache_enabled=True):
+        self.on_generate = on_generate
+        self.cache_enabled = cache_enabled
+        self.prompts: list[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        return len(text.split())
+
+    def generate(self, prompt: str, **_kwargs) -> str:
+        self.prompts.append(prompt)
+        if self.on_generate is not None:
+            self.on_generate()
+        return "summary"
+
+
+@pytest.fixture
+def checkpoints(monkeypatch, redis) -> SummaryCheckpoints:
+    monkeypatch.setattr(checkpoints_module, "get_redis", lambda: redis)
+    return SummaryCheckpoints(uuid4())
+
+
+@pytest.fixture
+def pipeline(monkeypatch, redis) -> TranscriptPipeline:
+    monkeypatch.setattr(pipeline_module, "get_redis", lambda: redis)
+    pipeline = TranscriptPipeline(uuid4())
+    for chunk_id in range(3):
+        pipeline.add_chunk(chunk_id, [f"line {chunk_id} {i}" for i in range(4)])
+    return pipeline
+
+
+def test_advance_summarizes_ready_chunks_and_releases(pipeline, redis) -> None:
+    llm = FakeLLM()
+
+    advance_pipeline(pipeline, total_chunks=4, llm_client=llm, max_chunk_tokens=9)
+
+    # 12 lines of 3 words make 4 chunks; the last one may still grow
+    assert len(llm.prompts) == 3
+    assert pipeline.summarized() == 3
+    assert not redis.exists(pipeline._lock_key)
+
+
+def test_lock_is_renewed_as_chunks_finish(pipeline, redis) -> None:
+    def shorten_lease() -> None:
+        redis.pexpire(pipeline._lock_key, 1000)
+
+    advance_pipeline(
+        pipeline,
+        total_chunks=4,
+        llm_client=FakeLLM(on_generate=shorten_lease),
+        max_chunk_tokens=9,
+    )
+
+    assert pipeline.summarized() == 3
+
+
+def test_extend_lock_resets_the_lease(pipeline, redis) -> None:
+    lock = pipeline.lock()
+    assert lock.acquire()
+    redis.pexpire(pipeline._lock_key, 1000)
+
+    pipeline.extend_lock(lock)
+
+    assert redis.ttl(pipeline._lock_key) > LOCK_TIMEOUT_SECONDS - 5
+
+
+def test_lost_lock_stops_the_holder(pipeline, redis, caplog) -> None:
+    def steal_lock() -> None:
+        redis.set(pipeline._lock_key, "other-worker")
+
+    llm = FakeLLM(on_generate=steal_lock)
+
+    advance_pipeline(pipeline, total_chunks=4, llm_client=llm, max_chunk_tokens=9)
+
+    # Calls already running finish, the rest are dropped
+    assert len(llm.prompts) < 3
+    assert pipeline.summarized() == 0
+    assert redis.get(pipeline._lock_key) == "other-worker"
+    assert "expired while held" in caplog.text
+
+
+def test_chunk_summaries_are_checkpointed(pipeline, checkpoints) -> None:
+    llm = FakeLLM(cache_enabled=False)
+
+    advance_pipeline(
+        pipeline,
+        total_chunks=4,
+        llm_client=llm,
+        max_chunk_tokens=9,
+        checkpoints=checkpoints,
+    )
+
+    saved = checkpoints.load(route_model(LLMStage.CHUNK), llm.prompts)
+    assert len(saved) == 3
+    assert saved == ["summary"] * 3
+
+
+def test_nothing_is_summarized_early_without_cache_or_checkpoints(
+    pipeline,
+) -> None:
+    llm = FakeLLM(cache_enabled=False)
+
+    advance_pipeline(pipeline, total_chunks=4, llm_client=llm, max_chunk_tokens=9)
+
+    assert llm.prompts == []
+    assert pipeline.summarized() == 0
@@ -0,0 +1,97 @@
+import pytest
+
+from src.config import ModelRateLimit, settings
+from src.providers import rate_limit
+from src.providers.rate_limit import (
+    BUCKET_TTL_MS,
+    SERVED_TTL_MS,
+    RateLimiter,
+    fair_share,
+    rate_limit_state,
+)
+
+LIMIT = ModelRateLimit(requests_per_minute=60, tokens_per_minute=6000)
+
+
+@pytest.fixture
+def limiter(monkeypatch, redis) -> RateLimiter:
+    monkeypatch.setattr(rate_limit, "get_redis", lambda: redis)
+    monkeypatch.setattr(settings, "llm_rate_limits", {"test-model": LIMIT})
+    return RateLimiter("test-model", LIMIT)
+
+
+def test_acquire_takes_from_both_buckets(limiter) -> None:
+    with fair_share("meeting-1"):
+        limiter.acquire(1000)
+
+    state = rate_limit_state("test-model")
+    assert state["requests_available"] == pytest.approx(59, abs=0.1)
+    assert state["tokens_available"] == pytest.approx(5000, abs=10)
+    assert state["granted"] == 1
+
+
+def test_refund_returns_unused_tokens(limiter) -> None:
+    limiter.acquire(6000)
+    limiter.refund(2500)
+
+    assert rate_limit_state("test-model")["tokens_available"] == pytest.approx(
+        2500, abs=10
+    )
+
+
+def test_refund_is_capped_at_capacity(limiter) -> None:
+    limiter.acquire(100)
+    limiter.refund(5000)
+
+    assert rate_limit_state("test-model")["tokens_available"] == 6000
+
+
+def test_refund_refreshes_the_bucket_ttl(limiter, redis) -> None:
+    limiter.acquire(100)
+    redis.pexpire("llm:ratelimit:test-model", 10)
+
+    limiter.refund(50)
+
+    assert redis.pttl("llm:ratelimit:test-model") > BUCKET_TTL_MS - 1000
+
+
+def test_refund_to_an_expired_bucket_is_dropped(limiter, redis) -> None:
+    limiter.refund(50)
+
+    assert not redis.exists("llm:ratelimit:test-model")
+
+
+def test_acquire_waits_for_the_bucket_to_refill(limiter, monkeypatch) -> None:
+    limiter.acquire(6000)
+    sleeps: list[float] = []
+
+    # Refund while the limiter sleeps, so its next poll is granted
+    def sleep(delay: float) -> None:
+        sleeps.append(delay)
+        limiter.refund(6000)
+
+    monkeypatch.setattr(rate_limit.time, "sleep", sleep)
+    limiter.acquire(3000)
+
+    assert sleeps == [rate_limit.MAX_POLL_SECONDS]
+    assert rate_limit_state("test-model")["throttled"] == 1
+
+
+@pytest.mark.usefixtures("limiter")
+def test_missing_bucket_is_reported_full() -> None:
+    state = rate_limit_state("test-model")
+
+    assert state["requests_available"] == 60
+    assert state["tokens_available"] == 6000
+    assert rate_limit_state("unlimited-model")["tokens_available"] == float("inf")
+
+
+def test_callers_not_served_lately_are_forgotten(limiter, redis) -> None:
+    served = "llm:ratelimit:test-model:served"
+    now_ms = int(redis.time()[0]) * 1000
+    redis.zadd(served, {"old-meeting": now_ms - SERVED_TTL_MS - 1000})
+
+    with fair_share("meeting-1"):
+        limiter.acquire(10)
+
+    assert redis.zrange(served, 0, -1) == ["meeting-1"]
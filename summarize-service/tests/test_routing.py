@@ -0,0 +1,33 @@
+import pytest
+
+from src.config import settings
+from src.providers.routing import route_model
+from src.utils.enums import LLMStage
+
+
+@pytest.fixture(autouse=True)
+def stage_models(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "llm_model", "best-model")
+    monkeypatch.setattr(
+        settings, "llm_stage_models", {"chunk": "fast-model", "merge": "mid-model"}
+    )
+    monkeypatch.setattr(settings, "llm_short_transcript_tokens", 1000)
+
+
+def test_stages_use_their_model() -> None:
+    assert route_model(LLMStage.CHUNK) == "fast-model"
+    assert route_model(LLMStage.MERGE) == "mid-model"
+
+
+def test_unlisted_stages_use_the_default_model() -> None:
+    assert route_model(LLMStage.FINAL) == "best-model"
+
+
+def test_short_transcripts_merge_with_the_chunk_model() -> None:
+    assert route_model(LLMStage.MERGE, 999) == "fast-model"
+    assert route_model(LLMStage.FINAL, 999) == "fast-model"
+
+
+def test_long_transcripts_keep_the_stage_model() -> None:
+    assert route_model(LLMStage.MERGE, 1000) == "mid-model"
+    assert route_model(LLMStage.FINAL, 1000) == "best-model"
@@ -0,0 +1,145 @@
+from uuid import uuid4
+
+import pytest
+
+from src.cache import checkpoints as checkpoints_module
+from src.cache.checkpoints import SummaryCheckpoints
+from src.config import settings
+from src.services.summarization import batch_by_tokens, summarize_transcript
+from src.utils.exceptions import GenerationError, MergeBudgetError
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+class FakeLLM:
+    """Counts words as tokens and answers each prompt with a short summary."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.prompts: list[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        return _words(text)
+
+    def generate(self, prompt: str, **_kwargs) -> str:
+        self.prompts.append(prompt)
+        if self.fail_on is not None and self.fail_on in prompt:
+            raise RuntimeError("provider down")
+        return f"summary {len(self.prompts)}"
+
+
+@pytest.fixture
+def checkpoints(monkeypatch, redis) -> SummaryCheckpoints:
+    monkeypatch.setattr(checkpoints_module, "get_redis", lambda: redis)
+    return SummaryCheckpoints(uuid4())
+
+
+def _transcript(sentences: int) -> str:
+    return " ".join(f"Sentence {i} has words." for i in range(sentences))
+
+
+def test_batches_never_exceed_the_budget() -> None:
+    texts = ["a b c", "d e", "f g h i", "j", "k l m n o"]
+
+    batches = batch_by_tokens(texts, _words, budget=5)
+
+    assert [text for batch in batches for text in batch] == texts
+    assert all(sum(map(_words, batch)) <= 5 for batch in batches)
+
+
+def test_text_fitting_no_neighbour_is_a_batch_of_its_own() -> None:
+    batches = batch_by_tokens(["a b c", "d e f g", "h i"], _words, budget=5)
+
+    assert batches == [["a b c"], ["d e f g"], ["h i"]]
+
+
+def test_lone_summary_moves_up_unchanged() -> None:
+    llm = FakeLLM()
+
+    summary = summarize_transcript(
+        _transcript(12), max_chunk_tokens=16, llm_client=llm, merge_budget_tokens=5
+    )
+
+    # Three chunks; the third fits no batch on level 1 and joins level 2
+    assert len(llm.prompts) == 5
+    assert "summary 1\n\nsummary 2" in llm.prompts[3]
+    assert "summary 4\n\nsummary 3" in llm.prompts[4]
+    assert summary == "summary 5"
+
+
+def test_merge_fails_when_no_two_summaries_fit(monkeypatch) -> None:
+    llm = FakeLLM()
+    monkeypatch.setattr(llm, "generate", lambda *_a, **_k: "long " * 10)
+
+    with pytest.raises(MergeBudgetError):
+        summarize_transcript(
+            _transcript(12), max_chunk_tokens=16, llm_client=llm, merge_budget_tokens=12
+        )
+
+
+def test_retry_only_repeats_failed_calls(checkpoints) -> None:
+    transcript = _transcript(12)
+    failing = FakeLLM(fail_on="Sentence 11 ")
+
+    with pytest.raises(GenerationError) as excinfo:
+        summarize_transcript(
+            transcript, max_chunk_tokens=16, llm_client=failing, checkpoints=checkpoints
+        )
+    assert excinfo.value.stage == "chunk"
+    assert len(excinfo.value.errors) == 1
+
+    retry = FakeLLM()
+    summarize_transcript(
+        transcript, max_chunk_tokens=16, llm_client=retry, checkpoints=checkpoints
+    )
+
+    chunk_prompts = [p for p in retry.prompts if "Sentence" in p]
+    assert len(chunk_prompts) == 1
+    assert "Sentence 11 " in chunk_prompts[0]
+
+
+def test_finished_run_is_fully_resumed(checkpoints) -> None:
+    transcript = _transcript(12)
+    first = FakeLLM()
+    summary = summarize_transcript(
+        transcript,
+        max_chunk_tokens=16,
+        llm_client=first,
+        merge_budget_tokens=20,
+        checkpoints=checkpoints,
+    )
+
+    again = FakeLLM()
+    resumed = summarize_transcript(
+        transcript,
+        max_chunk_tokens=16,
+        llm_client=again,
+        merge_budget_tokens=20,
+        checkpoints=checkpoints,
+    )
+
+    assert resumed == summary
+    assert again.prompts == []
+
+
+def test_checkpoints_of_another_model_are_not_reused(checkpoints, monkeypatch) -> None:
+    transcript = _transcript(12)
+    summarize_transcript(
+        transcript, max_chunk_tokens=16, llm_client=FakeLLM(), checkpoints=checkpoints
+    )
+
+    monkeypatch.setattr(settings, "llm_stage_models", {"chunk": "fast-model"})
+    rerouted = FakeLLM()
+    summarize_transcript(
+        transcript,
+        max_chunk_tokens=16,
+        llm_client=rerouted,
+        checkpoints=checkpoints,
+    )
+
+    # Chunks are redone with the new chunk model; the final merge is not, as
+    # its model and prompt are unchanged
+    assert len(rerouted.prompts) == 3
+    assert all("Sentence" in p for p in rerouted.prompts)
@@ -0,0 +1,62 @@
+import math
+
+from src.utils.text import TextChunker, split_sentences, timestamped_lines
+
+
+def _words_and_newlines(text: str) -> int:
+    return len(text.split()) + text.count("\n")
+
+
+def _chars(text: str) -> int:
+    return math.ceil(len(text) / 4)
+
+
+def test_split_sentences_drops_blanks() -> None:
+    assert split_sentences("One. Two?\n\n  Three!") == ["One.", "Two?", "Three!"]
+
+
+def test_timestamped_lines_skip_blank_segments() -> None:
+    lines = timestamped_lines([(5, " hi "), (65, " "), (3725, "bye")])
+
+    assert lines == ["[00:05] hi", "[1:02:05] bye"]
+
+
+def test_chunks_count_the_joining_newlines() -> None:
+    chunker = TextChunker(_words_and_newlines)
+    units = ["a b", "c d", "e f", "g h", "i j"]
+
+    chunks = chunker.chunk(units, max_tokens=6)
+
+    # Three units are 6 words but 8 tokens with the newlines
+    assert chunks == ["a b\nc d", "e f\ng h", "i j"]
+    assert all(_words_and_newlines(chunk) <= 6 for chunk in chunks)
+
+
+def test_overlap_repeats_trailing_units_within_the_limit() -> None:
+    chunker = TextChunker(_words_and_newlines)
+    units = ["a", "b", "c", "d", "e", "f"]
+
+    chunks = chunker.chunk(units, max_tokens=5, overlap_tokens=2)
+
+    assert chunks == ["a\nb\nc", "c\nd\ne", "e\nf"]
+    assert all(_words_and_newlines(chunk) <= 5 for chunk in chunks)
+
+
+def test_oversized_unit_is_split_on_words() -> None:
+    chunker = TextChunker(_words_and_newlines)
+    unit = " ".join(f"w{i}" for i in range(23))
+
+    chunks = chunker.chunk(["x", unit, "y"], max_tokens=5)
+
+    assert all(_words_and_newlines(chunk) <= 5 for chunk in chunks)
+    assert " ".join(" ".join(chunks).split()) == f"x {unit} y"
+
+
+def test_oversized_word_is_split_within_the_word() -> None:
+    chunker = TextChunker(_chars)
+    word = "x" * 100
+
+    chunks = chunker.chunk([word], max_tokens=8)
+
+    assert all(_chars(chunk) <= 8 for chunk in chunks)
+    assert "".join(chunk.replace("\n", "") for chunk in chunks) == word
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+import pytest
+
+from src.providers.usage import UsageLedger, current_ledger, track_usage
+from src.utils.enums import LLMStage
+
+
+def test_calls_are_totalled_per_stage_and_model() -> None:
+    ledger = UsageLedger()
+    ledger.record(LLMStage.CHUNK, "fast", prompt_tokens=100, cost=0.01)
+    ledger.record(LLMStage.CHUNK, "fast", cached=True)
+    ledger.record(LLMStage.FINAL, "best", completion_tokens=50, cost=0.1)
+
+    assert ledger.total_cost == pytest.approx(0.11)
+    assert ledger.summary() == (
+        "chunk/fast: 2 calls (1 cached), 100+0 tokens, 0.0s, $0.0100; "
+        "final/best: 1 calls (0 cached), 0+50 tokens, 0.0s, $0.1000; "
+        "total $0.1100"
+    )
+
+
+def test_empty_ledger_summary() -> None:
+    assert UsageLedger().summary() == "no LLM calls"
+
+
+def test_recording_from_threads_is_not_lost() -> None:
+    ledger = UsageLedger()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(1000):
+            executor.submit(ledger.record, LLMStage.CHUNK, "fast", cost=0.001)
+
+    assert ledger.summary().startswith("chunk/fast: 1000 calls")
+
+
+def test_ledger_follows_copied_contexts() -> None:
+    assert current_ledger() is None
+
+    with track_usage() as ledger, ThreadPoolExecutor() as executor:
+        seen = executor.submit(copy_context().run, current_ledger).result()
+
+    assert seen is ledger
+    assert current_ledger() is None
@@ -7,6 +7,7 @@ from .chunks import (
     get_chunk,
     save_chunk,
 )
+from .events import publish_status
 from .redis import get_redis, ping_redis
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     "get_chunk",
     "get_redis",
     "ping_redis",
+    "publish_status",
     "save_chunk",
 ]
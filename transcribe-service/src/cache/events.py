@@ -0,0 +1,30 @@
+"""Meeting status snapshots and events published to Redis.
+
+Shared with the summarize service through cmdn_common.status_events; this
+module binds the transcribe counters and the worker's Redis client.
+"""
+
+from uuid import UUID
+
+from cmdn_common.status_events import publish_status as _publish_status
+
+from src.enums import MeetingStatus
+
+from .redis import get_redis
+
+
+def publish_status(
+    meeting_id: UUID,
+    status: MeetingStatus,
+    *,
+    transcribe_done: int | None = None,
+    transcribe_total: int | None = None,
+) -> None:
+    """Update status snapshot and publish the merged snapshot as an event."""
+    _publish_status(
+        get_redis(),
+        meeting_id,
+        status.value,
+        transcribe_done=transcribe_done,
+        transcribe_total=transcribe_total,
+    )
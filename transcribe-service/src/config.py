@@ -56,6 +56,9 @@ class Settings(BaseSettings):
     litellm_model: str = "whisper-1"
     litellm_api_base: str | None = None
 
+    # Send each transcribed chunk to the summarizer as soon as it is done
+    summarize_pipeline_enabled: bool = True
+
     # Celery
     celery_autoscale: str = "10,1"
     celery_prefetch_multiplier: int = Field(default=1, ge=1)
@@ -5,14 +5,24 @@ and repository functions for interacting with the meetings table.
 """
 
 from .connection import Base, SessionLocal, engine, get_session, init_db
-from .orm_models import MeetingModel
-from .repository import get_meeting, list_meetings, save_meeting, to_domain, to_model
+from .orm_models import MeetingEmbeddingModel, MeetingModel, MeetingSegmentModel
+from .repository import (
+    get_meeting,
+    list_meetings,
+    save_meeting,
+    save_meeting_index,
+    save_segments,
+    to_domain,
+    to_model,
+)
 
 __all__ = [
     # Connection
     "Base",
     # ORM Models
+    "MeetingEmbeddingModel",
     "MeetingModel",
+    "MeetingSegmentModel",
     "SessionLocal",
     "engine",
     # Repository functions
@@ -21,6 +31,8 @@ __all__ = [
     "init_db",
     "list_meetings",
     "save_meeting",
+    "save_meeting_index",
+    "save_segments",
     "to_domain",
     "to_model",
 ]
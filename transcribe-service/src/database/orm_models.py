@@ -3,8 +3,19 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Enum, Float, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, UUID
 
 from .connection import Base
 
@@ -36,7 +47,6 @@ class MeetingModel(Base):
     )
     transcribe_text = Column(Text, nullable=True)
     summarize = Column(Text, nullable=True)
-    transcribe_segments = Column(JSON, nullable=True)
     key_notes = Column(JSON, nullable=True)
     created_at = Column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
@@ -52,3 +62,39 @@ class MeetingModel(Base):
         return (
             f"<MeetingModel(id={self.id}, title={self.title!r}, status={self.status})>"
         )
+
+
+class MeetingSegmentModel(Base):
+    """Transcript segment ORM model mapping to 'meeting_segments' table."""
+
+    __tablename__ = "meeting_segments"
+
+    meeting_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq = Column(Integer, primary_key=True)
+    start = Column(Float, nullable=False, comment="Start time in seconds")
+    end = Column(Float, nullable=False, comment="End time in seconds")
+    text = Column(Text, nullable=False)
+
+
+class MeetingEmbeddingModel(Base):
+    """Semantic index ORM model mapping to 'meeting_embeddings' table."""
+
+    __tablename__ = "meeting_embeddings"
+
+    meeting_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version = Column(SmallInteger, nullable=False)
+    dimensions = Column(Integer, nullable=False)
+    centroid = Column(LargeBinary, nullable=False, comment="float32 vector")
+    vectors = Column(LargeBinary, nullable=False, comment="float16 window matrix")
+    starts = Column(ARRAY(Float), nullable=False)
+    ends = Column(ARRAY(Float), nullable=False)
+    seq_from = Column(ARRAY(Integer), nullable=False)
+    seq_to = Column(ARRAY(Integer), nullable=False)
@@ -2,13 +2,15 @@
 
 from uuid import UUID
 
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from src.enums import MeetingStatus
 from src.exceptions import MeetingNotFoundError
-from src.models import Meeting
+from src.models import Meeting, Segment
 
-from .orm_models import MeetingModel
+from .orm_models import MeetingEmbeddingModel, MeetingModel, MeetingSegmentModel
 
 
 def to_domain(model: MeetingModel) -> Meeting:
@@ -67,6 +69,58 @@ def save_meeting(session: Session, meeting: Meeting) -> None:
     session.flush()
 
 
+def save_segments(session: Session, meeting_id: UUID, segments: list[Segment]) -> None:
+    """Replace the transcript segments of a meeting (does not commit)."""
+    session.execute(
+        delete(MeetingSegmentModel).where(MeetingSegmentModel.meeting_id == meeting_id)
+    )
+    if segments:
+        session.execute(
+            insert(MeetingSegmentModel),
+            [
+                {
+                    "meeting_id": meeting_id,
+                    "seq": seq,
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text,
+                }
+                for seq, segment in enumerate(segments)
+            ],
+        )
+
+
+def save_meeting_index(
+    session: Session,
+    meeting_id: UUID,
+    *,
+    version: int,
+    dimensions: int,
+    centroid: bytes,
+    vectors: bytes,
+    starts: list[float],
+    ends: list[float],
+    seq_from: list[int],
+    seq_to: list[int],
+) -> None:
+    """Insert or replace the semantic index of a meeting (does not commit)."""
+    values = {
+        "version": version,
+        "dimensions": dimensions,
+        "centroid": centroid,
+        "vectors": vectors,
+        "starts": starts,
+        "ends": ends,
+        "seq_from": seq_from,
+        "seq_to": seq_to,
+    }
+    session.execute(
+        pg_insert(MeetingEmbeddingModel)
+        .values(meeting_id=meeting_id, **values)
+        .on_conflict_do_update(index_elements=["meeting_id"], set_=values)
+    )
+
+
 def list_meetings(session: Session, limit: int = 100, offset: int = 0) -> list[Meeting]:
     """List meetings with pagination."""
     models = (
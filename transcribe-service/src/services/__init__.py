@@ -4,9 +4,11 @@ Services are organized by domain:
 - audio: Audio streaming and chunk management
 - transcription: Transcription processing and segment handling
 - meeting: Meeting lifecycle orchestration
+- embedding: Semantic index building
 """
 
 from .audio import cleanup_audio, stream_and_split_audio
+from .embedding import index_meeting
 from .meeting import (
     finalize_transcription,
     get_meeting_status,
@@ -26,6 +28,7 @@ __all__ = [
     "cleanup_audio",
     "finalize_transcription",
     "get_meeting_status",
+    "index_meeting",
     "mark_meeting_failed",
     "merge_segments",
     "segments_to_text",
@@ -0,0 +1,54 @@
+"""Semantic index building services.
+
+Embedding and windowing live in cmdn_common.embedding, shared with the
+summarize worker and the API gateway, which embeds search queries.
+"""
+
+from uuid import UUID
+
+from cmdn_common.embedding import DIMENSIONS, EMBEDDER_VERSION, build_meeting_index
+from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.database.repository import save_meeting_index
+from src.models import Segment
+
+
+def index_meeting(session: Session, meeting_id: UUID, segments: list[Segment]) -> None:
+    """Build and store the semantic index of a meeting (does not commit).
+
+    Indexing is best-effort: a failure is logged and leaves the meeting
+    searchable by keyword only.
+    """
+    try:
+        index = build_meeting_index(segments)
+    except Exception as e:
+        logger.warning(f"Failed to build semantic index for meeting {meeting_id}: {e}")
+        return
+
+    if index is None:
+        logger.info(f"No text to index for meeting {meeting_id}")
+        return
+
+    # A savepoint keeps a failed write from aborting the caller's transaction,
+    # which also holds the transcript
+    try:
+        with session.begin_nested():
+            save_meeting_index(
+                session,
+                meeting_id,
+                version=EMBEDDER_VERSION,
+                dimensions=DIMENSIONS,
+                centroid=index.centroid.tobytes(),
+                vectors=index.vectors.tobytes(),
+                starts=index.starts,
+                ends=index.ends,
+                seq_from=index.seq_from,
+                seq_to=index.seq_to,
+            )
+    except SQLAlchemyError as e:
+        logger.warning(f"Failed to store semantic index for meeting {meeting_id}: {e}")
+        return
+
+    logger.info(f"Indexed meeting {meeting_id}: {index.size} windows")
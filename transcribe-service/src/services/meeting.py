@@ -7,12 +7,14 @@ from loguru import logger
 from sqlalchemy.orm import Session
 
 from src.cache.chunks import delete_chunks, get_all_chunks
-from src.database.repository import get_meeting, save_meeting
+from src.cache.events import publish_status
+from src.database.repository import get_meeting, save_meeting, save_segments
 from src.enums import MeetingStatus
 from src.exceptions import MeetingStatusError
 from src.models import Meeting
 
 from .audio import cleanup_audio, stream_and_split_audio
+from .embedding import index_meeting
 from .transcription import merge_segments, segments_to_text
 
 
@@ -42,11 +44,13 @@ def start_transcription(
     meeting.mark_transcribing()
     save_meeting(session, meeting)
     session.commit()
+    publish_status(meeting_id, meeting.status, transcribe_done=0, transcribe_total=0)
 
     meeting_dir = upload_dir / str(meeting_id)
     meeting_dir.mkdir(parents=True, exist_ok=True)
 
     num_chunks = stream_and_split_audio(audio_url, meeting_dir, chunk_duration_ms)
+    publish_status(meeting_id, meeting.status, transcribe_total=num_chunks)
 
     logger.info(f"Created {num_chunks} chunks for meeting {meeting_id}")
     return meeting, num_chunks
@@ -70,6 +74,7 @@ def finalize_transcription(
         meeting.mark_failed("No chunks found")
         save_meeting(session, meeting)
         session.commit()
+        publish_status(meeting_id, meeting.status)
         return meeting
 
     logger.info(f"Retrieved {len(chunks)} chunks")
@@ -83,6 +88,7 @@ def finalize_transcription(
         meeting.mark_failed(error_msg)
         save_meeting(session, meeting)
         session.commit()
+        publish_status(meeting_id, meeting.status)
         return meeting
 
     all_segments = merge_segments([chunk.segments for chunk in chunks])
@@ -94,7 +100,10 @@ def finalize_transcription(
 
     meeting.mark_transcribed(transcript)
     save_meeting(session, meeting)
+    save_segments(session, meeting_id, all_segments)
+    index_meeting(session, meeting_id, all_segments)
     session.commit()
+    publish_status(meeting_id, meeting.status, transcribe_done=len(chunks))
 
     cleanup_audio(upload_dir / str(meeting_id))
     delete_chunks(meeting_id)
@@ -113,6 +122,7 @@ def mark_meeting_failed(
     meeting.mark_failed(error_message)
     save_meeting(session, meeting)
     session.commit()
+    publish_status(meeting_id, meeting.status)
 
     return meeting
 
@@ -6,8 +6,10 @@ from uuid import UUID
 from loguru import logger
 
 from src.cache.chunks import count_chunks, save_chunk
+from src.cache.events import publish_status
 from src.config import settings
 from src.database.connection import get_session
+from src.enums import MeetingStatus
 from src.exceptions import TranscribeError
 from src.models import ChunkResult
 from src.providers.factory import create_provider
@@ -113,10 +115,35 @@ def process_chunk_task(
         save_chunk(meeting_uuid, chunk_result)
         logger.info(f"Saved chunk {chunk_id} to cache")
 
+        if settings.summarize_pipeline_enabled:
+            # Let summarization start on this chunk before the merge
+            try:
+                app.send_task(
+                    "audio.summarize.chunk",
+                    args=(
+                        meeting_id,
+                        chunk_id,
+                        total_chunks,
+                        [
+                            {"start": s.start, "end": s.end, "text": s.text}
+                            for s in adjusted_segments
+                        ],
+                    ),
+                    queue="audio.summarize",
+                )
+            except Exception as e:
+                logger.warning(f"Failed to dispatch pipelined summary: {e}")
+
         completed_chunks = count_chunks(meeting_uuid)
         logger.info(
             f"Meeting {meeting_id}: {completed_chunks}/{total_chunks} chunks completed"
         )
+        publish_status(
+            meeting_uuid,
+            MeetingStatus.TRANSCRIBING,
+            transcribe_done=completed_chunks,
+            transcribe_total=total_chunks,
+        )
 
         if completed_chunks == total_chunks:
             logger.info(